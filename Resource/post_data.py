@@ -4,7 +4,7 @@ from typing import List, Tuple, Iterable
 
 from pcfg_lib.training.detectors.korean_detection import segment_word  # noqa: F401 (implicit import for workers)
 from pcfg_lib.training.pcfg.pcfg_parser import PCFGParser
-from pcfg_lib.training.pcfg.word_trie import WordTrie
+from pcfg_lib.training.pcfg.word_counter import WordCounter
 
 EMAIL_DOMAINS_SKIP = ("naver.com", "hanmail.com")
 BATCH_SIZE = 1000
@@ -14,7 +14,7 @@ _parser: PCFGParser | None = None
 
 def _init_worker() -> None:
     global _parser
-    _parser = PCFGParser(WordTrie(needed_appear=5))
+    _parser = PCFGParser(WordCounter(needed_appear=5))
 
 
 def _keep(email: str, pwd: str) -> bool:
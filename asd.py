@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 """
-Script to auto-generate __init__.py files that import all submodules and functions.
+Script to auto-generate lazy __init__.py files for every package.
+Each generated __init__ maps the public names of its submodules to the submodule that
+defines them and imports that submodule only on first attribute access (PEP 562), so
+`import pcfg_lib` or `import pcfg_lib.guess.crack` no longer pulls in the training stack.
 Usage: python generate_init_imports.py path/to/pcfg_lib
 """
+import ast
 import os
 import re
 
@@ -11,36 +15,103 @@ PY_SUFFIX = '.py'
 
 MODULE_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*\.py$')
 
+TEMPLATE = '''# Auto-generated __init__.py
+# Submodules are imported lazily on first attribute access.
+
+import importlib
+
+_SUBMODULES = {submodules}
+
+_LAZY_ATTRS = {{
+{attrs}
+}}
+
+__all__ = sorted(set(_SUBMODULES) | set(_LAZY_ATTRS))
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{{name}}", __name__)
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(f".{{_LAZY_ATTRS[name]}}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+
+
+def __dir__():
+    return __all__
+'''
+
+
+def module_names(path):
+    """Public top-level names defined (not imported) by a module."""
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=path)
+    names = []
+
+    def visit(body):
+        for node in body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                names.append(node.name)
+            elif isinstance(node, ast.Assign):
+                for target in node.targets:
+                    if isinstance(target, ast.Name):
+                        names.append(target.id)
+            elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+                names.append(node.target.id)
+            elif isinstance(node, ast.If):
+                visit(node.body)
+                visit(node.orelse)
+            elif isinstance(node, ast.Try):
+                visit(node.body)
+                for handler in node.handlers:
+                    visit(handler.body)
+                visit(node.orelse)
+                visit(node.finalbody)
+
+    visit(tree.body)
+    return [n for n in dict.fromkeys(names) if not n.startswith('_')]
+
+
 def generate_init(dirpath):
-    items = []
+    """Write a lazy __init__.py for dirpath and return the names it exports."""
+    submodules = []
+    attrs = {}
     for name in sorted(os.listdir(dirpath)):
         full = os.path.join(dirpath, name)
         if os.path.isdir(full) and os.path.exists(os.path.join(full, INIT_FILENAME)):
-            items.append((name, None))
+            exported = generate_init(full)
         elif MODULE_RE.match(name) and name != INIT_FILENAME:
-            mod = name[:-3]
-            items.append((mod, None))
-    if not items:
-        return
-    lines = ["# Auto-generated __init__.py", ""]
-    for mod, _ in items:
-        lines.append(f"from .{mod} import *")
-    content = "\n".join(lines) + "\n"
-    # write __init__.py
+            name = name[:-3]
+            exported = module_names(full)
+        else:
+            continue
+        submodules.append(name)
+        # later submodules win, matching the old `from .x import *` ordering
+        for attr in exported:
+            attrs[attr] = name
+    if not submodules:
+        return []
+    attrs = {k: v for k, v in attrs.items() if k not in submodules}
+    content = TEMPLATE.format(
+        submodules=repr(submodules),
+        attrs="\n".join(f"    {k!r}: {v!r}," for k, v in sorted(attrs.items())),
+    )
     init_path = os.path.join(dirpath, INIT_FILENAME)
     with open(init_path, 'w', encoding='utf-8') as f:
         f.write(content)
     print(f"Generated imports in {init_path}")
+    return list(attrs)
 
 
 def main(root):
-    for dirpath, dirnames, filenames in os.walk(root):
-        # skip hidden dirs
-        if any(part.startswith('.') for part in dirpath.split(os.sep)):
-            continue
-        # Only process package dirs (containing __init__.py)
-        if INIT_FILENAME in filenames:
-            generate_init(dirpath)
+    # skip hidden dirs
+    if any(part.startswith('.') for part in root.split(os.sep)):
+        return
+    # Only process package dirs (containing __init__.py); subpackages are handled recursively
+    if os.path.exists(os.path.join(root, INIT_FILENAME)):
+        generate_init(root)
 
 if __name__ == '__main__':
     import sys
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark.
+Times importing the modules that password_guess.py and its worker processes load, each in
+a fresh interpreter, and reports whether any pcfg_lib.training module was pulled in.
+Usage: python benchmarks/import_time.py [--runs N] [module ...]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_MODULES = [
+    "pcfg_lib",
+    "pcfg_lib.guess.crack",
+    "pcfg_lib.guess.util.worker_manage",
+    "pcfg_lib.guess.pcfg.pcfg_guesser",
+]
+
+# 새 인터프리터에서 실행할 측정 코드: 소요 시간과 로드된 학습 모듈 목록 출력
+PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - t0
+training = sorted(m for m in sys.modules if m.startswith("pcfg_lib.training"))
+print(json.dumps({{"elapsed": elapsed, "training": training}}))
+"""
+
+
+def measure(module, runs):
+    times = []
+    training = []
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-c", PROBE.format(module=module)],
+            cwd=ROOT, capture_output=True, text=True
+        )
+        if proc.returncode != 0:
+            err = proc.stderr.strip().splitlines()
+            return {"module": module, "error": err[-1] if err else f"exit {proc.returncode}"}
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        times.append(result["elapsed"])
+        training = result["training"]
+    return {
+        "module": module,
+        "median_ms": round(statistics.median(times) * 1000, 1),
+        "min_ms": round(min(times) * 1000, 1),
+        "training_modules": len(training),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure pcfg_lib import time in fresh interpreters")
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--runs", type=int, default=5, help="Runs per module (median is reported)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = [measure(m, args.runs) for m in args.modules]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'module':<40} {'median':>10} {'min':>10} {'training':>9}")
+    for r in results:
+        if "error" in r:
+            print(f"{r['module']:<40} error: {r['error']}")
+            continue
+        print(f"{r['module']:<40} {r['median_ms']:>8.1f}ms {r['min_ms']:>8.1f}ms {r['training_modules']:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite.
+Builds a synthetic grammar DB and corpus (see synthetic.py), runs every benchmark,
+appends the results to a JSON history file and compares them with the previous
+run of the same size/variant so regressions are visible.
+Usage: python benchmarks/run.py [--size N] [--variant V] [--only NAME ...]
+"""
+import argparse
+import datetime
+import hashlib
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import synthetic
+
+DEFAULT_HISTORY = os.path.join(ROOT, "benchmarks", "results", "history.json")
+
+
+class Skip(Exception):
+    """벤치마크를 실행할 수 없는 환경 (예: 학습용 의존성 누락)"""
+
+
+#=======================================================================================================
+#                                        벤치마크
+#=======================================================================================================
+# 각 벤치마크는 (ctx) → (처리량, 단위) 반환. ctx: db, corpus, passwords, guesses, workdir
+
+def _collect_nodes(pcfg, guesses):
+    # 확률 순서대로 후보 합이 guesses 이상이 될 때까지 노드 수집
+    from pcfg_lib.guess.util.priority_queue import PcfgQueue
+    queue = PcfgQueue(pcfg=pcfg)
+    nodes, total = [], 0
+    while total < guesses:
+        node = queue.pop()
+        if node is None:
+            break
+        nodes.append(node)
+        total += node.total_candidate
+        for child in pcfg.find_children(node):
+            queue.push(child)
+    return nodes
+
+
+def bench_pcfg_guess(ctx):
+    from pcfg_lib.guess.pcfg.pcfg_guesser import PCFGGuesser
+    pcfg = PCFGGuesser({"grammar_db": ctx["db"]})
+    nodes = _collect_nodes(pcfg, ctx["guesses"])
+    count = 0
+    t0 = time.perf_counter()
+    for node in nodes:
+        for _ in pcfg.guess(node.structures):
+            count += 1
+    return count / (time.perf_counter() - t0), "guesses/s"
+
+
+def bench_find_children(ctx):
+    from pcfg_lib.guess.pcfg.pcfg_guesser import PCFGGuesser
+    pcfg = PCFGGuesser({"grammar_db": ctx["db"]})
+    nodes = _collect_nodes(pcfg, ctx["guesses"] * 10)
+    t0 = time.perf_counter()
+    for node in nodes:
+        pcfg.find_children(node)
+    return len(nodes) / (time.perf_counter() - t0), "nodes/s"
+
+
+def bench_markov_guess(ctx):
+    import contextlib
+    import io
+    from pcfg_lib.guess.omen.markov_guesser import MarkovGuesser
+    from pcfg_lib.guess.omen.memorizer import Memorizer
+    from pcfg_lib.guess.omen.omen_io import load_omen_rules
+    with contextlib.redirect_stdout(io.StringIO()):
+        grammar = load_omen_rules(db_path=ctx["db"])
+    memorizer = Memorizer()
+    count = 0
+    t0 = time.perf_counter()
+    for level in range(1, grammar["max_level"] + 1):
+        markov = MarkovGuesser(grammar, level, memorizer)
+        while count < ctx["guesses"] and markov.next_guess() is not None:
+            count += 1
+        if count >= ctx["guesses"]:
+            break
+    return count / (time.perf_counter() - t0), "guesses/s"
+
+
+def bench_hash_buffer(ctx):
+    from pcfg_lib.guess.util.flush import MemoryBufferManager
+    targets = {hashlib.md5(str(i).encode()).hexdigest() for i in range(10_000)}
+    buffer = MemoryBufferManager(1000, targets, "md5")
+    passwords = list(islice(_cycle(ctx["passwords"]), ctx["guesses"]))
+    t0 = time.perf_counter()
+    for pw in passwords:
+        buffer.add(pw)
+        if buffer.should_flush():
+            buffer.flush()
+    buffer.flush()
+    return len(passwords) / (time.perf_counter() - t0), "hashes/s"
+
+
+def bench_train_parse(ctx):
+    try:
+        from pcfg_lib.training.pcfg.pcfg_parser import PCFGParser
+        from pcfg_lib.training.pcfg.word_counter import WordCounter
+    except Exception as e:
+        raise Skip(f"training stack unavailable: {e!r}")
+    parser = PCFGParser(WordCounter(needed_appear=1))
+    passwords = ctx["passwords"]
+    t0 = time.perf_counter()
+    for pw in passwords:
+        for _ in parser.parse(pw):
+            break
+    return len(passwords) / (time.perf_counter() - t0), "passwords/s"
+
+
+def bench_train_end_to_end(ctx):
+    try:
+        from pcfg_lib.training.trainer import start_train
+    except Exception as e:
+        raise Skip(f"training stack unavailable: {e!r}")
+    program_info = {
+        "ngram": 3, "encoding": "utf-8", "min_length": 4, "max_length": 30,
+        "alphabet": "abcdefghijklmnopqrstuvwxyz0123456789", "needed_appear": 1, "weight": 5,
+        "data": ctx["corpus"], "db_path": os.path.join(ctx["workdir"], "trained.db"),
+    }
+    t0 = time.perf_counter()
+    start_train(program_info)
+    return len(ctx["passwords"]) / (time.perf_counter() - t0), "passwords/s"
+
+
+def _cycle(items):
+    while True:
+        yield from items
+
+
+BENCHMARKS = {
+    "pcfg_guess": bench_pcfg_guess,
+    "find_children": bench_find_children,
+    "markov_guess": bench_markov_guess,
+    "hash_buffer": bench_hash_buffer,
+    "train_parse": bench_train_parse,
+    "train_end_to_end": bench_train_end_to_end,
+}
+
+# 세그먼트 캐시 / leet · 어휘 인덱스를 프로세스 전역에 채우는 벤치마크.
+# 같은 프로세스에서 반복하면 두 번째부터 데워진 캐시를 재므로 매 실행을 새 프로세스에서 함
+COLD_BENCHMARKS = {"train_parse", "train_end_to_end"}
+
+
+def _run_once(name, ctx):
+    if name not in COLD_BENCHMARKS:
+        return BENCHMARKS[name](ctx)
+    # spawn: fork 와 달리 부모의 캐시를 물려받지 않음 (학습 워커는 이 새 프로세스에서 fork)
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        return pool.submit(BENCHMARKS[name], ctx).result()
+
+
+#=======================================================================================================
+#                                     실행 및 기록 비교
+#=======================================================================================================
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True
+        ).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def run(names, size, variant, guesses, repeat, seed):
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="pcfg-bench-") as workdir:
+        passwords = synthetic.make_corpus(size, seed, variant)
+        corpus = os.path.join(workdir, "corpus.txt")
+        with open(corpus, "w", encoding="utf-8") as f:
+            f.write("\n".join(passwords) + "\n")
+        db = synthetic.make_grammar_db(os.path.join(workdir, "sqlite3.db"), passwords=passwords, variant=variant)
+        ctx = {"db": db, "corpus": corpus, "passwords": passwords, "guesses": guesses, "workdir": workdir}
+
+        for name in names:
+            try:
+                # 여러 번 실행해 가장 빠른 값을 기록 (잡음 제거)
+                best, unit = 0.0, None
+                for _ in range(repeat):
+                    value, unit = _run_once(name, ctx)
+                    best = max(best, value)
+                results[name] = {"value": best, "unit": unit}
+            except Skip as e:
+                results[name] = {"skipped": str(e)}
+            print(_format(name, results[name]), flush=True)
+    return results
+
+
+def _format(name, result, previous=None, threshold=None):
+    if "skipped" in result:
+        return f"{name:<20} skipped ({result['skipped']})"
+    line = f"{name:<20} {result['value']:>14,.0f} {result['unit']}"
+    if previous and "value" in previous and previous["value"]:
+        change = (result["value"] - previous["value"]) / previous["value"] * 100
+        line += f"  ({change:+.1f}% vs previous)"
+        if threshold is not None and change < -threshold:
+            line += "  REGRESSION"
+    return line
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the PCFG benchmark suite")
+    parser.add_argument("--size", type=int, default=20_000, help="Synthetic corpus / grammar size")
+    parser.add_argument("--variant", choices=synthetic.VARIANTS, default="default")
+    parser.add_argument("--guesses", type=int, default=200_000, help="Guesses / hashes per benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark (best is kept)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="Run only these benchmarks")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="JSON history file")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Regression threshold in percent")
+    parser.add_argument("--no-save", action="store_true", help="Do not append to the history file")
+    args = parser.parse_args()
+
+    names = args.only or list(BENCHMARKS)
+    results = run(names, args.size, args.variant, args.guesses, args.repeat, args.seed)
+
+    history = []
+    if os.path.exists(args.history):
+        with open(args.history, encoding="utf-8") as f:
+            history = json.load(f)
+    previous = next(
+        (h for h in reversed(history) if h["size"] == args.size and h["variant"] == args.variant
+         and h["guesses"] == args.guesses),
+        None
+    )
+    if previous:
+        print(f"\ncompared with {previous['timestamp']} ({previous.get('commit')})")
+        for name in names:
+            print(_format(name, results[name], previous["results"].get(name), args.threshold))
+
+    if not args.no_save:
+        history.append({
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "size": args.size,
+            "variant": args.variant,
+            "guesses": args.guesses,
+            "results": results,
+        })
+        os.makedirs(os.path.dirname(args.history), exist_ok=True)
+        with open(args.history, "w", encoding="utf-8") as f:
+            json.dump(history, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Synthetic password corpora and sqlite3.db grammars for benchmarks.
+Passwords are drawn from Zipf-weighted word lists combined with the usual
+digit / year / special-character / keyboard-walk patterns, so the grammar has
+the same shape (many structures, long-tailed terminals) as a trained one.
+Variants: "default", "korean" (dubeol-typed Korean words -> H symbols) and
+"leet" (leet substitutions inside words).
+Usage: python benchmarks/synthetic.py OUT_DIR [--size N] [--variant V] [--seed S]
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+from collections import Counter, defaultdict
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pcfg_lib.training.io.omen_train_data_output import save_omen_to_sqlite
+from pcfg_lib.training.io.pcfg_output import save_pcfg_to_sqlite
+from pcfg_lib.training.omen.evaluate_password import calc_omen_keyspace, find_omen_level
+from pcfg_lib.training.omen.omen_parser import AlphabetGrammar
+
+VARIANTS = ("default", "korean", "leet")
+
+ENGLISH_WORDS = [
+    "love", "angel", "dragon", "monkey", "sunshine", "princess", "shadow", "master", "soccer",
+    "hello", "freedom", "whatever", "qazwsx", "trustno", "jordan", "hunter", "buster", "tigger",
+    "summer", "flower", "cookie", "pepper", "ginger", "silver", "orange", "banana", "chicken",
+    "secret", "family", "friend", "forever", "lucky", "happy", "star", "blue", "black", "red",
+    "baby", "cute", "sweet", "honey", "magic", "super", "power", "king", "queen", "music",
+    "apple", "lemon", "peach", "tiger", "lion", "bear", "wolf", "eagle", "ninja", "pirate",
+    "computer", "internet", "password", "letmein", "welcome", "admin", "login", "user",
+]
+# 두벌식 자판으로 친 한국어 단어 (예: dkssud = 안녕)
+KOREAN_WORDS = [
+    "dkssud", "tkfkd", "tkfkdgo", "wjdgus", "alstn", "wlsgh", "didtks", "rlawlgns", "qkqh",
+    "gksrnr", "tjdnf", "qntks", "ekdtls", "dlsrnr", "gkgk", "zzzz", "ghkdlxld", "dkdlfjqm",
+    "rhdiddl", "rkdgodwl", "dusgus", "tnalsl", "wldms", "aldud", "tjdgus", "dlwjd", "qhdk",
+]
+NAMES = ["minsu", "jihoon", "seoyeon", "jiwoo", "hyun", "kim", "lee", "park", "choi", "jung"]
+KEYBOARD_WALKS = ["qwer", "asdf", "zxcv", "qwerty", "asdfgh", "1q2w3e", "1qaz", "qwe123"]
+SPECIALS = ["!", "@", "#", "$", "*", ".", "_", "-", "!!", "!@#", "@@"]
+LEET = {"a": "@", "e": "3", "i": "1", "o": "0", "s": "$", "t": "7"}
+
+
+#=======================================================================================================
+#                                     비밀번호 코퍼스 생성
+#=======================================================================================================
+def _zipf_choice(rng, items):
+    # 순위 r 의 가중치 1/r 로 선택 (자주 쓰이는 단어가 훨씬 많이 나오도록)
+    weights = [1.0 / (r + 1) for r in range(len(items))]
+    return rng.choices(items, weights)[0]
+
+
+def _word(rng, variant):
+    if variant == "korean" and rng.random() < 0.6:
+        return _zipf_choice(rng, KOREAN_WORDS)
+    if rng.random() < 0.2:
+        return _zipf_choice(rng, NAMES)
+    word = _zipf_choice(rng, ENGLISH_WORDS)
+    if variant == "leet" and rng.random() < 0.6:
+        word = "".join(LEET[c] if c in LEET and rng.random() < 0.5 else c for c in word)
+    return word
+
+
+def _digits(rng):
+    n = rng.choices([1, 2, 3, 4, 6], [4, 6, 3, 3, 1])[0]
+    if n == 4 and rng.random() < 0.5:
+        return str(rng.randint(1970, 2024))
+    if rng.random() < 0.3:
+        return "123456"[:n]
+    return "".join(rng.choice("0123456789") for _ in range(n))
+
+
+def make_password(rng, variant="default"):
+    word = _word(rng, variant)
+    if rng.random() < 0.2:
+        word = word.capitalize()
+    pattern = rng.choices(
+        ["wd", "w", "wdS", "wSd", "d", "k", "kd", "ww", "Swd"],
+        [30, 12, 12, 8, 8, 5, 5, 10, 3]
+    )[0]
+    out = []
+    for p in pattern:
+        if p == "w":
+            out.append(word if not out or rng.random() < 0.5 else _word(rng, variant))
+        elif p == "d":
+            out.append(_digits(rng))
+        elif p == "S":
+            out.append(rng.choice(SPECIALS))
+        else:
+            out.append(_zipf_choice(rng, KEYBOARD_WALKS))
+    return "".join(out)
+
+
+def make_corpus(size, seed=0, variant="default"):
+    rng = random.Random(seed)
+    return [make_password(rng, variant) for _ in range(size)]
+
+
+def write_corpus(path, size, seed=0, variant="default"):
+    with open(path, "w", encoding="utf-8") as f:
+        for pw in make_corpus(size, seed, variant):
+            f.write(pw + "\n")
+    return path
+
+
+#=======================================================================================================
+#                               코퍼스로부터 PCFG / OMEN 문법 DB 생성
+#=======================================================================================================
+def _char_class(c):
+    if c.isdigit():
+        return "D"
+    if c.isalpha():
+        return "A"
+    return "S"
+
+
+def _tokenize(pw):
+    # 같은 문자 종류의 연속 구간으로 분리
+    runs = []
+    for c in pw:
+        cls = _char_class(c)
+        if runs and runs[-1][0] == cls:
+            runs[-1][1] += c
+        else:
+            runs.append([cls, c])
+    return runs
+
+
+def count_grammar(passwords):
+    """간단한 문자 종류 분할로 학습기(PCFGParser)와 같은 형태의 카운터 생성"""
+    counts = SimpleNamespace(
+        count_keyboard=defaultdict(Counter), count_years=Counter(),
+        count_alpha=defaultdict(Counter), count_alpha_masks=defaultdict(Counter),
+        count_digits=defaultdict(Counter), count_special=defaultdict(Counter),
+        count_korean=defaultdict(Counter), count_base_structures=Counter(),
+        count_prince=Counter(),
+    )
+    korean = set(KOREAN_WORDS)
+    for pw in passwords:
+        if pw in KEYBOARD_WALKS:
+            counts.count_keyboard[len(pw)][pw] += 1
+            counts.count_base_structures[f"K{len(pw)}"] += 1
+            continue
+        structure = []
+        for cls, text in _tokenize(pw):
+            n = len(text)
+            if cls == "A":
+                mask = "".join("U" if c.isupper() else "L" for c in text)
+                counts.count_alpha_masks[n][mask] += 1
+                if text.lower() in korean:
+                    counts.count_korean[n][text.lower()] += 1
+                    structure.append(f"H{n}")
+                else:
+                    counts.count_alpha[n][text.lower()] += 1
+                    structure.append(f"A{n}")
+            elif cls == "D":
+                if n == 4 and text[:2] in ("19", "20"):
+                    counts.count_years[text] += 1
+                    structure.append("Y1")
+                else:
+                    counts.count_digits[n][text] += 1
+                    structure.append(f"D{n}")
+            else:
+                counts.count_special[n][text] += 1
+                structure.append(f"S{n}")
+        counts.count_base_structures["".join(structure)] += 1
+        counts.count_prince["".join(structure)] += 1
+    return counts
+
+
+def make_grammar_db(db_path, size=20_000, seed=0, variant="default", ngram=3,
+                    min_length=4, max_length=30, passwords=None):
+    """합성 코퍼스로 PCFG 테이블과 OMEN 테이블을 모두 담은 sqlite3.db 생성"""
+    if variant not in VARIANTS:
+        raise ValueError(f"variant must be one of {VARIANTS}")
+    if passwords is None:
+        passwords = make_corpus(size, seed, variant)
+    if os.path.exists(db_path):
+        os.remove(db_path)
+
+    save_pcfg_to_sqlite(db_path=db_path, pcfg_parser=count_grammar(passwords))
+
+    valid = [pw for pw in passwords if min_length <= len(pw) <= max_length]
+    omen = AlphabetGrammar(ngram=ngram, min_length=min_length, max_length=max_length)
+    for pw in valid:
+        omen.parse(pw)
+    omen.apply_smoothing()
+    with contextlib.redirect_stdout(io.StringIO()):
+        keyspace = calc_omen_keyspace(omen)
+    levels = Counter(find_omen_level(omen, pw) for pw in valid)
+    alphabet = sorted({c for pw in valid for c in pw})
+    save_omen_to_sqlite(
+        alphabet_grammar=omen,
+        omen_keyspace=keyspace,
+        omen_levels_count=levels,
+        num_valid_passwords=len(valid),
+        db_path=db_path,
+        program_info={"ngram": ngram, "encoding": "utf-8", "alphabet": alphabet},
+    )
+    return db_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic corpus and grammar DB")
+    parser.add_argument("out_dir")
+    parser.add_argument("--size", type=int, default=20_000, help="Number of passwords")
+    parser.add_argument("--variant", choices=VARIANTS, default="default")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    corpus = os.path.join(args.out_dir, f"corpus-{args.variant}-{args.size}.txt")
+    db = os.path.join(args.out_dir, f"sqlite3-{args.variant}-{args.size}.db")
+    passwords = make_corpus(args.size, args.seed, args.variant)
+    with open(corpus, "w", encoding="utf-8") as f:
+        f.write("\n".join(passwords) + "\n")
+    make_grammar_db(db, passwords=passwords, variant=args.variant)
+    print(f"corpus: {corpus}\ngrammar: {db}")
+
+
+if __name__ == "__main__":
+    main()
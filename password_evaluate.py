@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+import argparse
+import os
+import sys
+from os import cpu_count
+
+from pcfg_lib.guess.evaluate import evaluate_many, write_csv
+
+
+def valid_file(path):
+    if not os.path.isfile(path):
+        raise argparse.ArgumentTypeError(f"No such file: {path}")
+    return path
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        prog="password_evaluate",
+        description="Offline cracking-curve evaluation against a plaintext test set",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+        epilog="Example: password_evaluate --max-guesses 10000000 -o curve.csv test.txt a.db b.db"
+    )
+
+    parser.add_argument(
+        "--max-guesses",
+        type=int,
+        metavar="N",
+        help="Number of guesses to generate per grammar",
+        default=1_000_000
+    )
+    parser.add_argument(
+        "--points-per-decade",
+        type=int,
+        metavar="K",
+        help="Log-spaced checkpoints per factor of 10 guesses",
+        default=10
+    )
+    parser.add_argument(
+        "--pw-min",
+        type=int,
+        metavar="MIN",
+        help="Minimum password length",
+        default=None
+    )
+    parser.add_argument(
+        "--pw-max",
+        type=int,
+        metavar="MAX",
+        help="Maximum password length",
+        default=None
+    )
+    parser.add_argument(
+        "--unique",
+        action="store_true",
+        help="Count each distinct test password once instead of weighting by frequency"
+    )
+    parser.add_argument(
+        "-c", "--core",
+        type=int,
+        metavar="N",
+        help="Number of grammars evaluated in parallel",
+        default=cpu_count()
+    )
+    parser.add_argument(
+        "-o", "--output",
+        metavar="CSV",
+        help="Write the cracking curve to CSV (default: stdout)",
+        default=None
+    )
+
+    parser.add_argument(
+        "test_file",
+        metavar="TEST_FILE",
+        type=valid_file,
+        help="Plaintext test passwords, one per line"
+    )
+    parser.add_argument(
+        "grammars",
+        metavar="GRAMMAR_DB",
+        type=valid_file,
+        nargs="+",
+        help="Trained sqlite3.db grammar files to evaluate"
+    )
+
+    args = parser.parse_args()
+
+    if args.max_guesses < 1:
+        parser.error("--max-guesses must be >= 1")
+    if args.points_per_decade < 1:
+        parser.error("--points-per-decade must be >= 1")
+    if args.core < 1:
+        parser.error("--core must be >= 1")
+    if args.pw_min is not None and args.pw_max is not None and args.pw_max < args.pw_min:
+        parser.error("--pw-max must be >= --pw-min")
+
+    return args
+
+
+def main():
+    args = parse_args()
+
+    config = {
+        "pw_min": args.pw_min,
+        "pw_max": args.pw_max,
+    }
+    rows = evaluate_many(
+        args.grammars, args.test_file, args.max_guesses, config=config,
+        workers=args.core, per_decade=args.points_per_decade, unique=args.unique
+    )
+    if args.output:
+        with open(args.output, "w", newline="", encoding="utf-8") as f:
+            write_csv(rows, f)
+        for db in args.grammars:
+            last = [r for r in rows if r["grammar"] == db][-1]
+            print(f"{db}: {last['cracked']}/{last['total']} ({last['percent']:.2f}%) "
+                  f"after {last['guesses']} guesses in {last['elapsed']:.1f}s")
+    else:
+        write_csv(rows, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,14 @@
 #!/usr/bin/env python3
 import argparse
+import contextlib
 import os
 from os import cpu_count
 
+from pcfg_lib import profiling
 from pcfg_lib.guess.crack import PCFGJohnSession, PCFGSession
+from pcfg_lib.guess.export import WordlistExport
+from pcfg_lib.guess.gen_benchmark import GenerationBenchmark
+from pcfg_lib.guess.pcfg.ensemble import OMEN_PREFIX, parse_model_spec
 
 
 def valid_hash_file(path):
@@ -14,6 +19,25 @@ def valid_hash_file(path):
     return path
 
 
+def valid_file(path):
+    if not os.path.isfile(path):
+        raise argparse.ArgumentTypeError(f"No such file: {path}")
+    return path
+
+
+def valid_model(spec):
+    try:
+        path, weight = parse_model_spec(spec)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid weight in {spec!r} (expected PATH@WEIGHT)")
+    if weight <= 0:
+        raise argparse.ArgumentTypeError(f"Weight must be > 0: {spec}")
+    db = path[len(OMEN_PREFIX):] if path.startswith(OMEN_PREFIX) else path
+    if not os.path.isfile(db):
+        raise argparse.ArgumentTypeError(f"No such file: {db}")
+    return path, weight
+
+
 def parse_args():
     parser = argparse.ArgumentParser(
         prog="password_guess",
@@ -58,6 +82,155 @@ def parse_args():
         default=1
     )
 
+    parser.add_argument(
+        "-g", "--grammar",
+        type=valid_model,
+        action="append",
+        metavar="PATH[@WEIGHT]",
+        dest="grammars",
+        help="Trained grammar DB to merge into one probability-ordered ensemble (repeatable); "
+             "prefix with omen: for an OMEN model",
+        default=None
+    )
+
+    parser.add_argument(
+        "--overlay",
+        type=valid_file,
+        metavar="FILE",
+        help="Targeted-attack tokens (names, birthdays, usernames) injected into the A/D/H/Y "
+             "terminal groups at load time; one 'TOKEN [WEIGHT]' per line",
+        default=None
+    )
+
+    parser.add_argument(
+        "--max-guesses",
+        type=int,
+        metavar="N",
+        help="Stop after generating N guesses",
+        default=None
+    )
+    parser.add_argument(
+        "--min-prob",
+        type=float,
+        metavar="P",
+        help="Stop once the next structure's probability falls below P",
+        default=None
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        metavar="SECONDS",
+        help="Stop after running for SECONDS",
+        default=None
+    )
+
+    parser.add_argument(
+        "--status-json",
+        metavar="PATH",
+        help="Run without the TUI and write session metrics to PATH as JSON",
+        default=None
+    )
+    parser.add_argument(
+        "--status-interval",
+        type=float,
+        metavar="SECONDS",
+        help="Refresh interval for the TUI / status file",
+        default=1.0
+    )
+    parser.add_argument(
+        "--recent-cracks",
+        type=int,
+        metavar="N",
+        help="Number of most recent cracks to display",
+        default=10
+    )
+
+    parser.add_argument(
+        "--metrics-jsonl",
+        metavar="PATH",
+        help="Append periodic worker/coordinator metrics to PATH as JSON lines",
+        default=None
+    )
+    parser.add_argument(
+        "--metrics-prom",
+        metavar="PATH",
+        help="Write the latest metrics to PATH in Prometheus text format",
+        default=None
+    )
+    parser.add_argument(
+        "--metrics-interval",
+        type=float,
+        metavar="SECONDS",
+        help="Export interval for --metrics-jsonl / --metrics-prom",
+        default=5.0
+    )
+
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help="Skip guesses already generated in this session (shared Bloom filter across workers)"
+    )
+    parser.add_argument(
+        "--dedup-capacity",
+        type=int,
+        metavar="N",
+        help="Expected number of distinct guesses the dedup filter is sized for",
+        default=10_000_000
+    )
+    parser.add_argument(
+        "--dedup-fp-rate",
+        type=float,
+        metavar="P",
+        help="Dedup filter false-positive rate at capacity (a false positive skips a new guess)",
+        default=0.001
+    )
+
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="pcfg_guess_profile",
+        metavar="PREFIX",
+        help="Profile the coordinator and every worker, merged into PREFIX.pstats / PREFIX.txt",
+        default=None
+    )
+
+    parser.add_argument(
+        "--benchmark-gen",
+        type=int,
+        metavar="N",
+        help="Generate the first N guesses with the worker pipeline, without hashing or TUI, and report throughput",
+        default=None
+    )
+
+    parser.add_argument(
+        "--export",
+        metavar="PATH",
+        help="Write the first --count guesses in probability order to PATH instead of cracking "
+             "(.zst / .gz for streaming compression)",
+        default=None
+    )
+    parser.add_argument(
+        "--count",
+        type=int,
+        metavar="N",
+        help="Number of guesses to write with --export",
+        default=None
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        metavar="K",
+        help="Split --export output round-robin into K files, each still in probability order",
+        default=1
+    )
+    parser.add_argument(
+        "--compress-level",
+        type=int,
+        metavar="L",
+        help="zstd / gzip level for --export (default: 3 for zstd, 6 for gzip)",
+        default=None
+    )
+
     parser.add_argument(
         "--use-john",
         action="store_true",
@@ -74,7 +247,8 @@ def parse_args():
         "hash_file",
         metavar="HASH_FILE",
         type=valid_hash_file,
-        help="Path to your .hash file"
+        nargs="?",
+        help="Path to your .hash file (not needed with --benchmark-gen / --export)"
     )
 
     args = parser.parse_args()
@@ -85,6 +259,30 @@ def parse_args():
         parser.error("--pw-max must be >= --pw-min")
     if args.core < 1 or args.core > cpu_count():
         parser.error(f"--core must be between 1 and {cpu_count()}")
+    if args.max_guesses is not None and args.max_guesses < 1:
+        parser.error("--max-guesses must be >= 1")
+    if args.min_prob is not None and not 0 < args.min_prob <= 1:
+        parser.error("--min-prob must be in (0, 1]")
+    if args.time_budget is not None and args.time_budget <= 0:
+        parser.error("--time-budget must be > 0")
+    if args.status_interval <= 0:
+        parser.error("--status-interval must be > 0")
+    if args.recent_cracks < 0:
+        parser.error("--recent-cracks must be >= 0")
+    if args.metrics_interval <= 0:
+        parser.error("--metrics-interval must be > 0")
+    if args.dedup_capacity < 1:
+        parser.error("--dedup-capacity must be >= 1")
+    if not 0 < args.dedup_fp_rate < 1:
+        parser.error("--dedup-fp-rate must be in (0, 1)")
+    if args.benchmark_gen is not None and args.benchmark_gen < 1:
+        parser.error("--benchmark-gen must be >= 1")
+    if args.export is not None and (args.count is None or args.count < 1):
+        parser.error("--export requires --count N (N >= 1)")
+    if args.shards < 1:
+        parser.error("--shards must be >= 1")
+    if args.hash_file is None and args.benchmark_gen is None and args.export is None:
+        parser.error("HASH_FILE is required")
 
     return args
 
@@ -100,12 +298,37 @@ def main():
         "core": args.core,
         "log": args.log,
         "hashfile": args.hash_file,
+        "grammars": args.grammars,
+        "overlay": args.overlay,
         "use_john": args.use_john,
+        "max_guesses": args.max_guesses,
+        "min_prob": args.min_prob,
+        "time_budget": args.time_budget,
+        "status_json": args.status_json,
+        "status_interval": args.status_interval,
+        "recent_cracks": args.recent_cracks,
+        "metrics_jsonl": args.metrics_jsonl,
+        "metrics_prom": args.metrics_prom,
+        "metrics_interval": args.metrics_interval,
+        "dedup": args.dedup,
+        "dedup_capacity": args.dedup_capacity,
+        "dedup_fp_rate": args.dedup_fp_rate,
     }
-    if args.use_john:
-        PCFGJohnSession(config).run()
+    if args.profile:
+        profiler = profiling.profile_run(args.profile)
     else:
-        PCFGSession(config=config).run()
+        profiler = contextlib.nullcontext()
+    with profiler as profile_dir:
+        config["profile_dir"] = profile_dir
+        if args.export is not None:
+            exporter = WordlistExport(config, args.export, args.count, args.shards, args.compress_level)
+            print(WordlistExport.format(exporter.run()))
+        elif args.benchmark_gen is not None:
+            print(GenerationBenchmark.format(GenerationBenchmark(config, args.benchmark_gen).run()))
+        elif args.use_john:
+            PCFGJohnSession(config).run()
+        else:
+            PCFGSession(config=config).run()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+import argparse
+
+from pcfg_lib.guess.service.server import GrammarService, serve
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        prog="password_service",
+        description="PCFG password scoring / generation daemon",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+        epilog="Example: password_service --socket /tmp/pcfg.sock"
+    )
+
+    listen = parser.add_mutually_exclusive_group(required=True)
+    listen.add_argument(
+        "--socket",
+        metavar="PATH",
+        help="Serve newline-delimited JSON on a Unix socket"
+    )
+    listen.add_argument(
+        "--http",
+        type=int,
+        metavar="PORT",
+        help="Serve JSON over HTTP on 127.0.0.1:PORT"
+    )
+    parser.add_argument(
+        "--samples",
+        type=int,
+        metavar="N",
+        help="Monte Carlo sample size for guess-number estimates",
+        default=100_000
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="Random seed for the sample table",
+        default=None
+    )
+    parser.add_argument(
+        "--max-rank",
+        type=int,
+        metavar="N",
+        help="Largest guess rank served by 'guesses' requests",
+        default=10_000_000
+    )
+
+    args = parser.parse_args()
+
+    if args.samples < 1:
+        parser.error("--samples must be >= 1")
+
+    return args
+
+
+def main():
+    args = parse_args()
+
+    config = {
+        "samples": args.samples,
+        "seed": args.seed,
+        "max_rank": args.max_rank,
+    }
+    serve(GrammarService(config), socket_path=args.socket, http_port=args.http)
+
+
+if __name__ == "__main__":
+    main()
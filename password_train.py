@@ -1,10 +1,13 @@
 import argparse
 import configparser
+import contextlib
 import os
 import sys
+from multiprocessing import cpu_count
 from pathlib import Path
 
 import pcfg_lib.training.trainer
+from pcfg_lib import profiling
 
 
 def valid_data_file(path):
@@ -27,9 +30,56 @@ def parse_args():
         type=valid_data_file,
         help="Path to your .db or .txt file"
     )
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        metavar="N",
+        help="Number of parallel training workers",
+        default=min(cpu_count(), 8)
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        metavar="N",
+        help="Approximate passwords per work chunk (each worker reads its own byte / row range)",
+        default=10000
+    )
+    parser.add_argument(
+        "--segment-cache",
+        metavar="FILE",
+        help="SQLite file that stores word segmentations, shared by the workers and reused by later runs",
+        default=None
+    )
+    parser.add_argument(
+        "--segment-cache-size",
+        type=int,
+        metavar="N",
+        help="Segmentations kept in each worker's in-memory LRU",
+        default=200_000
+    )
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="Merge this data into the existing grammar's stored counts instead of retraining from scratch"
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="pcfg_train_profile",
+        metavar="PREFIX",
+        help="Profile the coordinator and every worker, merged into PREFIX.pstats / PREFIX.txt",
+        default=None
+    )
 
     args = parser.parse_args()
 
+    if args.workers < 1:
+        parser.error("--workers must be >= 1")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be >= 1")
+    if args.segment_cache_size < 1:
+        parser.error("--segment-cache-size must be >= 1")
+
     return args
 
 def main():
@@ -54,7 +104,18 @@ def main():
     args = parse_args()
 
     program_info['data'] = args.data_file
-    pcfg_lib.training.trainer.start_train(program_info)
+    program_info['workers'] = args.workers
+    program_info['chunk_size'] = args.chunk_size
+    program_info['segment_cache'] = args.segment_cache
+    program_info['segment_cache_size'] = args.segment_cache_size
+    program_info['update'] = args.update
+    if args.profile:
+        profiler = profiling.profile_run(args.profile)
+    else:
+        profiler = contextlib.nullcontext()
+    with profiler as profile_dir:
+        program_info['profile_dir'] = profile_dir
+        pcfg_lib.training.trainer.start_train(program_info)
 
 
 if __name__ == "__main__":
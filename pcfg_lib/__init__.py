@@ -1,6 +1,212 @@
 # Auto-generated __init__.py
+# Submodules are imported lazily on first attribute access.
 
-from .asd import *
-from .guess import *
-from .paths import *
-from .training import *
+import importlib
+
+_SUBMODULES = ['asd', 'guess', 'paths', 'profiling', 'training']
+
+_LAZY_ATTRS = {
+    'AlphabetGrammar': 'training',
+    'AlphabetGrammerNode': 'training',
+    'BASE_PATH': 'paths',
+    'BASE_URL': 'training',
+    'BATCH_GUESSES': 'guess',
+    'BATCH_SIZE': 'training',
+    'BloomFilter': 'guess',
+    'BufferManagerBase': 'guess',
+    'CHARSET': 'training',
+    'CHAR_INDICES': 'training',
+    'CHAR_LISTS': 'training',
+    'CHAR_SETS': 'training',
+    'COORDINATOR_PHASES': 'guess',
+    'CSV_FIELDS': 'guess',
+    'CUSTOM_DICT': 'training',
+    'DATA_PATH': 'paths',
+    'DB_PATH': 'training',
+    'DDL': 'training',
+    'DEFAULT_CAPACITY': 'training',
+    'DUBEOL_FINAL': 'training',
+    'DUBEOL_INITIAL': 'training',
+    'DUBEOL_MEDIAL': 'training',
+    'DUMP_INTERVAL': 'profiling',
+    'EnsembleGuesser': 'guess',
+    'FINAL': 'training',
+    'FLUSH_EVERY': 'training',
+    'GenerationBenchmark': 'guess',
+    'GrammarService': 'guess',
+    'GuessCursor': 'guess',
+    'GuessStructure': 'guess',
+    'INITIAL': 'training',
+    'JohnBufferManager': 'guess',
+    'KOREAN_DICT_DB_PATH': 'paths',
+    'KoreanCopusParser': 'training',
+    'LEET_MAP': 'training',
+    'LeetMatcher': 'training',
+    'MAX_LEET_COMBINATIONS': 'training',
+    'MEANINGFUL_SINGLE_CHAR': 'training',
+    'MEDIAL': 'training',
+    'MIN_LEN': 'training',
+    'MIN_ZIPF': 'training',
+    'MarkovGuesser': 'guess',
+    'Memorizer': 'guess',
+    'MemoryBufferManager': 'guess',
+    'NameListParser': 'training',
+    'NewWordParser': 'training',
+    'NewWordParser2': 'training',
+    'NewWordParser3': 'training',
+    'OMEN_PREFIX': 'guess',
+    'OVERLAY_SYMBOLS': 'guess',
+    'PARAMS': 'training',
+    'PCFGGuesser': 'guess',
+    'PCFGJohnSession': 'guess',
+    'PCFGParser': 'training',
+    'PCFGSession': 'guess',
+    'PCFG_TABLES': 'training',
+    'PHONETIC_SPELLING_MAP': 'training',
+    'PREFIX_DEPTH': 'training',
+    'PROBS': 'training',
+    'PcfgQueue': 'guess',
+    'QueueItem': 'guess',
+    'REV_FINAL': 'training',
+    'REV_INITIAL': 'training',
+    'REV_MEDIAL': 'training',
+    'RE_HANGUL_SEQ': 'training',
+    'RE_HANGUL_TOKEN': 'training',
+    'RE_ONLY_HANGUL': 'training',
+    'ROMAN_KEYS': 'training',
+    'ROOT_PATH': 'paths',
+    'SAMPLE_BYTES': 'training',
+    'SEGMENTER_VERSION': 'training',
+    'SERVICE_KEY': 'training',
+    'STOPWORDS': 'training',
+    'Seg': 'training',
+    'SegmentCache': 'training',
+    'SessionMetrics': 'guess',
+    'StrengthEstimator': 'guess',
+    'Structure': 'guess',
+    'TUIRenderer': 'guess',
+    'TabularNounParser': 'training',
+    'TrainingDataParser': 'training',
+    'TreeItem': 'guess',
+    'Type': 'guess',
+    'VALID_WORDS': 'training',
+    'WORKER_PHASES': 'guess',
+    'WRITE_BUFFER': 'guess',
+    'WordCounter': 'training',
+    'WordlistExport': 'guess',
+    'WorkerManager': 'guess',
+    'YoutubeCommentParser': 'training',
+    'all_merge_combinations': 'training',
+    'apply_overlay': 'guess',
+    'assign_parsers': 'training',
+    'caculate_prob_and_save_to_db': 'training',
+    'calc_omen_keyspace': 'training',
+    'check_hangul': 'training',
+    'clean_and_save_to_sqlite': 'training',
+    'comb_leets_sections': 'training',
+    'compile_level_table': 'training',
+    'configure_segment_cache': 'training',
+    'count_omen_keyspace': 'guess',
+    'detect_alphabet': 'training',
+    'detect_dictionary_word': 'training',
+    'detect_keyboard_walk': 'training',
+    'detect_year_or_monthday': 'training',
+    'dump_worker': 'profiling',
+    'enable_worker': 'profiling',
+    'english_lexicon': 'training',
+    'evaluate_grammar': 'guess',
+    'evaluate_many': 'guess',
+    'extract_clean_hangul': 'training',
+    'fetch_items': 'training',
+    'find_keyboard_row_column': 'training',
+    'find_leet_words': 'training',
+    'find_level': 'training',
+    'find_omen_level': 'training',
+    'get_Htoken_prob': 'training',
+    'get_alphabet_mask': 'training',
+    'get_english_prob': 'training',
+    'get_jamo_type': 'training',
+    'get_korean_caps_mask': 'training',
+    'get_original': 'training',
+    'hangul2dubeol': 'training',
+    'hangul2roman': 'training',
+    'is_adjacent_extended': 'training',
+    'is_contains_single_jamo': 'training',
+    'is_english': 'training',
+    'is_hangul_compat_jamo': 'training',
+    'is_hangul_jamo': 'training',
+    'is_hangul_jamo_exta': 'training',
+    'is_hangul_jamo_extb': 'training',
+    'is_hangul_syllable': 'training',
+    'is_korean': 'training',
+    'is_pure_korean': 'training',
+    'is_supported_hangul': 'training',
+    'is_valid_alpha_token': 'training',
+    'join_jamos': 'training',
+    'join_jamos_char': 'training',
+    'korean_lexicon': 'training',
+    'leet_segment': 'training',
+    'lexicon_version': 'training',
+    'load_checkpoint_counts': 'training',
+    'load_checkpoint_done': 'training',
+    'load_counter_from_db': 'training',
+    'load_guesser': 'guess',
+    'load_loan_word': 'training',
+    'load_omen_counts': 'training',
+    'load_omen_prob': 'guess',
+    'load_omen_rules': 'guess',
+    'load_overlay': 'guess',
+    'load_pcfg_counts': 'training',
+    'load_pcfg_grammar': 'guess',
+    'load_raw_korean_dict_from_db': 'training',
+    'load_stopwords': 'training',
+    'load_test_set': 'guess',
+    'log_checkpoints': 'guess',
+    'main': 'training',
+    'make_sure_path_exists': 'training',
+    'merge_profiles': 'profiling',
+    'model_config': 'guess',
+    'normalize_leet': 'training',
+    'normalize_phonetic_spelling': 'training',
+    'open_output': 'guess',
+    'parallel_process_resume': 'training',
+    'parse_model_spec': 'guess',
+    'plus': 'asd',
+    'print_progress': 'training',
+    'process_with': 'training',
+    'profile_run': 'profiling',
+    'restrict_omen_lengths': 'guess',
+    'roman2jamo': 'training',
+    'save_checkpoint_counts': 'training',
+    'save_checkpoint_done': 'training',
+    'save_counter_to_db': 'training',
+    'save_counter_to_sqlite': 'training',
+    'save_omen_to_sqlite': 'training',
+    'save_pcfg_to_sqlite': 'training',
+    'save_word_probs_to_sqlite': 'training',
+    'segment_cache': 'training',
+    'serve': 'guess',
+    'shard_paths': 'guess',
+    'smooth_grammar': 'training',
+    'smooth_length': 'training',
+    'split_alpha': 'training',
+    'start_train': 'training',
+    'to_tuple': 'training',
+    'write_csv': 'guess',
+}
+
+__all__ = sorted(set(_SUBMODULES) | set(_LAZY_ATTRS))
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return __all__
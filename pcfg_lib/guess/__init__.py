@@ -1,7 +1,74 @@
 # Auto-generated __init__.py
+# Submodules are imported lazily on first attribute access.
 
-from .crack import *
-from .omen import *
-from .pcfg import *
-from .ui import *
-from .util import *
+import importlib
+
+_SUBMODULES = ['crack', 'evaluate', 'export', 'gen_benchmark', 'omen', 'pcfg', 'service', 'ui', 'util']
+
+_LAZY_ATTRS = {
+    'BATCH_GUESSES': 'export',
+    'BloomFilter': 'util',
+    'BufferManagerBase': 'util',
+    'COORDINATOR_PHASES': 'util',
+    'CSV_FIELDS': 'evaluate',
+    'EnsembleGuesser': 'pcfg',
+    'GenerationBenchmark': 'gen_benchmark',
+    'GrammarService': 'service',
+    'GuessCursor': 'service',
+    'GuessStructure': 'omen',
+    'JohnBufferManager': 'util',
+    'MarkovGuesser': 'omen',
+    'Memorizer': 'omen',
+    'MemoryBufferManager': 'util',
+    'OMEN_PREFIX': 'pcfg',
+    'OVERLAY_SYMBOLS': 'pcfg',
+    'PCFGGuesser': 'pcfg',
+    'PCFGJohnSession': 'crack',
+    'PCFGSession': 'crack',
+    'PcfgQueue': 'util',
+    'QueueItem': 'util',
+    'SessionMetrics': 'util',
+    'StrengthEstimator': 'pcfg',
+    'Structure': 'pcfg',
+    'TUIRenderer': 'ui',
+    'TreeItem': 'pcfg',
+    'Type': 'pcfg',
+    'WORKER_PHASES': 'util',
+    'WRITE_BUFFER': 'export',
+    'WordlistExport': 'export',
+    'WorkerManager': 'util',
+    'apply_overlay': 'pcfg',
+    'count_omen_keyspace': 'omen',
+    'evaluate_grammar': 'evaluate',
+    'evaluate_many': 'evaluate',
+    'load_guesser': 'pcfg',
+    'load_omen_prob': 'omen',
+    'load_omen_rules': 'omen',
+    'load_overlay': 'pcfg',
+    'load_pcfg_grammar': 'pcfg',
+    'load_test_set': 'evaluate',
+    'log_checkpoints': 'evaluate',
+    'model_config': 'pcfg',
+    'open_output': 'export',
+    'parse_model_spec': 'pcfg',
+    'restrict_omen_lengths': 'omen',
+    'serve': 'service',
+    'shard_paths': 'export',
+    'write_csv': 'evaluate',
+}
+
+__all__ = sorted(set(_SUBMODULES) | set(_LAZY_ATTRS))
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return __all__
@@ -1,3 +1,7 @@
+import contextlib
+import json
+import math
+import os
 import sys
 import threading
 import time
@@ -9,8 +13,10 @@ from queue import Empty as QueueEmpty
 from readchar import readkey
 from rich.live import Live
 
+from pcfg_lib.guess.util.dedup import BloomFilter
 from pcfg_lib.guess.util.flush import MemoryBufferManager, JohnBufferManager
-from pcfg_lib.guess.pcfg.pcfg_guesser import PCFGGuesser
+from pcfg_lib.guess.util.metrics import SessionMetrics
+from pcfg_lib.guess.pcfg.ensemble import load_guesser
 from pcfg_lib.guess.ui.ui_render import TUIRenderer
 from pcfg_lib.guess.util.priority_queue import PcfgQueue
 from pcfg_lib.guess.util.worker_manage import WorkerManager
@@ -33,9 +39,25 @@ class PCFGSession:
 
         # 추적할 결과 및 통계
         self.found = {}                             # 찾은 해시 → (비밀번호, 걸린 시간, 시도 수)
+        self.cracks = deque(maxlen=config.get("recent_cracks", 10))  # 최근 크랙된 해시
         self.recent = deque(maxlen=10)              # 최근 생성된 비밀번호 히스토리
         self.generated = 0                          # 총 생성된 비밀번호 수
-        self.current_prob = 0.0                     # 현재 확률 상태
+        self.duplicates = 0                         # 중복 제거로 큐에 보내지 않은 추측 수 (생성 예산에 포함)
+        self.current_prob = -math.inf               # 현재 처리 중인 노드의 log 확률
+        self.perf = SessionMetrics(config)          # 워커 / 코디네이터 성능 지표
+
+        # 상태 출력: 고정 주기 렌더링, --status-json 이면 TUI 없이 파일로만 기록
+        self.status_json = config.get("status_json")
+        self.status_interval = config.get("status_interval", 1.0)
+
+        # 종료 조건 (None 이면 제한 없음)
+        self.max_guesses = config.get("max_guesses")              # 최대 생성 비밀번호 수
+        min_prob = config.get("min_prob")
+        self.min_log_prob = math.log(min_prob) if min_prob else None  # 노드 확률 하한 (log)
+        self.time_budget = config.get("time_budget")              # 최대 실행 시간(초)
+        self.dispatched = 0                         # 워커에 제출한 노드들의 후보 수 합계
+        self.stop_reason = None                     # 세션 종료 사유
+        self.queue = None                           # PcfgQueue (run 에서 생성)
 
         # 동기화 및 큐
         mgr = Manager()
@@ -43,15 +65,26 @@ class PCFGSession:
         self.exit_evt = mgr.Event()                 # 종료 신호 이벤트
         self.targets = set(self.hashes)             # 남은 타겟 해시 집합
 
+        # 중복 제거: 모든 워커가 공유하는 Bloom 필터 (--dedup 일 때만)
+        self.dedup = None
+        if config.get("dedup"):
+            self.dedup = BloomFilter.create(
+                config.get("dedup_capacity", 10_000_000), config.get("dedup_fp_rate", 0.001)
+            )
+
         # 구성요소 초기화
-        self.worker = WorkerManager(config, self.guess_q, self.exit_evt, self.targets)
+        self.worker = WorkerManager(
+            config, self.guess_q, self.exit_evt, self.targets,
+            dedup=self.dedup.spec if self.dedup else None
+        )
         self.buffer = MemoryBufferManager(
             config.get("buffer_size", 1000), self.targets, config.get("mode", "md5")
         )
         self.ui = TUIRenderer(self.hashes, config)
 
-        # 키 입력 쓰레드 (q 입력 시 종료)
-        threading.Thread(target=self._keypress, daemon=True).start()
+        # 키 입력 쓰레드 (q 입력 시 종료), 비대화형 실행에서는 생략
+        if not self.status_json and sys.stdin.isatty():
+            threading.Thread(target=self._keypress, daemon=True).start()
 
     #----------------------------------------------------------------------------------
     # 해시 파일 로드: 파일이 존재하면 각 줄의 해시를 집합으로 반환
@@ -70,68 +103,252 @@ class PCFGSession:
                 self.exit_evt.set()
                 break
 
+    #----------------------------------------------------------------------------------
+    # 종료 조건 검사: 종료해야 하면 사유 문자열, 아니면 None 반환
+    #----------------------------------------------------------------------------------
+    def _check_stop(self):
+        if len(self.found) >= len(self.hashes):
+            return "all hashes cracked"
+        if self.max_guesses is not None and self.generated + self.duplicates >= self.max_guesses:
+            return "guess budget reached"
+        # 노드가 후보 수보다 적게 생성해도 (중복 제거, 중단된 노드 등) 예산만큼 제출했고
+        # 처리 중인 노드가 없으면 더 생성될 추측이 없으므로 종료
+        if (self.max_guesses is not None and self.dispatched >= self.max_guesses
+                and not self.worker.inflight):
+            return "guess budget reached"
+        if self.time_budget is not None and time.time() - self.start_ts >= self.time_budget:
+            return "time budget reached"
+        if not self.worker.inflight and not self.queue:
+            return "keyspace exhausted"
+        return None
+
+    #----------------------------------------------------------------------------------
+    # 계획된 키스페이스 대비 진행률(%)과 예상 남은 시간(초) 계산
+    # 계획 키스페이스: --max-guesses 가 있으면 그 값, --min-prob 만 있으면
+    #                  제출된 노드 + 확률 하한 이상으로 큐에 남은 노드의 후보 수 합
+    # 반환: (planned, percent, eta) — 계산할 수 없는 값은 None
+    #----------------------------------------------------------------------------------
+    def progress(self):
+        elapsed = time.time() - self.start_ts
+        planned = None
+        if self.max_guesses is not None:
+            planned = self.max_guesses
+        elif self.min_log_prob is not None and self.queue is not None:
+            planned = self.dispatched + self.queue.keyspace
+
+        fractions, etas = [], []
+        produced = self.generated + self.duplicates
+        rate = produced / elapsed if elapsed > 0 else 0.0
+        if planned:
+            fractions.append(min(produced / planned, 1.0))
+            if rate > 0:
+                etas.append(max(planned - produced, 0) / rate)
+        if self.time_budget:
+            fractions.append(min(elapsed / self.time_budget, 1.0))
+            etas.append(max(self.time_budget - elapsed, 0.0))
+
+        percent = max(fractions) * 100 if fractions else None
+        eta = min(etas) if etas else None
+        return planned, percent, eta
+
+    #----------------------------------------------------------------------------------
+    # TUI 와 --status-json 이 공유하는 집계 지표 (해시 수와 무관한 크기)
+    #----------------------------------------------------------------------------------
+    def metrics(self) -> dict:
+        elapsed = time.time() - self.start_ts
+        _, percent, eta = self.progress()
+        queue_depth = len(self.queue) if self.queue is not None else 0
+        return {
+            "timestamp": time.time(),
+            "elapsed": elapsed,
+            "cracked": len(self.found),
+            "total": len(self.hashes),
+            "generated": self.generated,
+            "guesses_per_sec": self.generated / elapsed if elapsed > 0 else 0.0,
+            "current_prob": math.exp(self.current_prob),
+            "current_log_prob": self.current_prob if math.isfinite(self.current_prob) else None,
+            "queue_depth": queue_depth,
+            "inflight": len(self.worker.inflight),
+            "planned_percent": percent,
+            "eta": eta,
+            "stop_reason": self.stop_reason,
+            "workers": self.perf.workers(),
+            "coordinator": self.perf.coordinator_stats(queue_depth),
+            "models": self._model_metrics(),
+            "dedup": {
+                "filter_bytes": self.dedup.size_bytes,
+                "hash_functions": self.dedup.k,
+            } if self.dedup else None,
+            "recent_cracks": [
+                {"hash": d, "password": pw, "elapsed": t, "generated": gen}
+                for d, pw, t, gen in self.cracks
+            ],
+        }
+
+    #----------------------------------------------------------------------------------
+    # 앙상블 모델별 가중치와 생성 수 (단일 문법이면 None)
+    #----------------------------------------------------------------------------------
+    def _model_metrics(self):
+        models = self.cfg.get("grammars")
+        if not models:
+            return None
+        total = sum(weight for _, weight in models)
+        return [
+            {"grammar": path, "weight": weight / total, "guesses": self.perf.model_guesses[i]}
+            for i, (path, weight) in enumerate(models)
+        ]
+
+    #----------------------------------------------------------------------------------
+    # --status-json 파일 기록 (임시 파일에 쓴 뒤 교체해 읽는 쪽이 잘린 파일을 보지 않도록)
+    #----------------------------------------------------------------------------------
+    def _write_status(self):
+        tmp = f"{self.status_json}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.metrics(), f)
+        os.replace(tmp, self.status_json)
+
+    #----------------------------------------------------------------------------------
+    # 상태 출력: TUI 갱신 또는 --status-json 파일 기록
+    #----------------------------------------------------------------------------------
+    def _render(self, live):
+        if self.status_json:
+            self._write_status()
+        else:
+            live.update(self.ui.update())
+
+    #----------------------------------------------------------------------------------
+    # 찾은 해시 기록
+    #----------------------------------------------------------------------------------
+    def _record_found(self, d, pw):
+        if d not in self.found:
+            t = time.time() - self.start_ts
+            self.found[d] = (pw, t, self.generated)
+            self.cracks.append((d, pw, t, self.generated))
+
+    #----------------------------------------------------------------------------------
+    # --metrics-jsonl / --metrics-prom 으로 내보낼 스냅샷 (크랙된 평문은 제외)
+    #----------------------------------------------------------------------------------
+    def _perf_snapshot(self) -> dict:
+        snapshot = self.metrics()
+        del snapshot["recent_cracks"]
+        return snapshot
+
+    #----------------------------------------------------------------------------------
+    # guess_q 에서 생성 비밀번호 꺼내 recent 및 버퍼에 추가
+    #----------------------------------------------------------------------------------
+    def _drain_guesses(self):
+        try:
+            while True:
+                pw = self.guess_q.get_nowait()
+                self.recent.append(pw)
+                self.buffer.add(pw)
+                self.generated += 1
+        except QueueEmpty:
+            pass
+
+    #----------------------------------------------------------------------------------
+    # 버퍼 플러시 결과를 found 에 반영
+    #----------------------------------------------------------------------------------
+    def _flush_buffer(self):
+        for d, pw in self.buffer.flush():
+            self._record_found(d, pw)
+
     #----------------------------------------------------------------------------------
     # 세션 실행: 워커 시작, 노드 제출, 결과 수집, TUI 업데이트, 종료 처리
     #----------------------------------------------------------------------------------
     def run(self):
-        console = self.ui.console
-        self.worker.start()
-
-        # Live 화면 모드
-        with Live(self.ui.initial(self), console=console, refresh_per_second=1, screen=True) as live:
-            queue = PcfgQueue(pcfg=PCFGGuesser(config=self.cfg))
-
-            while not self.exit_evt.is_set():
-                # 1) 모든 해시를 찾았으면 종료
-                if len(self.found) >= len(self.hashes):
-                    self.exit_evt.set()
-                    self.worker.cancel_all()
-                    self.worker.shutdown()
-                    break
-
-                # 2) 워커에 처리할 노드 제출 (코어 수 제한)
-                while len(self.worker.inflight) < self.cfg.get("core", 4):
-                    nd = queue.pop()
-                    if not nd:
+        try:
+            console = self.ui.console
+            self.worker.start()
+
+            # Live 화면 모드 (--status-json 이면 화면 없이 실행)
+            initial = self.ui.initial(self)
+            if self.status_json:
+                screen = contextlib.nullcontext()
+            else:
+                screen = Live(initial, console=console, refresh_per_second=1, screen=True)
+            with screen as live:
+                self.queue = queue = PcfgQueue(pcfg=load_guesser(self.cfg))
+                perf = self.perf
+                next_render = 0.0
+
+                while not self.exit_evt.is_set():
+                    # 1) 종료 조건(전체 크랙, 생성 수/시간 예산, 키스페이스 소진) 확인
+                    self.stop_reason = self._check_stop()
+                    if self.stop_reason:
+                        self.exit_evt.set()
+                        self.worker.cancel_all()
                         break
-                    self.current_prob = nd.prob
-                    self.worker.submit(nd)
-
-                # 3) 워커로부터 결과 수집 (자식 노드, 매칭된 비밀번호)
-                for children, matches in self.worker.collect():
-                    # 3-1) 매칭된 해시 처리
-                    for d, pw in matches:
-                        if d not in self.found:
-                            self.found[d] = (pw, time.time() - self.start_ts, self.generated)
-                    # 3-2) 새 노드 큐에 추가
-                    for c in children:
-                        queue.push(c)
-
-                # 4) guess_q 에서 생성 비밀번호 꺼내 recent 및 버퍼에 추가
-                try:
-                    while True:
-                        pw = self.guess_q.get_nowait()
-                        self.recent.append(pw)
-                        self.buffer.add(pw)
-                        self.generated += 1
-                except QueueEmpty:
-                    pass
-
-                # 5) 버퍼 플러시 시 실제 found 처리
-                if self.buffer.should_flush():
-                    for d, pw in self.buffer.flush():
-                        if d not in self.found:
-                            self.found[d] = (pw, time.time() - self.start_ts, self.generated)
-
-                # 6) UI 업데이트
-                live.update(self.ui.update())
-
-        # 종료 후 최종 레이아웃 및 결과 출력
-        console.print(self.ui.layout(self.generated))
-        console.print(
-            f"[bold green]Done![/] {len(self.found)}/{len(self.hashes)} cracked in {time.time() - self.start_ts:.1f}s generated {self.generated}"
-        )
-        console.clear()
+
+                    # 2) 워커에 처리할 노드 제출 (코어 수 및 생성 예산 제한)
+                    with perf.timer("dispatch"):
+                        while len(self.worker.inflight) < self.cfg.get("core", 4):
+                            if self.max_guesses is not None and self.dispatched >= self.max_guesses:
+                                break
+                            nd = queue.pop()
+                            if not nd:
+                                break
+                            # 확률 하한 미만이면 큐의 나머지 노드도 모두 하한 미만
+                            if self.min_log_prob is not None and nd.prob < self.min_log_prob:
+                                queue.clear()
+                                break
+                            self.current_prob = nd.prob
+                            self.dispatched += nd.total_candidate
+                            self.worker.submit(nd)
+
+                    # 3) 워커로부터 결과 수집 (자식 노드, 매칭된 비밀번호, 워커 통계)
+                    with perf.timer("collect"):
+                        for children, matches, stats in self.worker.collect():
+                            perf.record_worker(stats)
+                            self.duplicates += stats["duplicates"]
+                            # 3-1) 매칭된 해시 처리
+                            for d, pw in matches:
+                                self._record_found(d, pw)
+                            # 3-2) 새 노드 큐에 추가 (확률 하한 미만 노드는 버림)
+                            for c in children:
+                                if self.min_log_prob is None or c.prob >= self.min_log_prob:
+                                    queue.push(c)
+                                    perf.children_pushed += 1
+
+                    # 4) guess_q 에서 생성 비밀번호 꺼내 recent 및 버퍼에 추가
+                    with perf.timer("drain"):
+                        self._drain_guesses()
+
+                    # 5) 버퍼 플러시 시 실제 found 처리
+                    if self.buffer.should_flush():
+                        with perf.timer("flush"):
+                            self._flush_buffer()
+
+                    # 6) 고정 주기로 UI / 상태 파일 갱신 (매 루프마다 렌더링하지 않음)
+                    now = time.monotonic()
+                    if now >= next_render:
+                        with perf.timer("render"):
+                            self._render(live)
+                        next_render = now + self.status_interval
+                    perf.maybe_export(self._perf_snapshot)
+
+                # 워커 풀 종료 (--profile 이면 워커가 프로파일을 저장하고 끝날 때까지 대기)
+                self.worker.shutdown(wait=bool(self.cfg.get("profile_dir")))
+
+                # 남아 있는 생성 비밀번호 마저 처리
+                self._drain_guesses()
+                self._flush_buffer()
+                perf.maybe_export(self._perf_snapshot, force=True)
+
+            # 종료 후 최종 레이아웃 및 결과 출력
+            if self.status_json:
+                self._write_status()
+            else:
+                console.print(self.ui.update())
+            console.print(
+                f"[bold green]Done![/] {len(self.found)}/{len(self.hashes)} cracked in {time.time() - self.start_ts:.1f}s generated {self.generated}"
+                + (f" ({self.stop_reason})" if self.stop_reason else "")
+            )
+            console.clear()
+        finally:
+            # 예외 / 중단으로 빠져나가도 공유 메모리 Bloom 필터는 해제
+            if self.dedup:
+                self.dedup.close()
 
 
 #=======================================================================================================
@@ -0,0 +1,108 @@
+import csv
+import math
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from pcfg_lib.guess.pcfg.pcfg_guesser import PCFGGuesser
+from pcfg_lib.guess.util.priority_queue import PcfgQueue
+
+CSV_FIELDS = ["grammar", "guesses", "cracked", "total", "percent", "elapsed"]
+
+
+#=======================================================================================================
+#                              평문 테스트셋 기반 크래킹 곡선 평가
+#=======================================================================================================
+def log_checkpoints(max_guesses: int, per_decade: int = 10) -> list[int]:
+    """1 부터 max_guesses 까지 로그 간격 체크포인트 (10배마다 per_decade 개, 마지막은 max_guesses)"""
+    points = set()
+    steps = int(math.ceil(math.log10(max(max_guesses, 1)) * per_decade))
+    for i in range(steps + 1):
+        points.add(min(int(round(10 ** (i / per_decade))), max_guesses))
+    points.add(max_guesses)
+    return sorted(points)
+
+
+def load_test_set(path: str, encoding: str = "utf-8", unique: bool = False) -> Counter:
+    """테스트 평문 파일을 비밀번호 → 등장 횟수 로 로드 (unique 면 모두 1)"""
+    counts = Counter()
+    with open(path, encoding=encoding, errors="ignore") as f:
+        for line in f:
+            pw = line.rstrip("\r\n")
+            if pw:
+                counts[pw] += 1
+    if unique:
+        counts = Counter(dict.fromkeys(counts, 1))
+    return counts
+
+
+def evaluate_grammar(db_path: str, test_path: str, max_guesses: int, config: dict = None,
+                     per_decade: int = 10, unique: bool = False) -> list[dict]:
+    """
+    문법 하나로 확률 순서대로 max_guesses 개를 생성하며 테스트셋 포함 여부만 검사합니다.
+    반환: 체크포인트마다 {grammar, guesses, cracked, total, percent, elapsed}
+    """
+    remaining = load_test_set(test_path, unique=unique)
+    total = sum(remaining.values())
+    pcfg = PCFGGuesser(dict(config or {}, grammar_db=db_path))
+    checkpoints = log_checkpoints(max_guesses, per_decade)
+
+    rows = []
+    cracked = 0
+    guesses = 0
+    k = 0
+    start = time.perf_counter()
+
+    def record():
+        rows.append({
+            "grammar": db_path,
+            "guesses": guesses,
+            "cracked": cracked,
+            "total": total,
+            "percent": cracked / total * 100 if total else 0.0,
+            "elapsed": time.perf_counter() - start,
+        })
+
+    for pw, _ in PcfgQueue(pcfg=pcfg).guesses():
+        guesses += 1
+        hit = remaining.pop(pw, 0)
+        if hit:
+            cracked += hit
+        if guesses == checkpoints[k]:
+            record()
+            k += 1
+            if k == len(checkpoints) or not remaining:
+                break
+    # 키스페이스가 먼저 끝났거나 모두 찾은 경우 마지막 상태 기록
+    if not rows or rows[-1]["guesses"] != guesses:
+        record()
+    return rows
+
+
+def _evaluate_task(args):
+    return evaluate_grammar(*args)
+
+
+def evaluate_many(db_paths: list[str], test_path: str, max_guesses: int, config: dict = None,
+                  workers: int = None, per_decade: int = 10, unique: bool = False) -> list[dict]:
+    """여러 문법 DB 를 코어별로 병렬 평가 (DB 하나당 프로세스 하나)"""
+    tasks = [(db, test_path, max_guesses, config, per_decade, unique) for db in db_paths]
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    if workers <= 1:
+        results = [_evaluate_task(t) for t in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_evaluate_task, tasks))
+    return [row for rows in results for row in rows]
+
+
+def write_csv(rows: list[dict], out):
+    writer = csv.DictWriter(out, fieldnames=CSV_FIELDS)
+    writer.writeheader()
+    for row in rows:
+        writer.writerow({
+            **row,
+            "percent": f"{row['percent']:.4f}",
+            "elapsed": f"{row['elapsed']:.3f}",
+        })
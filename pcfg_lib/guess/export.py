@@ -0,0 +1,158 @@
+import gzip
+import os
+import time
+from multiprocessing import Manager, Queue
+
+from pcfg_lib.guess.pcfg.ensemble import load_guesser
+from pcfg_lib.guess.util.metrics import SessionMetrics
+from pcfg_lib.guess.util.priority_queue import PcfgQueue
+from pcfg_lib.guess.util.worker_manage import WorkerManager
+
+WRITE_BUFFER = 1 << 20                              # 비압축 출력 파일 버퍼 크기
+BATCH_GUESSES = 20_000                              # 워커 작업 하나에 묶을 최소 추측 수
+
+
+def shard_paths(path: str, shards: int) -> list[str]:
+    """out.txt.zst → out.0.txt.zst, out.1.txt.zst, ... (샤드가 1개면 그대로)"""
+    if shards == 1:
+        return [path]
+    head, name = os.path.split(path)
+    stem, dot, ext = name.partition(".")
+    width = len(str(shards - 1))
+    return [os.path.join(head, f"{stem}.{i:0{width}d}{dot}{ext}") for i in range(shards)]
+
+
+def open_output(path: str, level: int = None):
+    """확장자로 압축 형식 결정: .zst/.zstd → zstd (zstandard 패키지), .gz → gzip, 그 외 평문"""
+    if path.endswith((".zst", ".zstd")):
+        try:
+            import zstandard
+        except ImportError:
+            raise RuntimeError("zstd output requires the 'zstandard' package (pip install zstandard)")
+        # threads=-1: 압축을 코어 수만큼의 zstd 내부 쓰레드로 분산
+        compressor = zstandard.ZstdCompressor(level=3 if level is None else level, threads=-1)
+        return compressor.stream_writer(open(path, "wb"), closefd=True)
+    if path.endswith(".gz"):
+        return gzip.open(path, "wb", compresslevel=6 if level is None else level)
+    return open(path, "wb", buffering=WRITE_BUFFER)
+
+
+#=======================================================================================================
+#                       확률 순서 단어 목록 내보내기 (멀티 프로세스 생성 + 스트리밍 압축)
+#=======================================================================================================
+class WordlistExport:
+    #----------------------------------------------------------------------------------
+    # 초기화: 내보내기 전용 워커 풀과 출력 설정
+    # config: 설정 딕셔너리 (core, pw_min, pw_max, grammars, overlay 등)
+    # path: 출력 경로 (.zst / .gz 이면 압축), count: 내보낼 추측 수
+    # shards: 출력 파일 수 — 추측 i 는 샤드 i % shards 로 가므로 각 샤드도 확률 순서
+    # level: 압축 레벨 (None 이면 형식별 기본값)
+    #----------------------------------------------------------------------------------
+    def __init__(self, config: dict, path: str, count: int, shards: int = 1, level: int = None):
+        self.cfg = config
+        self.paths = shard_paths(path, shards)
+        self.count = count
+        self.shards = shards
+        self.level = level
+        self.cores = config.get("core", 4)
+        mgr = Manager()
+        self.exit_evt = mgr.Event()
+        self.worker = WorkerManager(config, Queue(), self.exit_evt, set())
+        self.perf = SessionMetrics(config)
+
+        self.written = 0                            # 기록한 추측 수
+        self.bytes = 0                              # 기록한 비압축 바이트 수
+        self.nodes = 0                              # 펼친 문법 노드 수
+
+    #----------------------------------------------------------------------------------
+    # 실행: 코디네이터가 큐를 순차 실행과 똑같은 순서로 펼치며 노드를 묶어 번호 순으로 제출하고,
+    #       워커 결과를 같은 순서로 기록 (병렬 실행이어도 출력은 항상 정확한 확률 순서)
+    # 워커가 묶음의 추측을 샤드별 bytes 로 만들어 돌려주므로 코디네이터는 쓰기만 함
+    #----------------------------------------------------------------------------------
+    def run(self) -> dict:
+        pcfg = load_guesser(self.cfg)
+        queue = PcfgQueue(pcfg=pcfg)
+        outputs = [open_output(p, self.level) for p in self.paths]
+        self.worker.start()
+        start = time.perf_counter()
+
+        dispatched = 0                              # 제출한 추측 수 (다음 묶음의 전역 시작 번호)
+        next_seq = submit_seq = 0
+        pending = {}                                # 순번 → 샤드별 bytes (앞 순번을 기다리는 결과)
+        # 워커가 쉬지 않도록 코어 수의 두 배까지 미리 제출 (대기 결과 메모리와의 절충)
+        window = self.cores * 2
+        try:
+            while self.written < self.count and (queue or self.worker.inflight or pending):
+                while len(self.worker.inflight) + len(pending) < window and dispatched < self.count:
+                    with self.perf.timer("dispatch"):
+                        nodes, limits = self._next_batch(queue, pcfg, self.count - dispatched)
+                    if not nodes:
+                        break
+                    self.worker.submit_export(nodes, limits, submit_seq, dispatched, self.shards)
+                    dispatched += sum(limits)
+                    submit_seq += 1
+
+                for _, (seq, blobs), stats in self.worker.collect():
+                    self.perf.record_worker(stats)
+                    pending[seq] = (blobs, stats["guesses"])
+
+                # 확률 순서를 지키기 위해 순번이 이어지는 결과만 기록
+                while next_seq in pending:
+                    blobs, guesses = pending.pop(next_seq)
+                    for out, blob in zip(outputs, blobs):
+                        out.write(blob)
+                        self.bytes += len(blob)
+                    self.written += guesses
+                    next_seq += 1
+        finally:
+            self.exit_evt.set()
+            self.worker.cancel_all()
+            self.worker.shutdown(wait=True)
+            for out in outputs:
+                out.close()
+
+        elapsed = time.perf_counter() - start
+        return {
+            "paths": self.paths,
+            "guesses": self.written,
+            "bytes": self.bytes,
+            "compressed_bytes": sum(os.path.getsize(p) for p in self.paths),
+            "elapsed": elapsed,
+            "guesses_per_sec": self.written / elapsed if elapsed > 0 else 0.0,
+            "nodes": self.nodes,
+            "batches": self.perf.nodes_expanded,
+        }
+
+    #----------------------------------------------------------------------------------
+    # 다음 작업 묶음: 후보 수 합이 BATCH_GUESSES 이상이 될 때까지 노드를 꺼내고 자식을 큐에 추가
+    # 노드 하나에 IPC 한 번이면 작은 노드가 많은 구간에서 워커가 대부분 대기하므로 묶어서 보냄
+    #----------------------------------------------------------------------------------
+    def _next_batch(self, queue, pcfg, remaining: int):
+        nodes, limits, total = [], [], 0
+        while total < min(BATCH_GUESSES, remaining):
+            node = queue.pop()
+            if node is None:
+                break
+            for child in pcfg.find_children(node):
+                queue.push(child)
+                self.perf.children_pushed += 1
+            self.nodes += 1
+            limit = min(node.total_candidate, remaining - total)
+            nodes.append(node)
+            limits.append(limit)
+            total += limit
+        return nodes, limits
+
+    #----------------------------------------------------------------------------------
+    # 결과 요약 문자열
+    #----------------------------------------------------------------------------------
+    @staticmethod
+    def format(result: dict) -> str:
+        ratio = result["compressed_bytes"] / result["bytes"] * 100 if result["bytes"] else 0.0
+        lines = [
+            f"Exported {result['guesses']:,} guesses in {result['elapsed']:.2f}s "
+            f"({result['guesses_per_sec']:,.0f} guesses/s, {result['nodes']:,} nodes in {result['batches']:,} batches)",
+            f"{result['bytes']:,} bytes → {result['compressed_bytes']:,} bytes on disk ({ratio:.1f}%)",
+        ]
+        lines += [f"  {p}" for p in result["paths"]]
+        return "\n".join(lines)
@@ -0,0 +1,121 @@
+import os
+import time
+from concurrent.futures import wait
+from multiprocessing import Manager, Queue
+
+from pcfg_lib.guess.pcfg.ensemble import load_guesser
+from pcfg_lib.guess.util.metrics import SessionMetrics
+from pcfg_lib.guess.util.priority_queue import PcfgQueue
+from pcfg_lib.guess.util.worker_manage import WorkerManager
+
+
+#=======================================================================================================
+#                         순수 생성 처리량 측정 (해시 / TUI 없이 실제 파이프라인 실행)
+#=======================================================================================================
+class GenerationBenchmark:
+    #----------------------------------------------------------------------------------
+    # 초기화: 생성 전용 워커 풀과 지표 수집기
+    # config: 설정 딕셔너리 (core, pw_min, pw_max, attack_mode 등)
+    # limit: 생성할 비밀번호 수 (노드 단위로 제출하므로 약간 넘을 수 있음)
+    #----------------------------------------------------------------------------------
+    def __init__(self, config: dict, limit: int):
+        self.cfg = dict(config, generate_only=True)
+        self.limit = limit
+        self.cores = self.cfg.get("core", 4)
+        mgr = Manager()
+        self.exit_evt = mgr.Event()
+        self.worker = WorkerManager(self.cfg, Queue(), self.exit_evt, set())
+        self.perf = SessionMetrics(self.cfg)
+
+        self.generated = 0                          # 워커가 생성한 비밀번호 수
+        self.dispatched = 0                         # 제출한 노드들의 후보 수 합계
+        self.queue_max = 0                          # 최대 큐 깊이
+
+    #----------------------------------------------------------------------------------
+    # 실행: 처음 limit 개 추측을 생성하고 결과 딕셔너리 반환
+    #----------------------------------------------------------------------------------
+    def run(self) -> dict:
+        queue = PcfgQueue(pcfg=load_guesser(self.cfg))
+        self.worker.start()
+        # 풀 기동 / 워커 문법 로딩 비용은 측정에서 제외
+        wait([self.worker.pool.submit(os.getpid) for _ in range(self.cores)])
+        wall0, cpu0 = time.perf_counter(), time.process_time()
+        self.perf.start = wall0
+
+        while self.generated < self.limit and (queue or self.worker.inflight):
+            while len(self.worker.inflight) < self.cores and self.dispatched < self.limit:
+                node = queue.pop()
+                if node is None:
+                    break
+                self.dispatched += node.total_candidate
+                self.worker.submit(node)
+
+            for children, _, stats in self.worker.collect():
+                self.perf.record_worker(stats)
+                self.generated += stats["guesses"]
+                for child in children:
+                    queue.push(child)
+                    self.perf.children_pushed += 1
+            self.queue_max = max(self.queue_max, len(queue))
+
+        wall = time.perf_counter() - wall0
+        cpu = time.process_time() - cpu0
+        coordinator = self.perf.coordinator_stats(len(queue))
+        self.exit_evt.set()
+        self.worker.cancel_all()
+        self.worker.shutdown(wait=True)
+
+        workers = self.perf.workers()
+        nodes = coordinator["nodes_expanded"]
+        return {
+            "guesses": self.generated,
+            "elapsed": wall,
+            "guesses_per_sec": self.generated / wall if wall > 0 else 0.0,
+            "coordinator_cpu_seconds": cpu,
+            "coordinator_cpu_share": cpu / wall if wall > 0 else 0.0,
+            "workers": {
+                pid: {
+                    "nodes": w["nodes"],
+                    "guesses": w["guesses"],
+                    "busy_rate": w["rate"],
+                    "wall_rate": w["guesses"] / wall if wall > 0 else 0.0,
+                    "utilization": w["busy"] / wall if wall > 0 else 0.0,
+                }
+                for pid, w in workers.items()
+            },
+            "nodes": {
+                "expanded": nodes,
+                "per_sec": nodes / wall if wall > 0 else 0.0,
+                "size_avg": self.generated / nodes if nodes else 0.0,
+                "size_max": max((w["node_size_max"] for w in workers.values()), default=0),
+                "children_pushed": coordinator["children_pushed"],
+                "find_children_seconds": coordinator["find_children_seconds"],
+                "queue_max": self.queue_max,
+                "queue_final": len(queue),
+            },
+        }
+
+    #----------------------------------------------------------------------------------
+    # 결과 요약 문자열
+    #----------------------------------------------------------------------------------
+    @staticmethod
+    def format(result: dict) -> str:
+        nodes = result["nodes"]
+        lines = [
+            f"Generated {result['guesses']:,} guesses in {result['elapsed']:.2f}s "
+            f"({result['guesses_per_sec']:,.0f} guesses/s)",
+            f"Coordinator CPU: {result['coordinator_cpu_seconds']:.2f}s "
+            f"({result['coordinator_cpu_share'] * 100:.1f}% of one core)",
+            f"Nodes: {nodes['expanded']:,} expanded ({nodes['per_sec']:,.0f}/s), "
+            f"avg size {nodes['size_avg']:,.1f}, max size {nodes['size_max']:,}, "
+            f"find_children {nodes['find_children_seconds']:.3f}s, "
+            f"queue max {nodes['queue_max']:,} / final {nodes['queue_final']:,}",
+            "",
+            f"{'worker':>8} {'nodes':>8} {'guesses':>12} {'busy g/s':>12} {'wall g/s':>12} {'util':>6}",
+        ]
+        for pid, w in sorted(result["workers"].items()):
+            lines.append(
+                f"{pid:>8} {w['nodes']:>8,} {w['guesses']:>12,} {w['busy_rate']:>12,.0f} "
+                f"{w['wall_rate']:>12,.0f} {w['utilization'] * 100:>5.1f}%"
+            )
+        return "\n".join(lines)
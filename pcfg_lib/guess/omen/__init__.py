@@ -1,6 +1,32 @@
 # Auto-generated __init__.py
+# Submodules are imported lazily on first attribute access.
 
-from .guess_structure import *
-from .markov_guesser import *
-from .memorizer import *
-from .omen_io import *
+import importlib
+
+_SUBMODULES = ['guess_structure', 'markov_guesser', 'memorizer', 'omen_io']
+
+_LAZY_ATTRS = {
+    'GuessStructure': 'guess_structure',
+    'MarkovGuesser': 'markov_guesser',
+    'Memorizer': 'memorizer',
+    'count_omen_keyspace': 'omen_io',
+    'load_omen_prob': 'omen_io',
+    'load_omen_rules': 'omen_io',
+    'restrict_omen_lengths': 'omen_io',
+}
+
+__all__ = sorted(set(_SUBMODULES) | set(_LAZY_ATTRS))
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return __all__
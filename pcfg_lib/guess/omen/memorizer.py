@@ -1,21 +1,27 @@
 class Memorizer:
-    def __init__(self, max_length):
-        self.max_length = max_length
-        self.tmto_lookup = [dict() for _ in range(self.max_length + 1)]
+    """
+    OMEN 생성기들이 공유하는 CP 연결 수 캐시.
+    (IP, 남은 CP 길이, 남은 레벨) 에서 레벨 합이 정확히 맞는 CP 연결 수를 저장해
+    GuessStructure 가 막다른 가지로 내려가지 않게 하고, 길이 제한 후 키스페이스 재계산에도 씁니다.
+    """
+    def __init__(self):
+        self.count_lookup = {}
 
-    def lookup(self, ip_ngram, length, target_level):
-        try:
-            return True, self.copy(self.tmto_lookup[length][ip_ngram][target_level])
-        except KeyError:
-            return False, None
+    def count(self, cp, ip, length, target_level):
+        key = (ip, length, target_level)
+        found = self.count_lookup.get(key)
+        if found is None:
+            options = cp.get(ip, {})
+            if length == 1:
+                found = len(options.get(target_level, ()))
+            else:
+                found = sum(
+                    self.count(cp, ip[1:] + ch, length - 1, target_level - level)
+                    for level, chars in options.items() if level <= target_level
+                    for ch in chars
+                )
+            self.count_lookup[key] = found
+        return found
 
-    def update(self, ip_ngram, length, target_level, parse_tree):
-        if ip_ngram not in self.tmto_lookup[length]:
-            self.tmto_lookup[length][ip_ngram] = {}
-
-        self.tmto_lookup[length][ip_ngram][target_level] = self.copy(parse_tree)
-
-    def copy(self, input_list):
-        if input_list:
-            return [x[:] for x in input_list]
-        return None
+    def reachable(self, cp, ip, length, target_level):
+        return self.count(cp, ip, length, target_level) > 0
@@ -44,12 +44,17 @@ def load_omen_rules(db_path):
         prefix, ch = token[:-1], token[-1]
         grammar["cp"].setdefault(prefix, {}).setdefault(level, []).append(ch)
 
+    # LengthLevel 의 idx 번째 행 = 비밀번호 길이 idx + 1 (학습 시 ln_lookup 과 키스페이스 계산과 같은 기준)
+    # 생성기는 IP(ngram - 1 글자) 뒤에 붙일 CP 개수로 다루므로 길이 - ngram + 1 로 저장,
+    # 키스페이스와 같이 ngram 이하 길이는 생성하지 않음
     ln_rows = [r[0] for r in c.execute("SELECT level FROM LengthLevel ORDER BY rowid")]
-    min_size = grammar["ngram"]
+    ngram = grammar["ngram"]
     grammar["ln"] = {i: [] for i in range(max_level + 1)}
-    for idx, cp_count in enumerate(ln_rows):
-        length = idx + min_size
-        grammar["ln"][cp_count].append(length)
+    for idx, ln_level in enumerate(ln_rows):
+        length = idx + 1
+        if length <= ngram:
+            continue
+        grammar["ln"].setdefault(ln_level, []).append(length - ngram + 1)
 
     omen_keyspace = {
         level: keyspace
@@ -68,14 +73,59 @@ def load_omen_rules(db_path):
     conn.close()
     return grammar
 
-def load_omen_prob(dbpath,grammar):
+def load_omen_prob(dbpath, grammar, omen_keyspace):
+    """
+    OMEN 레벨별 확률을 grammar["M"] 에 다른 심볼과 같은 형태로 등록합니다.
+    확률 내림차순의 빈틈없는 목록이고, LENGTHS 는 그 레벨의 키스페이스(실제 생성 추측 수)라서
+    노드의 total_candidate 가 생성 예산 / 내보내기 묶음 계산에 그대로 쓰입니다.
+    확률이 0 이거나 키스페이스가 없는 레벨은 생성할 것이 없으므로 제외.
+    """
     from pcfg_lib.guess.pcfg.pcfg_guesser import Type
     conn = sqlite3.connect(dbpath)
     curser = conn.cursor()
 
     curser.execute("SELECT level, probability FROM PcfgOmenProb")
-    data = {}
-    for level, prob in curser.fetchall():
-        data[level] = {Type.PROB: prob, Type.TERMINALS:[level]}
+    rows = sorted(
+        ((level, prob) for level, prob in curser.fetchall()
+         if prob > 0 and omen_keyspace.get(level, 0) > 0),
+        key=lambda row: (-row[1], row[0])
+    )
+    conn.close()
 
-    grammar["M"] = data
\ No newline at end of file
+    grammar["M"] = [
+        {Type.PROB: prob, Type.TERMINALS: [level], Type.LENGTHS: omen_keyspace[level]}
+        for level, prob in rows
+    ]
+
+def restrict_omen_lengths(grammar, memorizer, min_length=None, max_length=None):
+    # 생성 길이 = IP 길이(ngram - 1) + CP 개수 이므로, 범위를 벗어나는 길이 레벨 항목을 제거
+    # 제거된 길이가 있으면 DB 의 키스페이스는 실제 생성 수보다 커지므로 남은 길이로 다시 계산
+    ip_length = grammar["ngram"] - 1
+    removed = False
+    for level, lengths in grammar["ln"].items():
+        kept = [
+            cp_length for cp_length in lengths
+            if (min_length is None or ip_length + cp_length >= min_length)
+            and (max_length is None or ip_length + cp_length <= max_length)
+        ]
+        removed = removed or len(kept) != len(lengths)
+        grammar["ln"][level] = kept
+    if removed:
+        grammar["omen_keyspace"] = {
+            level: count_omen_keyspace(grammar, memorizer, level)
+            for level in grammar["omen_keyspace"]
+        }
+    return any(grammar["ln"].values())
+
+def count_omen_keyspace(grammar, memorizer, level):
+    # 길이 레벨 + IP 레벨 + CP 레벨 합이 정확히 level 인 추측 수 (MarkovGuesser 가 생성하는 수와 같음)
+    total = 0
+    for ln_level, cp_lengths in grammar["ln"].items():
+        for ip_level, starts in grammar["ip"].items():
+            remaining = level - ln_level - ip_level
+            if remaining < 0:
+                continue
+            for cp_length in cp_lengths:
+                for start in starts:
+                    total += memorizer.count(grammar["cp"], start, cp_length, remaining)
+    return total
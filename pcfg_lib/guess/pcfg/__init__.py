@@ -1,4 +1,39 @@
 # Auto-generated __init__.py
+# Submodules are imported lazily on first attribute access.
 
-from .pcfg_guesser import *
-from .pcfg_io import *
+import importlib
+
+_SUBMODULES = ['ensemble', 'overlay', 'pcfg_guesser', 'pcfg_io', 'strength_estimator']
+
+_LAZY_ATTRS = {
+    'EnsembleGuesser': 'ensemble',
+    'OMEN_PREFIX': 'ensemble',
+    'OVERLAY_SYMBOLS': 'overlay',
+    'PCFGGuesser': 'pcfg_guesser',
+    'StrengthEstimator': 'strength_estimator',
+    'Structure': 'pcfg_guesser',
+    'TreeItem': 'pcfg_guesser',
+    'Type': 'pcfg_guesser',
+    'apply_overlay': 'overlay',
+    'load_guesser': 'ensemble',
+    'load_overlay': 'overlay',
+    'load_pcfg_grammar': 'pcfg_io',
+    'model_config': 'ensemble',
+    'parse_model_spec': 'ensemble',
+}
+
+__all__ = sorted(set(_SUBMODULES) | set(_LAZY_ATTRS))
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return __all__
@@ -0,0 +1,72 @@
+import math
+from typing import Generator, List
+
+from pcfg_lib.guess.pcfg.pcfg_guesser import PCFGGuesser, Structure, TreeItem
+
+OMEN_PREFIX = "omen:"
+
+
+def parse_model_spec(spec: str) -> tuple[str, float]:
+    """'PATH[@WEIGHT]' → (PATH, WEIGHT). PATH 앞에 omen: 을 붙이면 OMEN(Markov) 모델"""
+    path, sep, weight = spec.rpartition("@")
+    if not sep:
+        return spec, 1.0
+    return path, float(weight)
+
+
+def model_config(config: dict, path: str) -> dict:
+    """앙상블 구성 모델 하나의 PCFGGuesser 설정 (나머지 설정은 세션과 공유)"""
+    if path.startswith(OMEN_PREFIX):
+        return dict(config, attack_mode=1, omen_db=path[len(OMEN_PREFIX):])
+    return dict(config, grammar_db=path)
+
+
+def load_guesser(config: dict):
+    """config["grammars"] 가 있으면 EnsembleGuesser, 없으면 기존 단일 PCFGGuesser"""
+    if config.get("grammars"):
+        return EnsembleGuesser(config)
+    return PCFGGuesser(config=config)
+
+
+#=======================================================================================================
+#                      여러 학습 모델을 하나의 확률 순서로 합치는 앙상블 생성기
+#=======================================================================================================
+class EnsembleGuesser:
+    #----------------------------------------------------------------------------------
+    # 초기화: 모델별 PCFGGuesser 와 정규화된 가중치
+    # config["grammars"]: [(경로, 가중치), ...] — 경로가 omen: 으로 시작하면 OMEN 모델
+    # 모델 i 의 구조 확률은 P_i(구조) × w_i / Σw 로 재가중되어 한 PcfgQueue 에서 경쟁하고,
+    # 각 노드는 TreeItem.model 에 출처 모델 번호를 가지고 다님
+    #----------------------------------------------------------------------------------
+    def __init__(self, config: dict):
+        specs = config["grammars"]
+        total = sum(weight for _, weight in specs)
+        self.names = [path for path, _ in specs]
+        self.weights = [weight / total for _, weight in specs]
+        self.models = [PCFGGuesser(config=model_config(config, path)) for path in self.names]
+
+    @property
+    def is_exit(self) -> bool:
+        return any(m.is_exit for m in self.models)
+
+    @is_exit.setter
+    def is_exit(self, value: bool):
+        for m in self.models:
+            m.is_exit = value
+
+    def initialize_base_structures(self) -> List[TreeItem]:
+        items: List[TreeItem] = []
+        for i, (model, weight) in enumerate(zip(self.models, self.weights)):
+            for node in model.initialize_base_structures():
+                # 가중치를 base_prob 에 접어 넣으면 자식 노드 확률에도 그대로 전파됨
+                node.model = i
+                node.base_prob *= weight
+                node.prob += math.log(weight)
+                items.append(node)
+        return items
+
+    def find_children(self, parent: TreeItem) -> List[TreeItem]:
+        return self.models[parent.model].find_children(parent)
+
+    def guess(self, structures: List[Structure], model: int = 0) -> Generator[str, None, None]:
+        return self.models[model].guess(structures)
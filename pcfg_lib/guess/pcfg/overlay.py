@@ -0,0 +1,113 @@
+import re
+
+# 오버레이로 주입할 수 있는 터미널 그룹 (알파벳, 숫자, 한글, 연도)
+OVERLAY_SYMBOLS = ("A", "D", "H", "Y")
+
+_RUN = re.compile(r"[A-Za-z]+|[0-9]+|[가-힣]+")
+_YEAR = re.compile(r"(19|20)[0-9]{2}")
+
+
+#=======================================================================================================
+#                     표적 공격용 오버레이: 재학습 없이 로드된 문법에 개인 토큰 주입
+#=======================================================================================================
+def _classify(token: str) -> list[tuple[str, str]]:
+    """토큰 → [(심볼, 터미널)]. 'minsu1990' 처럼 섞인 토큰은 문자/숫자 구간별로 나눠 주입"""
+    entries = []
+    for run in _RUN.findall(token):
+        if run.isdigit():
+            entries.append((f"D{len(run)}", run))
+            if _YEAR.fullmatch(run):
+                entries.append(("Y1", run))
+        elif run.isascii():
+            # 대소문자는 Capitalization(C) 마스크가 담당하므로 소문자로 저장
+            entries.append((f"A{len(run)}", run.lower()))
+        else:
+            # 한글은 학습 데이터와 같이 두벌식 키 입력으로 변환 (필요할 때만 학습 모듈 로드)
+            from pcfg_lib.training.util.korean import hangul2dubeol
+            typed = hangul2dubeol(run)
+            entries.append((f"H{len(typed)}", typed))
+    return entries
+
+
+def load_overlay(path: str, encoding: str = "utf-8") -> list[tuple[str, str, float]]:
+    """
+    오버레이 파일을 (심볼, 터미널, 가중치) 목록으로 로드합니다.
+    한 줄에 `토큰 [가중치]`, 가중치 생략 시 1.0, # 으로 시작하면 주석.
+    `A:minsu`, `H:rlaalstn` 처럼 그룹을 직접 지정하면 분리 / 변환 없이 그대로 주입.
+    """
+    entries = []
+    with open(path, encoding=encoding) as f:
+        for lineno, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            parts = line.split()
+            weight = 1.0
+            if len(parts) > 1:
+                try:
+                    weight = float(parts[-1])
+                except ValueError:
+                    raise ValueError(f"{path}:{lineno}: invalid weight {parts[-1]!r}")
+                if weight <= 0:
+                    raise ValueError(f"{path}:{lineno}: weight must be > 0")
+            token = parts[0]
+            prefix, sep, rest = token.partition(":")
+            if sep and prefix in OVERLAY_SYMBOLS and rest:
+                symbol = "Y1" if prefix == "Y" else f"{prefix}{len(rest)}"
+                entries.append((symbol, rest, weight))
+            else:
+                entries.extend((symbol, term, weight) for symbol, term in _classify(token))
+    return entries
+
+
+def apply_overlay(grammar: dict, entries: list[tuple[str, str, float]]) -> list[str]:
+    """
+    오버레이 항목을 로드된 문법에 반영하고 변경된 심볼 목록을 반환합니다.
+    터미널 확률 = 해당 심볼의 최고 확률 × 가중치 (이미 더 높으면 유지),
+    변경된 심볼만 합이 1 이 되도록 재정규화 후 확률 그룹을 다시 정렬합니다.
+    문법에 없던 길이의 심볼은 새로 만들지만, 그 심볼을 쓰는 기본 구조가 없으면 생성되지 않습니다.
+    """
+    from pcfg_lib.guess.pcfg.pcfg_guesser import Type
+
+    by_symbol = {}
+    for symbol, term, weight in entries:
+        terms = by_symbol.setdefault(symbol, {})
+        terms[term] = max(weight, terms.get(term, 0.0))
+
+    for symbol, terms in by_symbol.items():
+        groups = grammar.get(symbol)
+        if not groups:
+            # 새 심볼: 가중치 비율대로 확률 배분
+            total = sum(terms.values())
+            probs = {term: weight / total for term, weight in terms.items()}
+            removed = 0.0
+            groups = []
+        else:
+            top = max(g[Type.PROB] for g in groups)
+            probs = {term: top * weight for term, weight in terms.items()}
+            # 기존 터미널은 원래 그룹에서 빼고 (더 높은 쪽) 새 확률로 다시 넣음
+            removed = 0.0
+            for g in groups:
+                hits = [t for t in g[Type.TERMINALS] if t in probs]
+                if not hits:
+                    continue
+                g[Type.TERMINALS] = [t for t in g[Type.TERMINALS] if t not in probs]
+                for t in hits:
+                    probs[t] = max(probs[t], g[Type.PROB])
+                removed += g[Type.PROB] * len(hits)
+
+        # 재정규화: 기존 그룹은 같은 비율로 줄어들어 상대 순서가 유지됨
+        # (새 심볼은 probs 합이 이미 1 이므로 그대로 사용)
+        scale = 1.0 / (1.0 - removed + sum(probs.values())) if groups else 1.0
+        merged = {}
+        for g in groups:
+            if g[Type.TERMINALS]:
+                merged.setdefault(g[Type.PROB] * scale, []).extend(g[Type.TERMINALS])
+        for term, prob in probs.items():
+            merged.setdefault(prob * scale, []).append(term)
+
+        grammar[symbol] = [
+            {Type.TERMINALS: values, Type.PROB: prob, Type.LENGTHS: len(values)}
+            for prob, values in sorted(merged.items(), key=lambda kv: kv[0], reverse=True)
+        ]
+    return list(by_symbol)
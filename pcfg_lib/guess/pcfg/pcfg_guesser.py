@@ -8,8 +8,9 @@ from typing import Generator, List
 import pcfg_lib.paths
 from pcfg_lib import paths
 from pcfg_lib.guess.omen.markov_guesser import MarkovGuesser
-from pcfg_lib.guess.omen.omen_io import load_omen_rules, load_omen_prob
+from pcfg_lib.guess.omen.omen_io import load_omen_rules, load_omen_prob, restrict_omen_lengths
 from pcfg_lib.guess.omen.memorizer import Memorizer
+from pcfg_lib.guess.pcfg.overlay import apply_overlay, load_overlay
 from pcfg_lib.guess.pcfg.pcfg_io import load_pcfg_grammar
 
 
@@ -51,6 +52,7 @@ class TreeItem:
         self.structures: List[Structure] = []
         self.prob: float = 0.0
         self.total_candidate = 0
+        self.model: int = 0                 # 앙상블에서 이 노드를 만든 모델 번호
 
 
 # =====================
@@ -59,19 +61,35 @@ class TreeItem:
 class PCFGGuesser:
     def __init__(self, config):
         self.log = config.get("log", False)
-        # PCFG 문법 로드
+        # 생성할 비밀번호 길이 범위 (None 이면 제한 없음)
+        self.pw_min = config.get("pw_min")
+        self.pw_max = config.get("pw_max")
+        # PCFG 문법 로드 (grammar_db / omen_db 로 다른 DB 지정 가능)
         self.grammar, self.base_structure = load_pcfg_grammar(
-            db_path=os.path.join(paths.DATA_PATH, "sqlite3.db")
+            db_path=config.get("grammar_db") or os.path.join(paths.DATA_PATH, "sqlite3.db")
         )
-        self.omen_optimizer = Memorizer(max_length=4)
+        # 표적 공격 오버레이: 개인 토큰을 터미널 그룹에 주입 (변경된 심볼만 재계산)
+        if config.get("overlay"):
+            changed = apply_overlay(self.grammar, load_overlay(config["overlay"]))
+            if self.log:
+                print(f"[PCFGGuesser] Overlay updated {len(changed)} symbols: {', '.join(changed)}")
+        self.omen_optimizer = Memorizer()
         # Markov only 모드
         if config.get("attack_mode",0) == 1:
-            self.omen_grammar = load_omen_rules(db_path=paths.KOREAN_DICT_DB_PATH)
+            omen_db = config.get("omen_db") or paths.KOREAN_DICT_DB_PATH
+            self.omen_grammar = load_omen_rules(db_path=omen_db)
+            # 길이 범위 밖 OMEN 길이를 먼저 제거해야 M 항목의 키스페이스가 실제 생성 수와 같아짐
+            has_lengths = restrict_omen_lengths(self.omen_grammar, self.omen_optimizer, self.pw_min, self.pw_max)
             load_omen_prob(
-                dbpath=paths.KOREAN_DICT_DB_PATH,
-                grammar=self.grammar
+                dbpath=omen_db,
+                grammar=self.grammar,
+                omen_keyspace=self.omen_grammar["omen_keyspace"]
             )
-            self.base_structure = [{Type.PROB: 1.0, Type.REPLACEMENTS: ["M"]}]
+            if has_lengths and self.grammar["M"]:
+                self.base_structure = [{Type.PROB: 1.0, Type.REPLACEMENTS: ["M"]}]
+            else:
+                # 길이 범위에 해당하는 OMEN 길이 레벨이 없거나 생성할 레벨이 없으면 생성할 구조도 없음
+                self.base_structure = []
         if self.log:
             print("[PCFGGuesser] Loaded grammar entries:")
             for lbl, ents in self.grammar.items(): print(lbl, ents)
@@ -82,16 +100,46 @@ class PCFGGuesser:
     def initialize_base_structures(self) -> List[TreeItem]:
         items: List[TreeItem] = []
         for entry in self.base_structure:
+            # 길이 정책을 만족할 수 없는 구조는 큐에 넣기 전에 제거
+            if not self._is_length_allowed(entry[Type.REPLACEMENTS]):
+                continue
             node = TreeItem()
             node.base_prob = float(entry[Type.PROB])
             for sym in entry[Type.REPLACEMENTS]:
-                idx = 1 if sym == "M" else 0
-                node.structures.append(Structure(sym, idx,0,self.grammar[sym][idx][Type.LENGTHS]))
+                node.structures.append(Structure(sym, 0,0,self.grammar[sym][0][Type.LENGTHS]))
             node.prob = self._calc_prob(node.structures, node.base_prob)
             node.total_candidate = self._calc_total_candidate(node)
             items.append(node)
         return items
 
+    @staticmethod
+    def symbol_length(sym: str) -> int | None:
+        """심볼이 만들어내는 문자열 길이 (C 는 길이 변화 없음, M 은 가변이라 None)"""
+        cat = sym[0]
+        if cat == 'C':
+            return 0
+        if cat == 'M':
+            return None
+        if cat == 'Y':
+            return 4
+        return int(sym[1:])
+
+    def _is_length_allowed(self, replacements: List[str]) -> bool:
+        if self.pw_min is None and self.pw_max is None:
+            return True
+        total = 0
+        for sym in replacements:
+            length = self.symbol_length(sym)
+            # 가변 길이(Markov)는 OMEN 길이 레벨에서 따로 제한
+            if length is None:
+                return True
+            total += length
+        if self.pw_min is not None and total < self.pw_min:
+            return False
+        if self.pw_max is not None and total > self.pw_max:
+            return False
+        return True
+
     def _calc_prob(self, structures: List[Structure], base_prob: float) -> float:
         # log 확률 합산
         total = math.log(base_prob)
@@ -118,6 +166,7 @@ class PCFGGuesser:
             if self._is_valid_child(new_structs, parent.base_prob, pos, parent_prob):
                 node = TreeItem()
                 node.base_prob = parent.base_prob
+                node.model = parent.model
                 node.structures = new_structs
                 node.prob = self._calc_prob(new_structs, parent.base_prob)
                 node.total_candidate = self._calc_total_candidate(node)
@@ -159,8 +208,8 @@ class PCFGGuesser:
 
         return splited_structures
 
-    def guess(self, structures: List[Structure]) -> Generator[str, None, None]:
-        """패스워드 제너레이터: 하나씩 yield"""
+    def guess(self, structures: List[Structure], model: int = 0) -> Generator[str, None, None]:
+        """패스워드 제너레이터: 하나씩 yield (model 은 EnsembleGuesser 와 같은 호출 형태를 위한 것, 단일 문법은 무시)"""
         self.made_password = 0
         yield from self._recursive_gen("", structures)
 
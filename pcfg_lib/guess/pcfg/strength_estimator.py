@@ -0,0 +1,243 @@
+# strength_estimator.py
+import bisect
+import math
+import os
+import random
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pcfg_lib import paths
+from pcfg_lib.guess.pcfg.pcfg_io import load_pcfg_grammar
+from pcfg_lib.guess.pcfg.pcfg_guesser import Type
+
+# 대소문자 마스크(C)가 뒤따르는 심볼 분류
+_MASKED = ('A', 'H')
+# 파서 카운터가 무한히 커지지 않도록 재생성하는 주기
+_PARSER_RESET = 10_000
+
+
+# =====================
+# StrengthEstimator: 비밀번호 확률 및 추측 순위 추정기
+# =====================
+class StrengthEstimator:
+    """
+    학습된 PCFG 문법으로 비밀번호의 확률과 추정 추측 순위(guess number)를 계산합니다.
+
+    추측 순위는 Dell'Amico–Filippone 몬테카를로 방식으로 추정합니다.
+    문법에서 n개의 비밀번호를 확률에 비례해 샘플링한 뒤 확률 내림차순으로 정렬하고,
+    p_i 보다 확률이 높은 샘플들의 1 / (n * p_i) 누적합을 미리 계산해 둡니다.
+    이후 점수 계산은 이 테이블에 대한 이진 탐색 한 번입니다.
+    """
+
+    def __init__(self, grammar, base_structure, sample_size: int = 100_000, seed: Optional[int] = None):
+        self.grammar = grammar
+        self.sample_size = sample_size
+        # 기본 구조 → 확률 (C 심볼이 삽입된 형태)
+        self.base_lookup: Dict[Tuple[str, ...], float] = {
+            tuple(entry[Type.REPLACEMENTS]): float(entry[Type.PROB]) for entry in base_structure
+        }
+        # 심볼 → {터미널: 확률}
+        self.terminal_lookup = self._build_terminal_lookup(grammar)
+        # 확률 내림차순 샘플의 -log 확률과 누적 추측 순위
+        self._neg_log_probs, self._guess_numbers = self._build_sample_table(sample_size, seed)
+        self._local = threading.local()
+
+    @classmethod
+    def from_db(cls, db_path=None, **kwargs) -> "StrengthEstimator":
+        grammar, base_structure = load_pcfg_grammar(
+            db_path=db_path or os.path.join(paths.DATA_PATH, "sqlite3.db")
+        )
+        return cls(grammar, base_structure, **kwargs)
+
+    def __getstate__(self):
+        # 스레드 로컬 파서는 프로세스 간에 옮기지 않음
+        state = self.__dict__.copy()
+        del state["_local"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    # =====================
+    # 테이블 구성
+    # =====================
+    @staticmethod
+    def _build_terminal_lookup(grammar) -> Dict[str, Dict[str, float]]:
+        lookup = {}
+        for sym, groups in grammar.items():
+            if sym[0] == 'M':
+                continue
+            table = {}
+            for group in groups:
+                for term in group[Type.TERMINALS]:
+                    # A/H 는 C 마스크가 대소문자를 결정하므로 소문자 기준으로 찾음
+                    key = term.lower() if sym[0] in _MASKED else term
+                    if key not in table:
+                        table[key] = group[Type.PROB]
+            lookup[sym] = table
+        return lookup
+
+    def _build_sample_table(self, sample_size: int, seed: Optional[int]):
+        rng = random.Random(seed)
+
+        # 문법에 모든 심볼이 있는 구조만 샘플링 대상 (Markov 제외)
+        structures, weights = [], []
+        for replacements, prob in self.base_lookup.items():
+            if all(sym in self.grammar and sym[0] != 'M' for sym in replacements):
+                structures.append(replacements)
+                weights.append(prob)
+        if not structures or sample_size <= 0:
+            return [], [0.0]
+
+        # 심볼별 그룹 선택용 누적 가중치 (그룹 질량 = 터미널 확률 × 터미널 수)
+        group_cum = {}
+        for replacements in structures:
+            for sym in replacements:
+                if sym in group_cum:
+                    continue
+                cum, acc = [], 0.0
+                for group in self.grammar[sym]:
+                    acc += group[Type.PROB] * group[Type.LENGTHS]
+                    cum.append(acc)
+                group_cum[sym] = cum
+
+        base_cum, acc = [], 0.0
+        for w in weights:
+            acc += w
+            base_cum.append(acc)
+
+        log_probs = []
+        for _ in range(sample_size):
+            k = bisect.bisect_left(base_cum, rng.random() * base_cum[-1])
+            replacements = structures[min(k, len(structures) - 1)]
+            total = math.log(self.base_lookup[replacements])
+            for sym in replacements:
+                cum = group_cum[sym]
+                g = bisect.bisect_left(cum, rng.random() * cum[-1])
+                total += math.log(self.grammar[sym][min(g, len(cum) - 1)][Type.PROB])
+            log_probs.append(total)
+
+        log_probs.sort(reverse=True)
+        neg_log_probs = [-lp for lp in log_probs]
+        guess_numbers = [0.0]
+        acc = 0.0
+        for lp in log_probs:
+            try:
+                acc += math.exp(-lp) / sample_size
+            except OverflowError:
+                acc = math.inf
+            guess_numbers.append(acc)
+        return neg_log_probs, guess_numbers
+
+    # =====================
+    # 확률 계산
+    # =====================
+    def _parse(self, password: str):
+        from pcfg_lib.training.pcfg.pcfg_parser import PCFGParser
+        from pcfg_lib.training.pcfg.word_counter import WordCounter
+
+        local = self._local
+        if getattr(local, "parser", None) is None or local.parsed >= _PARSER_RESET:
+            local.parser = PCFGParser(WordCounter(needed_appear=1))
+            local.parsed = 0
+        local.parsed += 1
+        for section in local.parser.parse(password):
+            return section
+        return []
+
+    def log_prob(self, password: str) -> float:
+        """학습 파서로 분해한 구조와 터미널의 log 확률 합 (생성 불가능하면 -inf)"""
+        section = self._parse(password)
+        replacements = []
+        total = 0.0
+        for text, label in section:
+            if label is None:
+                return -math.inf
+            table = self.terminal_lookup.get(label)
+            key = text.lower() if label[0] in _MASKED else text
+            if table is None or key not in table:
+                return -math.inf
+            total += math.log(table[key])
+            replacements.append(label)
+            if label[0] in _MASKED:
+                mask_sym = 'C' + label[1:]
+                mask = ''.join('U' if c.isupper() else 'L' for c in text)
+                mask_prob = self.terminal_lookup.get(mask_sym, {}).get(mask)
+                if mask_prob is None:
+                    return -math.inf
+                total += math.log(mask_prob)
+                replacements.append(mask_sym)
+
+        base_prob = self.base_lookup.get(tuple(replacements))
+        if not base_prob:
+            return -math.inf
+        return total + math.log(base_prob)
+
+    def probability(self, password: str) -> float:
+        return math.exp(self.log_prob(password))
+
+    # =====================
+    # 추측 순위 추정
+    # =====================
+    def guess_number(self, log_prob: float) -> float:
+        """log 확률이 log_prob 인 비밀번호의 추정 추측 순위 (이진 탐색)"""
+        if log_prob == -math.inf:
+            return math.inf
+        k = bisect.bisect_left(self._neg_log_probs, -log_prob)
+        return self._guess_numbers[k]
+
+    def estimate(self, password: str) -> Tuple[float, float]:
+        """(확률, 추정 추측 순위) 반환"""
+        lp = self.log_prob(password)
+        return math.exp(lp), self.guess_number(lp)
+
+    def estimate_batch(self, passwords: Iterable[str], workers: int = 1,
+                       chunk_size: int = 10_000) -> Iterator[Tuple[str, float, float]]:
+        """
+        대량의 비밀번호를 (비밀번호, 확률, 추측 순위) 로 순서대로 yield 합니다.
+        workers > 1 이면 청크 단위로 프로세스 풀에 나눠 처리합니다.
+        """
+        if workers <= 1:
+            for pw in passwords:
+                prob, rank = self.estimate(pw)
+                yield pw, prob, rank
+            return
+
+        it = iter(passwords)
+        chunks = iter(lambda: list(islice(it, chunk_size)), [])
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_estimator_worker,
+            initargs=(self,)
+        ) as executor:
+            # 입력 순서를 유지하면서 동시에 처리 중인 청크 수를 제한
+            pending = deque()
+            for chunk in chunks:
+                pending.append(executor.submit(_estimate_chunk, chunk))
+                if len(pending) >= workers * 2:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+
+# =====================
+# 워커 프로세스용 함수
+# =====================
+_worker_estimator: Optional[StrengthEstimator] = None
+
+
+def _init_estimator_worker(estimator: StrengthEstimator):
+    global _worker_estimator
+    _worker_estimator = estimator
+
+
+def _estimate_chunk(chunk: List[str]) -> List[Tuple[str, float, float]]:
+    results = []
+    for pw in chunk:
+        prob, rank = _worker_estimator.estimate(pw)
+        results.append((pw, prob, rank))
+    return results
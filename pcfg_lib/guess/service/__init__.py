@@ -0,0 +1,28 @@
+# Auto-generated __init__.py
+# Submodules are imported lazily on first attribute access.
+
+import importlib
+
+_SUBMODULES = ['server']
+
+_LAZY_ATTRS = {
+    'GrammarService': 'server',
+    'GuessCursor': 'server',
+    'serve': 'server',
+}
+
+__all__ = sorted(set(_SUBMODULES) | set(_LAZY_ATTRS))
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return __all__
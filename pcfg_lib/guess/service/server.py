@@ -0,0 +1,241 @@
+import json
+import math
+import os
+import socketserver
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from pcfg_lib.guess.pcfg.pcfg_guesser import PCFGGuesser
+from pcfg_lib.guess.pcfg.strength_estimator import StrengthEstimator
+from pcfg_lib.guess.util.priority_queue import PcfgQueue
+
+
+#=======================================================================================================
+#                          확률 순서 추측 커서 (guesses N..M 요청용)
+#=======================================================================================================
+class GuessCursor:
+    #----------------------------------------------------------------------------------
+    # 초기화: 단일 프로세스 확률 순서 생성기와 생성 결과 캐시
+    # pcfg: PCFGGuesser, max_rank: 제공할 수 있는 최대 순위
+    #----------------------------------------------------------------------------------
+    def __init__(self, pcfg: PCFGGuesser, max_rank: int):
+        self.max_rank = max_rank
+        self._gen = PcfgQueue(pcfg=pcfg).guesses()
+        self._cache = []                        # 지금까지 생성된 비밀번호 (순위 순)
+        self._exhausted = False
+        self._lock = threading.Lock()
+
+    #----------------------------------------------------------------------------------
+    # [start, end) 구간의 비밀번호 반환, 필요한 만큼만 추가 생성
+    #----------------------------------------------------------------------------------
+    def get(self, start: int, end: int) -> list[str]:
+        if start < 0 or end < start:
+            raise ValueError("invalid range")
+        if end > self.max_rank:
+            raise ValueError(f"end must be <= {self.max_rank}")
+        if end > len(self._cache) and not self._exhausted:
+            with self._lock:
+                while len(self._cache) < end:
+                    nxt = next(self._gen, None)
+                    if nxt is None:
+                        self._exhausted = True
+                        break
+                    self._cache.append(nxt[0])
+        return self._cache[start:end]
+
+    @property
+    def generated(self) -> int:
+        return len(self._cache)
+
+
+#=======================================================================================================
+#                         문법을 한 번만 로드해 요청을 처리하는 서비스
+#=======================================================================================================
+class GrammarService:
+    #----------------------------------------------------------------------------------
+    # 초기화: 문법, 추정기, 추측 커서 및 요청 통계
+    # config: 설정 딕셔너리 (samples, seed, max_rank, max_batch 등)
+    #----------------------------------------------------------------------------------
+    def __init__(self, config: dict):
+        self.cfg = config
+        self.pcfg = PCFGGuesser(config=config)
+        self.estimator = StrengthEstimator(
+            self.pcfg.grammar, self.pcfg.base_structure,
+            sample_size=config.get("samples", 100_000), seed=config.get("seed")
+        )
+        self.cursor = GuessCursor(self.pcfg, config.get("max_rank", 10_000_000))
+        self.max_batch = config.get("max_batch", 100_000)
+        self.start_ts = time.time()
+
+        # 요청 통계: op → [요청 수, 누적 지연(us), 최대 지연(us)], 최근 지연 샘플
+        self._stats = {}
+        self._recent = deque(maxlen=10_000)
+        self._stats_lock = threading.Lock()
+
+        self._ops = {
+            "prob": self._op_prob,
+            "rank": self._op_rank,
+            "batch": self._op_batch,
+            "guesses": self._op_guesses,
+            "stats": self._op_stats,
+        }
+        # 첫 요청이 학습 파서 로딩 비용을 치르지 않도록 미리 한 번 파싱
+        if config.get("warmup", True):
+            self.estimator.log_prob("password1")
+
+    #----------------------------------------------------------------------------------
+    # 단일 요청 처리: 결과 딕셔너리에 ok 여부와 latency_us 포함
+    #----------------------------------------------------------------------------------
+    def handle(self, request: dict) -> dict:
+        t0 = time.perf_counter()
+        op = request.get("op")
+        try:
+            handler = self._ops.get(op)
+            if handler is None:
+                raise ValueError(f"unknown op: {op}")
+            response = handler(request)
+            response["ok"] = True
+        except Exception as e:
+            response = {"ok": False, "error": str(e)}
+        latency = (time.perf_counter() - t0) * 1e6
+        response["latency_us"] = round(latency, 1)
+        self._record(op, latency)
+        return response
+
+    def _record(self, op, latency):
+        with self._stats_lock:
+            entry = self._stats.setdefault(str(op), [0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += latency
+            entry[2] = max(entry[2], latency)
+            self._recent.append(latency)
+
+    #=======================================================================================================
+    #                                      요청 처리 메소드
+    #=======================================================================================================
+    @staticmethod
+    def _finite(value: float):
+        # JSON 으로 표현할 수 없는 inf 는 None 으로
+        return value if math.isfinite(value) else None
+
+    def _op_prob(self, request):
+        lp = self.estimator.log_prob(request["password"])
+        return {"prob": math.exp(lp), "log_prob": self._finite(lp)}
+
+    def _op_rank(self, request):
+        lp = self.estimator.log_prob(request["password"])
+        return {"prob": math.exp(lp), "guess_number": self._finite(self.estimator.guess_number(lp))}
+
+    def _op_batch(self, request):
+        passwords = request["passwords"]
+        if len(passwords) > self.max_batch:
+            raise ValueError(f"at most {self.max_batch} passwords per batch")
+        results = []
+        for pw in passwords:
+            lp = self.estimator.log_prob(pw)
+            results.append([math.exp(lp), self._finite(self.estimator.guess_number(lp))])
+        return {"results": results}
+
+    def _op_guesses(self, request):
+        start, end = int(request["start"]), int(request["end"])
+        if end - start > self.max_batch:
+            raise ValueError(f"at most {self.max_batch} guesses per request")
+        return {"guesses": self.cursor.get(start, end)}
+
+    def _op_stats(self, request):
+        with self._stats_lock:
+            recent = sorted(self._recent)
+            ops = {
+                op: {"count": n, "mean_us": round(total / n, 1), "max_us": round(mx, 1)}
+                for op, (n, total, mx) in self._stats.items()
+            }
+
+        def percentile(q):
+            if not recent:
+                return None
+            return round(recent[min(len(recent) - 1, int(q * len(recent)))], 1)
+
+        return {
+            "uptime_s": round(time.time() - self.start_ts, 1),
+            "ops": ops,
+            "p50_us": percentile(0.50),
+            "p99_us": percentile(0.99),
+            "generated": self.cursor.generated,
+        }
+
+
+#=======================================================================================================
+#                                  전송 계층 (Unix 소켓 / HTTP)
+#=======================================================================================================
+class _LineHandler(socketserver.StreamRequestHandler):
+    # 한 연결에서 줄 단위 JSON 요청을 반복 처리
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                response = {"ok": False, "error": f"invalid json: {e}"}
+            else:
+                response = self.server.service.handle(request)
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+class _ThreadingUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class _HTTPHandler(BaseHTTPRequestHandler):
+    # POST / 에 JSON 요청 본문, GET /stats 로 통계 조회
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError as e:
+            self._reply({"ok": False, "error": f"invalid json: {e}"}, 400)
+            return
+        self._reply(self.server.service.handle(request))
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/stats":
+            self._reply(self.server.service.handle({"op": "stats"}))
+        else:
+            self._reply({"ok": False, "error": "not found"}, 404)
+
+    def _reply(self, response, status=200):
+        body = json.dumps(response).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, fmt, *args):
+        pass
+
+
+def serve(service: GrammarService, socket_path: str = None, http_port: int = None, host: str = "127.0.0.1"):
+    """Unix 소켓(줄 단위 JSON) 또는 로컬 HTTP 로 서비스 실행 (Ctrl+C 로 종료)"""
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        server = _ThreadingUnixServer(socket_path, _LineHandler)
+        where = f"unix:{socket_path}"
+    else:
+        server = ThreadingHTTPServer((host, http_port), _HTTPHandler)
+        server.daemon_threads = True
+        where = f"http://{host}:{http_port}"
+    server.service = service
+    print(f"[service] grammar loaded, listening on {where}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if socket_path and os.path.exists(socket_path):
+            os.unlink(socket_path)
@@ -1,3 +1,26 @@
 # Auto-generated __init__.py
+# Submodules are imported lazily on first attribute access.
 
-from .ui_render import *
+import importlib
+
+_SUBMODULES = ['ui_render']
+
+_LAZY_ATTRS = {
+    'TUIRenderer': 'ui_render',
+}
+
+__all__ = sorted(set(_SUBMODULES) | set(_LAZY_ATTRS))
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return __all__
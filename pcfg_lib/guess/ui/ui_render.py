@@ -1,5 +1,3 @@
-import time
-
 from rich.box import ROUNDED, SIMPLE
 from rich.columns import Columns
 from rich.console import Console, Group
@@ -16,6 +14,7 @@ class TUIRenderer:
     # 초기화 및 기본 속성 설정
     # hashes: 크랙 대상 해시 집합
     # config: 설정 딕셔너리 (mode 등)
+    # 해시 수와 무관하게 화면 크기가 일정하도록 집계 값만 렌더링
     #----------------------------------------------------------------------------------
     def __init__(self, hashes: set[str], config: dict):
         self.hashes = hashes                        # 대상 해시 목록
@@ -28,25 +27,31 @@ class TUIRenderer:
     #----------------------------------------------------------------------------------
     def initial(self, session):
         self.session = session                     # 세션 참조 저장
-        return self.layout(0)                     # 생성된 시도 수 0 으로 레이아웃 반환
+        return self.update()
 
     #----------------------------------------------------------------------------------
     # UI 업데이트용 렌더링
-    # 세션에서 생성된 비밀번호 수를 사용해 레이아웃 재생성
+    # 세션의 집계 지표(metrics)로 레이아웃 재생성
     #----------------------------------------------------------------------------------
     def update(self):
-        return self.layout(self.session.generated)
+        return self.layout(self.session.metrics())
 
     #----------------------------------------------------------------------------------
     # 전체 레이아웃 구성
-    # gen_count: 현재까지 생성된 비밀번호 수
+    # metrics: PCFGSession.metrics() 결과
     # Columns 및 텍스트 그룹으로 화면 구성
     #----------------------------------------------------------------------------------
-    def layout(self, gen_count: int):
+    def layout(self, metrics: dict):
         return Group(
             Columns([
-                self._make_table(gen_count),        # 좌측: 해시 상태 테이블
-                self._make_panel()                  # 우측: 최근 시도 비밀번호 패널
+                Group(
+                    self._make_summary(metrics),    # 좌측 상단: 집계 카운터
+                    self._make_workers(metrics),    # 좌측 하단: 워커별 처리량
+                ),
+                Group(
+                    self._make_cracks(metrics),     # 우측 상단: 최근 크랙
+                    self._make_panel(metrics),      # 우측 하단: 최근 시도 비밀번호
+                ),
             ], expand=True),
             Text("Press 'q' to quit", style="bold yellow", justify="center")
         )
@@ -56,10 +61,9 @@ class TUIRenderer:
     #=======================================================================================================
 
     #----------------------------------------------------------------------------------
-    # 상태 테이블 생성
-    # gen_count: 생성된 비밀번호 수
+    # 집계 카운터 테이블 생성 (크랙 수, 생성 속도, 현재 확률, 큐 깊이 등)
     #----------------------------------------------------------------------------------
-    def _make_table(self, gen_count: int) -> Table:
+    def _make_summary(self, metrics: dict) -> Table:
         if self.cfg["use_john"]:
             mode = "john the ripper"
         else:
@@ -69,42 +73,68 @@ class TUIRenderer:
             title=f"PCFG Cracking (mode:{mode})",
             title_style="bold white on dark_blue",
             box=ROUNDED, border_style="bright_blue", header_style="bold cyan",
-            expand=True, show_lines=True
+            expand=True, show_header=False
         )
-        # 컬럼 정의
-        tbl.add_column("Hash", style="magenta", no_wrap=True)
-        tbl.add_column("Status", style="yellow", justify="center")
-        tbl.add_column("Plaintext", style="green")
-        tbl.add_column("Elapsed", style="cyan")
+        tbl.add_column("Metric", style="cyan", no_wrap=True)
+        tbl.add_column("Value", style="green", justify="right")
 
-        # 경과 시간 계산
-        elapsed = int(time.time() - self.session.start_ts)
+        tbl.add_row("Cracked", f"{metrics['cracked']}/{metrics['total']}")
+        tbl.add_row("Generated", f"{metrics['generated']:,}")
+        tbl.add_row("Guesses/s", f"{metrics['guesses_per_sec']:,.0f}")
+        tbl.add_row("Current prob", f"{metrics['current_prob']:.3g}")
+        tbl.add_row("Queue depth", f"{metrics['queue_depth']:,}")
+        tbl.add_row("In flight", str(metrics["inflight"]))
+        tbl.add_row("Elapsed", f"{int(metrics['elapsed'])}s")
+        # 종료 조건이 있으면 계획 키스페이스 대비 진행률과 ETA 표시
+        if metrics["planned_percent"] is not None:
+            tbl.add_row("Planned", f"{metrics['planned_percent']:.1f}%")
+        if metrics["eta"] is not None:
+            tbl.add_row("ETA", f"{int(metrics['eta'])}s")
+        return tbl
 
-        # 각 해시에 대해 상태 및 결과 추가
-        for h in self.hashes:
-            if h in self.session.found:
-                pw, t, gen0 = self.session.found[h]
-                tbl.add_row(h, "[green]Cracked", pw, f"{t:.1f}s (on gen : {gen0} items)")
-            else:
-                tbl.add_row(h, "[red]Pending", "", "")
+    #----------------------------------------------------------------------------------
+    # 워커별 처리량 테이블 생성
+    #----------------------------------------------------------------------------------
+    def _make_workers(self, metrics: dict) -> Table:
+        tbl = Table(
+            title="Workers",
+            box=ROUNDED, border_style="bright_blue", header_style="bold cyan",
+            expand=True
+        )
+        tbl.add_column("PID", style="magenta")
+        tbl.add_column("Nodes", justify="right")
+        tbl.add_column("Guesses", justify="right")
+        tbl.add_column("Guesses/s", style="green", justify="right")
+        for pid, w in sorted(metrics["workers"].items()):
+            tbl.add_row(str(pid), f"{w['nodes']:,}", f"{w['guesses']:,}", f"{w['rate']:,.0f}")
+        return tbl
 
-        # 테이블 하단 캡션 설정
-        tbl.caption = (
-            f"Finished: {len(self.session.found)}/{len(self.hashes)}  "
-            f"Generated: {gen_count}  Elapsed: {elapsed}s"
+    #----------------------------------------------------------------------------------
+    # 최근 크랙 N개 테이블 생성
+    #----------------------------------------------------------------------------------
+    def _make_cracks(self, metrics: dict) -> Table:
+        tbl = Table(
+            title="Recent cracks",
+            box=ROUNDED, border_style="bright_blue", header_style="bold cyan",
+            expand=True
         )
+        tbl.add_column("Hash", style="magenta", no_wrap=True)
+        tbl.add_column("Plaintext", style="green")
+        tbl.add_column("Elapsed", style="cyan")
+        for c in reversed(metrics["recent_cracks"]):
+            tbl.add_row(c["hash"], c["password"], f"{c['elapsed']:.1f}s (on gen : {c['generated']} items)")
         return tbl
 
     #----------------------------------------------------------------------------------
     # 최근 시도 비밀번호 패널 생성
     # 최근 리스트 출력, 없으면 안내 메시지
     #----------------------------------------------------------------------------------
-    def _make_panel(self) -> Panel:
+    def _make_panel(self, metrics: dict) -> Panel:
         # 최근 생성된 비밀번호 문자열 생성
         body = "\n".join(self.session.recent) or "[dim]No guesses yet"
         return Panel(
             body,
-            title=f"Recent (prob={self.session.current_prob:.3g})",
+            title=f"Recent (prob={metrics['current_prob']:.3g})",
             box=SIMPLE,
             expand=False
         )
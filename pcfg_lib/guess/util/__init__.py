@@ -1,5 +1,35 @@
 # Auto-generated __init__.py
+# Submodules are imported lazily on first attribute access.
 
-from .flush import *
-from .priority_queue import *
-from .worker_manage import *
+import importlib
+
+_SUBMODULES = ['dedup', 'flush', 'metrics', 'priority_queue', 'worker_manage']
+
+_LAZY_ATTRS = {
+    'BloomFilter': 'dedup',
+    'BufferManagerBase': 'flush',
+    'COORDINATOR_PHASES': 'metrics',
+    'JohnBufferManager': 'flush',
+    'MemoryBufferManager': 'flush',
+    'PcfgQueue': 'priority_queue',
+    'QueueItem': 'priority_queue',
+    'SessionMetrics': 'metrics',
+    'WORKER_PHASES': 'metrics',
+    'WorkerManager': 'worker_manage',
+}
+
+__all__ = sorted(set(_SUBMODULES) | set(_LAZY_ATTRS))
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return __all__
@@ -0,0 +1,85 @@
+import math
+from hashlib import blake2b
+from multiprocessing import shared_memory
+
+
+#=======================================================================================================
+#                         공유 메모리 Bloom 필터 (세션 전역 추측 중복 제거)
+#=======================================================================================================
+class BloomFilter:
+    #----------------------------------------------------------------------------------
+    # 초기화: 공유 메모리 블록 위의 m 비트 배열과 해시 함수 k 개
+    # 직접 호출하지 말고 create() (코디네이터) / attach() (워커) 사용
+    #----------------------------------------------------------------------------------
+    def __init__(self, shm: shared_memory.SharedMemory, m_bits: int, k: int, owner: bool):
+        self.shm = shm
+        self.m = m_bits
+        self.k = k
+        self.owner = owner                          # 생성한 프로세스만 unlink
+        self._buf = shm.buf
+
+    @staticmethod
+    def optimal_params(capacity: int, fp_rate: float) -> tuple[int, int]:
+        """원소 수 capacity, 오탐률 fp_rate 에 맞는 (비트 수 m, 해시 수 k)"""
+        m = max(8, int(math.ceil(-capacity * math.log(fp_rate) / (math.log(2) ** 2))))
+        k = max(1, int(round(m / capacity * math.log(2))))
+        return m, k
+
+    @classmethod
+    def create(cls, capacity: int, fp_rate: float) -> "BloomFilter":
+        m, k = cls.optimal_params(capacity, fp_rate)
+        shm = shared_memory.SharedMemory(create=True, size=(m + 7) // 8)
+        shm.buf[:] = bytes(shm.size)
+        return cls(shm, m, k, owner=True)
+
+    @classmethod
+    def attach(cls, spec: tuple) -> "BloomFilter":
+        name, m, k = spec
+        return cls(shared_memory.SharedMemory(name=name), m, k, owner=False)
+
+    @property
+    def spec(self) -> tuple:
+        """워커에 넘길 (공유 메모리 이름, m, k)"""
+        return self.shm.name, self.m, self.k
+
+    @property
+    def size_bytes(self) -> int:
+        return (self.m + 7) // 8
+
+    #----------------------------------------------------------------------------------
+    # 원소 추가: 처음 보는 원소면 True, (오탐 포함) 이미 있던 원소면 False
+    # 여러 워커가 같은 바이트를 동시에 갱신하면 비트 하나가 유실될 수 있으나,
+    # 그 결과는 중복 하나를 걸러내지 못하는 것뿐이라 잠금 없이 사용
+    #----------------------------------------------------------------------------------
+    def add(self, item: str) -> bool:
+        d = blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(d[:8], "little")
+        h2 = int.from_bytes(d[8:], "little") | 1
+        buf, m = self._buf, self.m
+        new = False
+        for i in range(self.k):
+            pos = (h1 + i * h2) % m
+            byte, bit = pos >> 3, 1 << (pos & 7)
+            v = buf[byte]
+            if not v & bit:
+                buf[byte] = v | bit
+                new = True
+        return new
+
+    def __contains__(self, item: str) -> bool:
+        d = blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(d[:8], "little")
+        h2 = int.from_bytes(d[8:], "little") | 1
+        buf, m = self._buf, self.m
+        for i in range(self.k):
+            pos = (h1 + i * h2) % m
+            if not buf[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def close(self):
+        """공유 메모리 해제 (생성한 프로세스면 삭제까지)"""
+        self._buf = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
@@ -0,0 +1,191 @@
+import json
+import os
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+
+# 워커가 노드마다 보고하는 구간별 시간 (초)
+WORKER_PHASES = ("enum", "dedup", "hash", "ipc", "children")
+# 코디네이터 루프 구간
+COORDINATOR_PHASES = ("dispatch", "collect", "drain", "flush", "render")
+
+
+def _escape_label(value) -> str:
+    """Prometheus 텍스트 형식의 레이블 값 이스케이프 (\\ → \\\\, " → \\", 줄바꿈 → \\n)"""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+#=======================================================================================================
+#                              세션 성능 지표 수집 / 내보내기 클래스
+#=======================================================================================================
+class SessionMetrics:
+    #----------------------------------------------------------------------------------
+    # 초기화: 워커별 누적 카운터와 코디네이터 구간 시간
+    # config: 설정 딕셔너리 (core, metrics_jsonl, metrics_prom, metrics_interval)
+    # 수집은 노드 단위 / 루프 단위 덧셈뿐이라 비밀번호 생성 경로에 부담을 주지 않음
+    #----------------------------------------------------------------------------------
+    def __init__(self, config: dict):
+        self.cores = config.get("core", 4)
+        self.jsonl_path = config.get("metrics_jsonl")
+        self.prom_path = config.get("metrics_prom")
+        self.interval = config.get("metrics_interval", 5.0)
+        self.start = time.perf_counter()
+        self._next_export = self.start + self.interval
+
+        self._workers = {}                          # pid → 누적 카운터
+        self.nodes_expanded = 0                     # 워커가 처리 완료한 노드 수
+        self.children_pushed = 0                    # 큐에 추가된 자식 노드 수
+        self.model_guesses = Counter()              # 앙상블 모델 번호 → 생성 수
+        self.coordinator = dict.fromkeys(COORDINATOR_PHASES, 0.0)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.jsonl_path or self.prom_path)
+
+    #=======================================================================================================
+    #                                      수집
+    #=======================================================================================================
+    def record_worker(self, stats: dict):
+        """워커가 노드 하나를 처리하고 돌려준 통계 누적"""
+        w = self._workers.get(stats["pid"])
+        if w is None:
+            w = self._workers[stats["pid"]] = {
+                "nodes": 0, "guesses": 0, "hashes": 0, "duplicates": 0, "busy": 0.0,
+                "node_size_sum": 0, "node_size_max": 0,
+                **dict.fromkeys(WORKER_PHASES, 0.0),
+            }
+        w["nodes"] += 1
+        w["guesses"] += stats["guesses"]
+        self.model_guesses[stats["model"]] += stats["guesses"]
+        w["hashes"] += stats["hashes"]
+        w["duplicates"] += stats["duplicates"]
+        w["busy"] += stats["elapsed"]
+        w["node_size_sum"] += stats["node_size"]
+        if stats["node_size"] > w["node_size_max"]:
+            w["node_size_max"] = stats["node_size"]
+        for phase in WORKER_PHASES:
+            w[phase] += stats[phase]
+        self.nodes_expanded += 1
+
+    @contextmanager
+    def timer(self, phase: str):
+        """코디네이터 루프 구간 시간 측정"""
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.coordinator[phase] += time.perf_counter() - t0
+
+    #=======================================================================================================
+    #                                      집계
+    #=======================================================================================================
+    def workers(self) -> dict:
+        """pid → 워커별 누적 카운터와 처리량 (busy 초당 생성 수)"""
+        return {
+            pid: {
+                **w,
+                "rate": w["guesses"] / w["busy"] if w["busy"] > 0 else 0.0,
+                "node_size_avg": w["node_size_sum"] / w["nodes"] if w["nodes"] else 0.0,
+            }
+            for pid, w in self._workers.items()
+        }
+
+    def coordinator_stats(self, queue_depth: int) -> dict:
+        elapsed = time.perf_counter() - self.start
+        busy = sum(w["busy"] for w in self._workers.values())
+        guesses = sum(w["guesses"] for w in self._workers.values())
+        duplicates = sum(w["duplicates"] for w in self._workers.values())
+        return {
+            "queue_depth": queue_depth,
+            "nodes_expanded": self.nodes_expanded,
+            "nodes_per_sec": self.nodes_expanded / elapsed if elapsed > 0 else 0.0,
+            "children_pushed": self.children_pushed,
+            "find_children_seconds": sum(w["children"] for w in self._workers.values()),
+            # 워커 유휴 시간 = 경과 시간 × 워커 수 - 노드 처리 시간 합
+            "worker_idle_seconds": max(elapsed * self.cores - busy, 0.0),
+            # 중복 제거 적중률 = 걸러진 중복 / 워커가 생성한 전체
+            "duplicates": duplicates,
+            "dedup_hit_rate": duplicates / guesses if guesses else 0.0,
+            "phases": dict(self.coordinator),
+        }
+
+    #=======================================================================================================
+    #                                     내보내기
+    #=======================================================================================================
+    def maybe_export(self, snapshot_fn, force: bool = False):
+        """주기가 지났으면 (또는 force) snapshot_fn() 결과를 JSON lines / Prometheus 파일로 기록"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if not force and now < self._next_export:
+            return
+        self._next_export = now + self.interval
+        snapshot = snapshot_fn()
+        if self.jsonl_path:
+            with open(self.jsonl_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(snapshot) + "\n")
+        if self.prom_path:
+            tmp = f"{self.prom_path}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(self.to_prometheus(snapshot))
+            os.replace(tmp, self.prom_path)
+
+    @staticmethod
+    def to_prometheus(snapshot: dict) -> str:
+        """세션 스냅샷을 Prometheus 텍스트 형식으로 변환"""
+        lines = []
+        typed = set()
+
+        def metric(name, kind, value, labels=None):
+            if value is None:
+                return
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {name} {kind}")
+            label = ""
+            if labels:
+                # 레이블 값은 문법 경로 등 임의 문자열이므로 \, ", 줄바꿈을 이스케이프
+                label = "{" + ",".join(f'{k}="{_escape_label(v)}"' for k, v in labels.items()) + "}"
+            lines.append(f"{name}{label} {value}")
+
+        metric("pcfg_elapsed_seconds", "gauge", snapshot["elapsed"])
+        metric("pcfg_generated_total", "counter", snapshot["generated"])
+        metric("pcfg_cracked", "gauge", snapshot["cracked"])
+        metric("pcfg_targets", "gauge", snapshot["total"])
+        metric("pcfg_guesses_per_second", "gauge", snapshot["guesses_per_sec"])
+        metric("pcfg_current_log_prob", "gauge", snapshot["current_log_prob"])
+        metric("pcfg_inflight", "gauge", snapshot["inflight"])
+
+        coord = snapshot["coordinator"]
+        metric("pcfg_queue_depth", "gauge", coord["queue_depth"])
+        metric("pcfg_nodes_expanded_total", "counter", coord["nodes_expanded"])
+        metric("pcfg_nodes_per_second", "gauge", coord["nodes_per_sec"])
+        metric("pcfg_children_pushed_total", "counter", coord["children_pushed"])
+        metric("pcfg_find_children_seconds_total", "counter", coord["find_children_seconds"])
+        metric("pcfg_worker_idle_seconds_total", "counter", coord["worker_idle_seconds"])
+        metric("pcfg_dedup_duplicates_total", "counter", coord["duplicates"])
+        metric("pcfg_dedup_hit_rate", "gauge", coord["dedup_hit_rate"])
+        for phase, seconds in coord["phases"].items():
+            metric("pcfg_coordinator_seconds_total", "counter", seconds, {"phase": phase})
+        for model in snapshot.get("models") or ():
+            metric("pcfg_model_guesses_total", "counter", model["guesses"], {"grammar": model["grammar"]})
+
+        # 같은 이름의 샘플이 연속되도록 지표 단위로 워커를 순회
+        workers = snapshot["workers"]
+        for name, kind, key in (
+            ("pcfg_worker_nodes_total", "counter", "nodes"),
+            ("pcfg_worker_guesses_total", "counter", "guesses"),
+            ("pcfg_worker_hashes_total", "counter", "hashes"),
+            ("pcfg_worker_duplicates_total", "counter", "duplicates"),
+            ("pcfg_worker_busy_seconds_total", "counter", "busy"),
+            ("pcfg_worker_node_size_max", "gauge", "node_size_max"),
+            ("pcfg_worker_node_size_sum", "counter", "node_size_sum"),
+        ):
+            for pid, w in workers.items():
+                metric(name, kind, w[key], {"pid": pid})
+        for phase in WORKER_PHASES:
+            for pid, w in workers.items():
+                metric("pcfg_worker_seconds_total", "counter", w[phase], {"pid": pid, "phase": phase})
+
+        return "\n".join(lines) + "\n"
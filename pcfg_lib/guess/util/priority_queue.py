@@ -17,14 +17,36 @@ class PcfgQueue:
     def __init__(self, pcfg: PCFGGuesser):
         self.pcfg = pcfg
         self._heap: list[QueueItem] = []
+        # 큐에 남아 있는 노드들의 후보(비밀번호) 수 합계
+        self.keyspace = 0
         for base in self.pcfg.initialize_base_structures():
-            heapq.heappush(self._heap, QueueItem(base))
+            self.push(base)
+
+    def __len__(self):
+        return len(self._heap)
 
     def pop(self) -> TreeItem | None:
         if not self._heap:
             return None
         qi = heapq.heappop(self._heap)
+        self.keyspace -= qi.node.total_candidate
         return qi.node
 
     def push(self, node: TreeItem):
         heapq.heappush(self._heap, QueueItem(node))
+        self.keyspace += node.total_candidate
+
+    def clear(self):
+        self._heap.clear()
+        self.keyspace = 0
+
+    def guesses(self):
+        """큐를 확률 순서대로 소비하며 (비밀번호, 노드 log 확률) 을 yield (단일 프로세스)"""
+        while True:
+            node = self.pop()
+            if node is None:
+                return
+            for pw in self.pcfg.guess(node.structures, node.model):
+                yield pw, node.prob
+            for child in self.pcfg.find_children(node):
+                self.push(child)
@@ -1,8 +1,14 @@
 import hashlib
+import os
+import time
 from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
 from multiprocessing import Queue
 
-from pcfg_lib.guess.pcfg.pcfg_guesser import PCFGGuesser, TreeItem
+from pcfg_lib import profiling
+from pcfg_lib.guess.pcfg.ensemble import load_guesser
+from pcfg_lib.guess.pcfg.pcfg_guesser import TreeItem
+from pcfg_lib.guess.util.dedup import BloomFilter
 
 
 #=======================================================================================================
@@ -15,12 +21,14 @@ class WorkerManager:
     # guess_q: 비밀번호 전달용 공유 큐
     # exit_evt: 종료 이벤트 플래그
     # targets: 크랙 대상 해시 목록 (Manager 공유)
+    # dedup: 공유 Bloom 필터 spec (BloomFilter.spec), None 이면 중복 제거 안 함
     #----------------------------------------------------------------------------------
-    def __init__(self, config, guess_q: Queue, exit_evt, targets):
+    def __init__(self, config, guess_q: Queue, exit_evt, targets, dedup=None):
         self.config = config                   # 전체 설정
         self.guess_q = guess_q                 # 전역 추측 큐
         self.exit_evt = exit_evt               # 종료 신호 이벤트
         self.targets = targets                 # 남은 해시 리스트/집합
+        self.dedup = dedup                     # 중복 제거 필터 spec
         self.pool = None                       # ProcessPoolExecutor 인스턴스
         self.inflight = {}                     # {Future: TreeItem} 진행중인 작업 맵
 
@@ -32,19 +40,23 @@ class WorkerManager:
         self.pool = ProcessPoolExecutor(
             max_workers=self.config.get("core", 4),
             initializer=self._init_worker,
-            initargs=(self.config, self.guess_q, self.exit_evt, self.targets)
+            initargs=(self.config, self.guess_q, self.exit_evt, self.targets, self.dedup)
         )
 
     @staticmethod
-    def _init_worker(config, guess_q, exit_evt, targets):
+    def _init_worker(config, guess_q, exit_evt, targets, dedup=None):
         """워커 프로세스별 전역 환경 설정 (초기화 함수)"""
-        global pcfg_worker, GUESS_QUEUE, EXIT_EVENT, TARGET_HASHES, HASH_MODE, BUFFER_SIZE
-        pcfg_worker = PCFGGuesser(config=config)         # PCFGGuesser 인스턴스
+        global pcfg_worker, GUESS_QUEUE, EXIT_EVENT, TARGET_HASHES, HASH_MODE, BUFFER_SIZE, GENERATE_ONLY, DEDUP
+        pcfg_worker = load_guesser(config)                # PCFGGuesser (또는 앙상블) 인스턴스
         GUESS_QUEUE = guess_q                            # 전역 비밀번호 큐
         EXIT_EVENT = exit_evt                            # 전역 종료 이벤트
         TARGET_HASHES = targets                          # 전역 남은 해시 목록
         HASH_MODE = config.get("mode", "md5")         # 해시 알고리즘
         BUFFER_SIZE = config.get("buffer_size", 1000)  # 내부 버퍼 크기
+        GENERATE_ONLY = config.get("generate_only", False)  # 생성만 하고 큐 전송/해시 생략
+        DEDUP = BloomFilter.attach(dedup) if dedup else None  # 세션 전역 중복 제거 필터
+        if config.get("profile_dir"):
+            profiling.enable_worker(config["profile_dir"])  # --profile: 워커 cProfile 시작
 
     #=======================================================================================================
     #                                내부 유틸리티 메소드
@@ -66,29 +78,121 @@ class WorkerManager:
         1) PCFGGuesser로 비밀번호 생성
         2) GUESS_QUEUE 및 내부 버퍼에 추가
         3) BUFFER_SIZE마다 _compare_batch 실행
-        4) 자식 노드 리스트 반환
+        4) 자식 노드 리스트와 워커 통계 반환
+           (pid, 출처 모델, 생성/해시/중복 수, 노드 크기, 생성·중복검사·해시·IPC·find_children 구간 시간)
+        중복 제거가 켜져 있으면 이미 생성된 비밀번호는 큐 전송과 해시를 건너뜀
         """
+        stats = {
+            "pid": os.getpid(), "model": node.model, "guesses": 0, "hashes": 0, "duplicates": 0,
+            "node_size": node.total_candidate,
+            "elapsed": 0.0, "enum": 0.0, "dedup": 0.0, "hash": 0.0, "ipc": 0.0, "children": 0.0,
+        }
         if EXIT_EVENT.is_set():
             pcfg_worker.is_exit = True
-            return [], []  # 종료 시 빈 결과 반환
+            return [], [], stats  # 종료 시 빈 결과 반환
+        clock = time.perf_counter
+        t0 = clock()
+        if GENERATE_ONLY:
+            return WorkerManager._generate_node(node, stats, t0)
+        ipc = dedup = 0.0
         buf, out = [], []
         try:
-            for pw in pcfg_worker.guess(node.structures):
+            for pw in pcfg_worker.guess(node.structures, node.model):
                 if EXIT_EVENT.is_set():
                     raise InterruptedError()
+                stats["guesses"] += 1
+                if DEDUP is not None:
+                    t = clock()
+                    new = DEDUP.add(pw)
+                    dedup += clock() - t
+                    if not new:
+                        stats["duplicates"] += 1
+                        continue
+                t = clock()
                 GUESS_QUEUE.put(pw)
+                ipc += clock() - t
                 buf.append(pw)
                 if len(buf) >= BUFFER_SIZE:
-                    out.extend(WorkerManager._compare_batch(buf))
-                    buf.clear()
+                    WorkerManager._hash_batch(buf, out, stats)
+            t = clock()
             children = pcfg_worker.find_children(node)
+            stats["children"] = clock() - t
         except InterruptedError:
             children = []  # 인터럽트 시 자식 생성 생략
         finally:
             # 남은 버퍼 처리
             if buf:
-                out.extend(WorkerManager._compare_batch(buf))
-        return children, out
+                WorkerManager._hash_batch(buf, out, stats)
+        stats["elapsed"] = clock() - t0
+        stats["ipc"] = ipc
+        stats["dedup"] = dedup
+        # 생성 시간 = 전체 - (중복검사 + IPC + 해시 + find_children)
+        stats["enum"] = max(stats["elapsed"] - dedup - ipc - stats["hash"] - stats["children"], 0.0)
+        profiling.dump_worker()
+        return children, out, stats
+
+    @staticmethod
+    def _generate_node(node: TreeItem, stats: dict, t0: float):
+        """생성 전용(--benchmark-gen) 노드 처리: 비밀번호를 세기만 하고 자식 노드 반환
+        종료 이벤트는 Manager 프록시 호출이라 BUFFER_SIZE 개마다 한 번만 확인
+        """
+        clock = time.perf_counter
+        count = 0
+        try:
+            for _ in pcfg_worker.guess(node.structures, node.model):
+                count += 1
+                if count % BUFFER_SIZE == 0 and EXIT_EVENT.is_set():
+                    raise InterruptedError()
+            t = clock()
+            children = pcfg_worker.find_children(node)
+            stats["children"] = clock() - t
+        except InterruptedError:
+            children = []
+        stats["guesses"] = count
+        stats["elapsed"] = clock() - t0
+        stats["enum"] = stats["elapsed"] - stats["children"]
+        profiling.dump_worker()
+        return children, [], stats
+
+    @staticmethod
+    def _export_batch(batch: list, seq: int, offset: int, shards: int):
+        """단어 목록 내보내기(--export) 작업 처리: 노드 묶음의 추측을 샤드별 bytes 로 반환
+        batch: [(structures, model, limit), ...] — 노드마다 처음 limit 개만 생성
+        offset: 묶음 첫 추측의 전역 번호 (전역 번호 % shards 로 샤드 결정)
+        자식 노드는 순서 보장을 위해 코디네이터가 직접 계산하므로 여기서는 생성만 함
+        반환: ([], (순번 seq, 샤드별 bytes), 통계)
+        """
+        stats = {
+            "pid": os.getpid(), "model": batch[0][1], "guesses": 0, "hashes": 0, "duplicates": 0,
+            "node_size": sum(limit for _, _, limit in batch),
+            "elapsed": 0.0, "enum": 0.0, "dedup": 0.0, "hash": 0.0, "ipc": 0.0, "children": 0.0,
+        }
+        blobs = [b""] * shards
+        if EXIT_EVENT.is_set():
+            return [], (seq, blobs), stats
+        t0 = time.perf_counter()
+        lines = []
+        for structures, model, limit in batch:
+            lines.extend(islice(pcfg_worker.guess(structures, model), limit))
+            if EXIT_EVENT.is_set():
+                break
+        for j in range(shards):
+            part = lines[(j - offset) % shards::shards] if shards > 1 else lines
+            if part:
+                blobs[j] = ("\n".join(part) + "\n").encode("utf-8")
+        stats["guesses"] = len(lines)
+        stats["elapsed"] = stats["enum"] = time.perf_counter() - t0
+        profiling.dump_worker()
+        return [], (seq, blobs), stats
+
+    @staticmethod
+    def _hash_batch(buf, out, stats):
+        """버퍼를 해시 비교해 out 에 매칭 추가, 통계 갱신 후 버퍼 비움"""
+        t = time.perf_counter()
+        out.extend(WorkerManager._compare_batch(buf))
+        stats["hash"] += time.perf_counter() - t
+        stats["hashes"] += len(buf)
+        buf.clear()
 
     #=======================================================================================================
     #                                작업 제출 및 결과 수집
@@ -98,17 +202,22 @@ class WorkerManager:
         fut = self.pool.submit(self._process_node, node)
         self.inflight[fut] = node
 
+    def submit_export(self, nodes: list, limits: list, seq: int, offset: int, shards: int):
+        """단어 목록 내보내기용 노드 묶음 제출 (_export_batch 참고)"""
+        batch = [(node.structures, node.model, limit) for node, limit in zip(nodes, limits)]
+        fut = self.pool.submit(self._export_batch, batch, seq, offset, shards)
+        self.inflight[fut] = nodes[0]
+
     def collect(self, timeout=0.5):
         """완료된 Future 작업 수거 및 결과 반환
         timeout: 대기 시간(초)
-        반환: [(children, matches), ...] 리스트
+        반환: [(children, matches, stats), ...] 리스트
         """
         done, _ = wait(self.inflight, timeout=timeout, return_when=FIRST_COMPLETED)
         results = []
         for fut in done:
             node = self.inflight.pop(fut)
-            children, matches = fut.result()
-            results.append((children, matches))
+            results.append(fut.result())
         return results
 
     #=======================================================================================================
@@ -120,7 +229,7 @@ class WorkerManager:
             fut.cancel()
         self.inflight.clear()
 
-    def shutdown(self):
-        """워커 풀 즉시 종료 (대기하지 않고)"""
+    def shutdown(self, wait=False):
+        """워커 풀 종료 (기본은 대기하지 않고 즉시)"""
         if self.pool:
-            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool.shutdown(wait=wait, cancel_futures=True)
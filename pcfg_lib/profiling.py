@@ -0,0 +1,93 @@
+import cProfile
+import glob
+import io
+import os
+import pstats
+import shutil
+import tempfile
+import time
+from contextlib import contextmanager
+from multiprocessing.util import Finalize
+
+# 워커 프로파일 중간 저장 주기(초) — 워커가 강제 종료돼도 마지막 저장분은 남도록
+DUMP_INTERVAL = 10.0
+
+_profiler = None
+_dump_path = None
+_last_dump = 0.0
+
+
+#=======================================================================================================
+#                                  워커 프로세스 측 프로파일링
+#=======================================================================================================
+def enable_worker(profile_dir: str):
+    """현재 (워커) 프로세스에서 cProfile 시작. 프로세스 종료 시 profile_dir 에 저장"""
+    global _profiler, _dump_path, _last_dump
+    if _profiler is not None:
+        return
+    _dump_path = os.path.join(profile_dir, f"worker-{os.getpid()}.pstats")
+    _last_dump = time.monotonic()
+    _profiler = cProfile.Profile()
+    _profiler.enable()
+    # 풀 워커가 정상 종료될 때 multiprocessing 종료 처리에서 호출됨
+    Finalize(None, dump_worker, kwargs={"force": True}, exitpriority=100)
+
+
+def dump_worker(force: bool = False):
+    """워커 프로파일을 파일로 저장 (force 가 아니면 DUMP_INTERVAL 마다 한 번)"""
+    global _last_dump
+    if _profiler is None:
+        return
+    now = time.monotonic()
+    if not force and now - _last_dump < DUMP_INTERVAL:
+        return
+    _last_dump = now
+    _profiler.disable()
+    tmp = f"{_dump_path}.tmp"
+    _profiler.dump_stats(tmp)
+    os.replace(tmp, _dump_path)
+    if not force:
+        _profiler.enable()
+
+
+#=======================================================================================================
+#                                  코디네이터 측 프로파일링 및 병합
+#=======================================================================================================
+@contextmanager
+def profile_run(output: str, top: int = 40):
+    """
+    코디네이터를 프로파일링하면서 워커용 임시 디렉토리 경로를 넘겨줍니다.
+    블록이 끝나면 코디네이터와 모든 워커의 통계를 하나로 병합해
+    <output>.pstats 와 <output>.txt 리포트를 저장합니다.
+    """
+    profile_dir = tempfile.mkdtemp(prefix="pcfg-profile-")
+    prof = cProfile.Profile()
+    prof.enable()
+    try:
+        yield profile_dir
+    finally:
+        prof.disable()
+        try:
+            report = merge_profiles(prof, profile_dir, output, top)
+            print(report)
+            print(f"[profile] merged stats saved to {output}.pstats, report to {output}.txt")
+        finally:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+
+
+def merge_profiles(coordinator: cProfile.Profile, profile_dir: str, output: str, top: int = 40) -> str:
+    """코디네이터 프로파일과 profile_dir 의 워커 .pstats 를 병합해 저장하고 리포트 문자열 반환"""
+    stream = io.StringIO()
+    stats = pstats.Stats(coordinator, stream=stream)
+    worker_files = sorted(glob.glob(os.path.join(profile_dir, "worker-*.pstats")))
+    for path in worker_files:
+        stats.add(path)
+    stats.dump_stats(f"{output}.pstats")
+
+    stream.write(f"PCFG profile: coordinator + {len(worker_files)} worker process(es)\n")
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(top)
+    report = stream.getvalue()
+    with open(f"{output}.txt", "w", encoding="utf-8") as f:
+        f.write(report)
+    return report
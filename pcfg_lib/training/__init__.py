@@ -1,9 +1,153 @@
 # Auto-generated __init__.py
+# Submodules are imported lazily on first attribute access.
 
-from .detectors import *
-from .io import *
-from .korean_dict import *
-from .omen import *
-from .pcfg import *
-from .trainer import *
-from .util import *
+import importlib
+
+_SUBMODULES = ['detectors', 'io', 'korean_dict', 'omen', 'pcfg', 'trainer', 'util']
+
+_LAZY_ATTRS = {
+    'AlphabetGrammar': 'omen',
+    'AlphabetGrammerNode': 'omen',
+    'BASE_URL': 'korean_dict',
+    'BATCH_SIZE': 'korean_dict',
+    'CHARSET': 'util',
+    'CHAR_INDICES': 'util',
+    'CHAR_LISTS': 'util',
+    'CHAR_SETS': 'util',
+    'CUSTOM_DICT': 'korean_dict',
+    'DB_PATH': 'korean_dict',
+    'DDL': 'korean_dict',
+    'DEFAULT_CAPACITY': 'util',
+    'DUBEOL_FINAL': 'util',
+    'DUBEOL_INITIAL': 'util',
+    'DUBEOL_MEDIAL': 'util',
+    'FINAL': 'util',
+    'FLUSH_EVERY': 'util',
+    'INITIAL': 'util',
+    'KoreanCopusParser': 'korean_dict',
+    'LEET_MAP': 'util',
+    'LeetMatcher': 'util',
+    'MAX_LEET_COMBINATIONS': 'detectors',
+    'MEANINGFUL_SINGLE_CHAR': 'korean_dict',
+    'MEDIAL': 'util',
+    'MIN_LEN': 'util',
+    'MIN_ZIPF': 'util',
+    'NameListParser': 'korean_dict',
+    'NewWordParser': 'korean_dict',
+    'NewWordParser2': 'korean_dict',
+    'NewWordParser3': 'korean_dict',
+    'PARAMS': 'korean_dict',
+    'PCFGParser': 'pcfg',
+    'PCFG_TABLES': 'io',
+    'PHONETIC_SPELLING_MAP': 'util',
+    'PREFIX_DEPTH': 'detectors',
+    'PROBS': 'util',
+    'REV_FINAL': 'util',
+    'REV_INITIAL': 'util',
+    'REV_MEDIAL': 'util',
+    'RE_HANGUL_SEQ': 'korean_dict',
+    'RE_HANGUL_TOKEN': 'util',
+    'RE_ONLY_HANGUL': 'korean_dict',
+    'ROMAN_KEYS': 'util',
+    'SAMPLE_BYTES': 'io',
+    'SEGMENTER_VERSION': 'util',
+    'SERVICE_KEY': 'korean_dict',
+    'STOPWORDS': 'util',
+    'Seg': 'util',
+    'SegmentCache': 'util',
+    'TabularNounParser': 'korean_dict',
+    'TrainingDataParser': 'io',
+    'VALID_WORDS': 'util',
+    'WordCounter': 'pcfg',
+    'YoutubeCommentParser': 'korean_dict',
+    'all_merge_combinations': 'detectors',
+    'assign_parsers': 'korean_dict',
+    'caculate_prob_and_save_to_db': 'korean_dict',
+    'calc_omen_keyspace': 'omen',
+    'check_hangul': 'util',
+    'clean_and_save_to_sqlite': 'korean_dict',
+    'comb_leets_sections': 'detectors',
+    'compile_level_table': 'omen',
+    'configure_segment_cache': 'detectors',
+    'detect_alphabet': 'detectors',
+    'detect_dictionary_word': 'detectors',
+    'detect_keyboard_walk': 'detectors',
+    'detect_year_or_monthday': 'detectors',
+    'english_lexicon': 'util',
+    'extract_clean_hangul': 'util',
+    'fetch_items': 'korean_dict',
+    'find_keyboard_row_column': 'detectors',
+    'find_leet_words': 'util',
+    'find_level': 'omen',
+    'find_omen_level': 'omen',
+    'get_Htoken_prob': 'util',
+    'get_alphabet_mask': 'util',
+    'get_english_prob': 'util',
+    'get_jamo_type': 'util',
+    'get_korean_caps_mask': 'util',
+    'get_original': 'util',
+    'hangul2dubeol': 'util',
+    'hangul2roman': 'util',
+    'is_adjacent_extended': 'detectors',
+    'is_contains_single_jamo': 'util',
+    'is_english': 'util',
+    'is_hangul_compat_jamo': 'util',
+    'is_hangul_jamo': 'util',
+    'is_hangul_jamo_exta': 'util',
+    'is_hangul_jamo_extb': 'util',
+    'is_hangul_syllable': 'util',
+    'is_korean': 'util',
+    'is_pure_korean': 'util',
+    'is_supported_hangul': 'util',
+    'is_valid_alpha_token': 'util',
+    'join_jamos': 'util',
+    'join_jamos_char': 'util',
+    'korean_lexicon': 'util',
+    'leet_segment': 'detectors',
+    'lexicon_version': 'util',
+    'load_checkpoint_counts': 'korean_dict',
+    'load_checkpoint_done': 'korean_dict',
+    'load_counter_from_db': 'io',
+    'load_loan_word': 'korean_dict',
+    'load_omen_counts': 'io',
+    'load_pcfg_counts': 'io',
+    'load_raw_korean_dict_from_db': 'korean_dict',
+    'load_stopwords': 'util',
+    'main': 'korean_dict',
+    'make_sure_path_exists': 'io',
+    'normalize_leet': 'util',
+    'normalize_phonetic_spelling': 'util',
+    'parallel_process_resume': 'korean_dict',
+    'print_progress': 'korean_dict',
+    'process_with': 'korean_dict',
+    'roman2jamo': 'util',
+    'save_checkpoint_counts': 'korean_dict',
+    'save_checkpoint_done': 'korean_dict',
+    'save_counter_to_db': 'io',
+    'save_counter_to_sqlite': 'korean_dict',
+    'save_omen_to_sqlite': 'io',
+    'save_pcfg_to_sqlite': 'io',
+    'save_word_probs_to_sqlite': 'korean_dict',
+    'segment_cache': 'detectors',
+    'smooth_grammar': 'omen',
+    'smooth_length': 'omen',
+    'split_alpha': 'detectors',
+    'start_train': 'trainer',
+    'to_tuple': 'korean_dict',
+}
+
+__all__ = sorted(set(_SUBMODULES) | set(_LAZY_ATTRS))
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return __all__
@@ -1,9 +1,40 @@
 # Auto-generated __init__.py
+# Submodules are imported lazily on first attribute access.
 
-from .alphabet_detection import *
-from .digit_detection import *
-from .keyboard_walk_detection import *
-from .leet_detection import *
-from .other_detection import *
-from .word_dectection import *
-from .year_detection import *
+import importlib
+
+_SUBMODULES = ['alphabet_detection', 'digit_detection', 'keyboard_walk_detection', 'leet_detection', 'other_detection', 'word_dectection', 'year_detection']
+
+_LAZY_ATTRS = {
+    'MAX_LEET_COMBINATIONS': 'leet_detection',
+    'PREFIX_DEPTH': 'word_dectection',
+    'Seg': 'word_dectection',
+    'all_merge_combinations': 'leet_detection',
+    'comb_leets_sections': 'leet_detection',
+    'configure_segment_cache': 'word_dectection',
+    'detect_alphabet': 'alphabet_detection',
+    'detect_dictionary_word': 'word_dectection',
+    'detect_keyboard_walk': 'keyboard_walk_detection',
+    'detect_year_or_monthday': 'year_detection',
+    'find_keyboard_row_column': 'keyboard_walk_detection',
+    'is_adjacent_extended': 'keyboard_walk_detection',
+    'leet_segment': 'leet_detection',
+    'segment_cache': 'word_dectection',
+    'split_alpha': 'alphabet_detection',
+}
+
+__all__ = sorted(set(_SUBMODULES) | set(_LAZY_ATTRS))
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return __all__
@@ -1,11 +1,14 @@
-from itertools import product
-from typing import List, Tuple, Optional
+import heapq
+from typing import Iterator, List, Tuple, Optional
 
 from pcfg_lib.training.util.english import find_leet_words
 
 # 세그먼트 타입: (텍스트, 레이블)  레이블 예: 'A3' (디코딩된 길이)
 Seg = Tuple[str, Optional[str]]
 
+# 한 비밀번호에서 꺼내 볼 최대 분할 조합 수 (세그먼트가 많은 비밀번호의 조합 폭발 방지)
+MAX_LEET_COMBINATIONS = 10_000
+
 
 def _safe_sort_key(sequence: List[Seg]) -> Tuple[int, str]:
     """
@@ -54,6 +57,29 @@ def leet_segment(text: str) -> List[Seg]:
     return segments
 
 
+def _merge_by_mask(segments: List[Seg], mask: int) -> List[Seg]:
+    """
+    mask 의 i-1 번째 비트가 켜져 있으면 세그먼트 i 앞에서 나누고, 꺼져 있으면 앞 세그먼트와 병합합니다.
+    """
+    combo: List[Seg] = []
+    current_text, current_label = segments[0]
+
+    for i in range(1, len(segments)):
+        next_text, next_label = segments[i]
+        merge = not (mask & (1 << (i - 1)))
+        if merge:
+            # 현재와 다음 세그먼트 병합, 레이블 제거
+            current_text += next_text
+            current_label = None
+        else:
+            # 현재 세그먼트 확정
+            combo.append((current_text, current_label))
+            current_text, current_label = next_text, next_label
+
+    combo.append((current_text, current_label))
+    return combo
+
+
 def all_merge_combinations(segments: List[Seg]) -> List[List[Seg]]:
     """
     인접 세그먼트를 병합하거나 그대로 두는 모든 조합을 생성합니다.
@@ -65,62 +91,87 @@ def all_merge_combinations(segments: List[Seg]) -> List[List[Seg]]:
         return []
 
     n = len(segments)
-    results: List[List[Seg]] = []
-
-    for mask in range(1 << (n - 1)):
-        combo: List[Seg] = []
-        current_text, current_label = segments[0]
-
-        for i in range(1, n):
-            next_text, next_label = segments[i]
-            merge = not (mask & (1 << (i - 1)))
-            if merge:
-                # 현재와 다음 세그먼트 병합, 레이블 제거
-                current_text += next_text
-                current_label = None
-            else:
-                # 현재 세그먼트 확정
-                combo.append((current_text, current_label))
-                current_text, current_label = next_text, next_label
-
-        combo.append((current_text, current_label))
-        results.append(combo)
+    results: List[List[Seg]] = [_merge_by_mask(segments, mask) for mask in range(1 << (n - 1))]
 
     # 일관된 순서를 위해 정렬
     results.sort(key=_safe_sort_key)
     return results
 
 
-def comb_leets_sections(sections: List[Seg]) -> List[List[Seg]]:
+def _section_variants(text: str, label: Optional[str]) -> Iterator[Tuple[int, Tuple[int, int], List[Seg]]]:
+    """
+    구간 하나의 변형을 (세그먼트 수, 원래 순서 키, 변형) 으로 세그먼트 수 오름차순으로 지연 생성합니다.
+    원래 순서 키는 기존 변형 목록(all_merge_combinations 정렬 결과 뒤에 원본 텍스트)에서의 순서와 같고,
+    같은 세그먼트 수 안에서는 이 키가 증가하는 순서로 나옵니다.
+    """
+    if label is not None:
+        # 레이블이 있는 세그먼트는 그대로 유지
+        yield 1, (0, 0), [(text, label)]
+        return
+
+    base = leet_segment(text)
+    n = len(base)
+    if n == 0:
+        yield 1, (0, 0), [(text, None)]
+        return
+
+    whole = _merge_by_mask(base, 0)
+    yield 1, (1, 0), whole
+    # 원본 텍스트 세그먼트도 포함되도록 보장 (목록 맨 끝에 붙던 변형)
+    if whole != [(text, None)]:
+        yield 1, (n + 1, 0), [(text, None)]
+
+    # 나누는 지점 수별로, 같은 비트 수의 mask 를 작은 값부터 (Gosper's hack)
+    for splits in range(1, n):
+        mask = (1 << splits) - 1
+        while mask < 1 << (n - 1):
+            yield splits + 1, (splits + 1, mask), _merge_by_mask(base, mask)
+            low = mask & -mask
+            ripple = mask + low
+            mask = (((ripple ^ mask) >> 2) // low) | ripple
+
+
+def comb_leets_sections(sections: List[Seg], limit: int = MAX_LEET_COMBINATIONS) -> Iterator[List[Seg]]:
     """
     레이블이 없는 구간에는 leet_segment와 병합 조합을 적용하여 변형을 생성하고,
     레이블이 있는 구간은 그대로 유지하여 모든 분할 조합을 만듭니다.
-    """
-    options: List[List[List[Seg]]] = []
-
-    for text, label in sections:
-        if label is None:
-            base = leet_segment(text)
-            variants = all_merge_combinations(base)
-            # 원본 텍스트 세그먼트도 포함되도록 보장
-            if [(text, None)] not in variants:
-                variants.append([(text, None)])
-            options.append(variants)
-        else:
-            # 레이블이 있는 세그먼트는 그대로 유지
-            options.append([[(text, label)]])
 
-    # 각 구간 변형의 데카르트 곱
-    raw_combos = [sum(parts, []) for parts in product(*options)]
-
-    # 중복 제거 및 순서 보존
+    조합은 기존과 같은 순서(전체 세그먼트 수, 같으면 구간별 변형의 데카르트 곱 순서)로
+    필요한 만큼만 생성됩니다. 구간별 변형 스트림 위에서 최선 우선 탐색을 하므로
+    첫 조합만 쓰는 학습은 구간 수에 비례하는 작업만 하고, 최대 limit 개까지 꺼냅니다.
+    """
+    streams = [_section_variants(text, label) for text, label in sections]
+    variants: List[list] = [[next(stream)] for stream in streams]
+
+    def variant(i: int, k: int):
+        # 구간 i 의 k 번째 변형 (처음 요청될 때 스트림에서 생성)
+        while len(variants[i]) <= k:
+            item = next(streams[i], None)
+            if item is None:
+                return None
+            variants[i].append(item)
+        return variants[i][k]
+
+    # 힙 항목: (세그먼트 수 합, 구간별 원래 순서 키, 구간별 변형 인덱스, 다음에 늘릴 수 있는 첫 구간)
+    # 자식은 마지막으로 늘린 구간 이후만 늘려 각 조합이 한 번씩만 들어가고, 항상 부모보다 뒤에 옴
+    start = tuple(0 for _ in sections)
+    heap = [(sum(v[0][0] for v in variants), tuple(v[0][1] for v in variants), start, 0)]
     seen: set = set()
-    unique: List[List[Seg]] = []
-    for combo in raw_combos:
+    for _ in range(limit):
+        if not heap:
+            return
+        _, _, idx, first = heapq.heappop(heap)
+        combo = [seg for i, k in enumerate(idx) for seg in variants[i][k][2]]
         key = tuple(combo)
         if key not in seen:
             seen.add(key)
-            unique.append(combo)
-
-    unique.sort(key=_safe_sort_key)
-    return unique
+            yield combo
+
+        for i in range(first, len(idx)):
+            item = variant(i, idx[i] + 1)
+            if item is None:
+                continue
+            child = idx[:i] + (idx[i] + 1,) + idx[i + 1:]
+            total = sum(variants[j][k][0] for j, k in enumerate(child))
+            order = tuple(variants[j][k][1] for j, k in enumerate(child))
+            heapq.heappush(heap, (total, order, child, i))
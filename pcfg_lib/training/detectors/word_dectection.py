@@ -3,8 +3,9 @@ import functools
 from typing import List, Tuple, Optional
 
 from pcfg_lib.training.detectors.alphabet_detection import split_alpha
-from pcfg_lib.training.util.english import is_english, is_valid_alpha_token, get_english_prob
-from pcfg_lib.training.util.korean import is_korean, get_Htoken_prob, is_pure_korean
+from pcfg_lib.training.util.english import is_english, is_valid_alpha_token, get_english_prob, english_lexicon
+from pcfg_lib.training.util.korean import PROBS, is_korean, get_Htoken_prob, get_original, is_pure_korean, korean_lexicon
+from pcfg_lib.training.util.segment_cache import DEFAULT_CAPACITY, SegmentCache
 
 Seg = Tuple[str, Optional[str]]  # 세그먼트 타입: (텍스트, 레이블)
 
@@ -34,12 +35,117 @@ def _penalty(seg: str) -> float:
         return 0.5 if seg.isalpha() else 1.0
     return len(seg) + (10 if len(seg) <= 2 and not seg.isalpha() else 5)
 
+#--------------------------------------------------------------------------------
+# Lexicon Prefix Section
+#--------------------------------------------------------------------------------
+# 접두사 색인 깊이: 이 길이까지의 접두사가 사전에 없으면 그 시작 위치에서 더 긴 구간도 사전 단어가 아님
+PREFIX_DEPTH = 4
+_LEXICON_PREFIXES: Optional[set] = None
+
+
+def _lexicon_prefixes() -> set:
+    """
+    영어 사전과 한글 로마자 사전 키의 PREFIX_DEPTH 글자 이하 접두사 집합 (첫 호출 때 생성).
+    깊이를 제한해 사전 크기와 무관하게 작은 메모리로 대부분의 구간 조회를 일찍 끊습니다.
+    """
+    global _LEXICON_PREFIXES
+    if _LEXICON_PREFIXES is None:
+        prefixes = set()
+        for lexicon in (english_lexicon(), korean_lexicon()):
+            for key in lexicon:
+                for length in range(1, min(len(key), PREFIX_DEPTH) + 1):
+                    prefixes.add(key[:length])
+        _LEXICON_PREFIXES = prefixes
+    return _LEXICON_PREFIXES
+
 #--------------------------------------------------------------------------------
 # Best Path DP Section
 #--------------------------------------------------------------------------------
+@functools.lru_cache(maxsize=None)
+def _unknown_tables(max_len: int, log_unk: float) -> Tuple[List[float], List[int], List[int]]:
+    """
+    미분류 구간의 길이별 로그 확률과 페널티 (알파벳만 / 그 외) — _segment_logprob, _penalty 와 같은 값.
+    """
+    logprob = [log_unk * length for length in range(max_len + 1)]
+    alpha_penalty = [length + 5 for length in range(max_len + 1)]
+    other_penalty = [length + (10 if length <= 2 else 5) for length in range(max_len + 1)]
+    return logprob, alpha_penalty, other_penalty
+
+
 def _best_path(text: str, max_len: int, log_unk: float) -> List[str]:
     """
     DP를 이용해 텍스트를 최적 분할하여 분할 리스트 반환.
+    ASCII 텍스트는 사전 색인으로 각 구간 점수를 바로 구하고 역포인터로 경로를 복원합니다.
+    (구간마다 is_english / is_korean 을 호출하던 방식과 같은 점수, 같은 동점 처리)
+    """
+    if not text.isascii():
+        # lower() 가 글자 수를 바꾸거나 casefold 와 다를 수 있는 텍스트는 기존 방식 그대로
+        return _best_path_generic(text, max_len, log_unk)
+
+    n = len(text)
+    lower = text.lower()
+    english = english_lexicon()
+    korean = korean_lexicon()
+    prefixes = _lexicon_prefixes()
+    # 앞에서부터 누적한 비알파벳 문자 수 (구간 isalpha 판정용)
+    non_alpha = [0]
+    for c in text:
+        non_alpha.append(non_alpha[-1] + (not c.isalpha()))
+    unk_logprob, alpha_penalty, other_penalty = _unknown_tables(max_len, log_unk)
+
+    score = [-math.inf] * (n + 1)
+    back = [0] * (n + 1)
+    score[0] = 0.0
+    # j 를 오름차순으로 밀어 주므로 같은 점수면 기존과 같이 가장 앞의 j 가 남음
+    for j in range(n):
+        base = score[j]
+        start_alpha = non_alpha[j]
+        end = min(n, j + max_len)
+        i = j + 1
+        # 1) 사전 키의 접두사인 동안: 사전 단어면 그 점수, 아니면 미분류 점수
+        while i <= end:
+            key = lower[j:i]
+            length = i - j
+            if length <= PREFIX_DEPTH and key not in prefixes:
+                break
+            alpha = non_alpha[i] == start_alpha
+            logprob = english.get(key)
+            original = get_original(text[j:i]) if logprob is None and key in korean else None
+            if logprob is not None:
+                penalty = 0.5  # 영어 단어 (항상 알파벳)
+            elif original and len(original) >= 2:
+                # is_korean / get_Htoken_prob 과 같은 판정과 확률 (원형 조회 한 번)
+                logprob = math.log(PROBS.get(original, 0))
+                penalty = 0.5 if alpha else 1.0
+            else:
+                logprob = unk_logprob[length]
+                penalty = alpha_penalty[length] if alpha else other_penalty[length]
+            candidate = base + logprob - penalty
+            if candidate > score[i]:
+                score[i] = candidate
+                back[i] = j
+            i += 1
+        # 2) 나머지 구간은 모두 미분류
+        for i in range(i, end + 1):
+            length = i - j
+            penalty = alpha_penalty[length] if non_alpha[i] == start_alpha else other_penalty[length]
+            candidate = base + unk_logprob[length] - penalty
+            if candidate > score[i]:
+                score[i] = candidate
+                back[i] = j
+
+    segments: List[str] = []
+    i = n
+    while i > 0:
+        segments.append(text[back[i]:i])
+        i = back[i]
+    segments.reverse()
+    return segments
+
+
+def _best_path_generic(text: str, max_len: int, log_unk: float) -> List[str]:
+    """
+    구간마다 세그먼트 판별 함수를 호출하는 DP (ASCII 가 아닌 텍스트용).
     """
     n = len(text)
     dp: List[Tuple[float, List[str]]] = [(-math.inf, []) for _ in range(n + 1)]
@@ -112,6 +218,27 @@ def _has_unlabeled_alpha(segs: List[Seg]) -> bool:
     """
     return any(lab is None and any(c.isalpha() for c in token) for token, lab in segs)
 
+#--------------------------------------------------------------------------------
+# Segment Cache Section
+#--------------------------------------------------------------------------------
+_CACHE = SegmentCache()
+
+
+def configure_segment_cache(path: Optional[str] = None, capacity: int = DEFAULT_CAPACITY) -> SegmentCache:
+    """
+    이 프로세스의 분할 캐시 설정. path 를 주면 SQLite 저장소를 함께 사용해
+    워커 간, 실행 간 분할 결과를 공유합니다. 같은 설정이면 기존 캐시를 그대로 유지.
+    """
+    global _CACHE
+    if _CACHE.path != path or _CACHE.capacity != capacity:
+        _CACHE.close()
+        _CACHE = SegmentCache(capacity=capacity, path=path)
+    return _CACHE
+
+
+def segment_cache() -> SegmentCache:
+    return _CACHE
+
 #--------------------------------------------------------------------------------
 # Segment Word Section
 #--------------------------------------------------------------------------------
@@ -127,8 +254,18 @@ def _try_transfrom_dubeol(text):
         update.append((seg, f"H{len(seg)}"))
     return True, update
 
-@functools.lru_cache(maxsize=10_000)
 def _segment_word(text: str, max_len: int = 20) -> List[Seg]:
+    """
+    _compute_segment_word 결과를 세그먼트 캐시(LRU + 선택적 디스크 저장소)를 거쳐 반환.
+    """
+    result = _CACHE.get(text, max_len)
+    if result is None:
+        result = _compute_segment_word(text, max_len)
+        _CACHE.put(text, max_len, result)
+    return result
+
+
+def _compute_segment_word(text: str, max_len: int = 20) -> List[Seg]:
     """
     최적 분할, 태깅, 보정, 병합 순으로 처리하여 최종 세그먼트 리스트 반환.
     """
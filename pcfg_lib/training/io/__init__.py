@@ -1,6 +1,35 @@
 # Auto-generated __init__.py
+# Submodules are imported lazily on first attribute access.
 
-from .omen_train_data_output import *
-from .pcfg_output import *
-from .train_data_parser import *
-from .train_output import *
+import importlib
+
+_SUBMODULES = ['omen_train_data_output', 'pcfg_output', 'train_data_parser', 'train_output']
+
+_LAZY_ATTRS = {
+    'PCFG_TABLES': 'pcfg_output',
+    'SAMPLE_BYTES': 'train_data_parser',
+    'TrainingDataParser': 'train_data_parser',
+    'load_counter_from_db': 'pcfg_output',
+    'load_omen_counts': 'omen_train_data_output',
+    'load_pcfg_counts': 'pcfg_output',
+    'make_sure_path_exists': 'train_output',
+    'save_counter_to_db': 'pcfg_output',
+    'save_omen_to_sqlite': 'omen_train_data_output',
+    'save_pcfg_to_sqlite': 'pcfg_output',
+}
+
+__all__ = sorted(set(_SUBMODULES) | set(_LAZY_ATTRS))
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return __all__
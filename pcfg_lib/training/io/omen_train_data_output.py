@@ -1,6 +1,15 @@
 import sqlite3
 from collections import Counter
 
+from pcfg_lib.training.omen.omen_parser import AlphabetGrammar, AlphabetGrammerNode
+
+
+def _level_count(entry) -> tuple:
+    """스무딩 후 (레벨, 횟수) 튜플 또는 레벨만 있는 값을 (레벨, 횟수) 로 맞춤"""
+    if isinstance(entry, (list, tuple)):
+        return entry[0], entry[1]
+    return entry, None
+
 def save_omen_to_sqlite(
     alphabet_grammar,
     omen_keyspace,
@@ -13,46 +22,46 @@ def save_omen_to_sqlite(
         conn = sqlite3.connect(db_path)
         c = conn.cursor()
 
+        # 레벨 옆의 count 는 스무딩 전 원본 횟수 (--update 학습이 새 데이터와 합산한 뒤 레벨을 다시 계산)
         # 1. 접두사
         c.execute("DROP TABLE IF EXISTS PrefixLevel")
-        c.execute("CREATE TABLE PrefixLevel (prefix TEXT PRIMARY KEY, level INTEGER)")
-        c.executemany("INSERT INTO PrefixLevel VALUES (?, ?)", [
-            (prefix, node.start_level)
+        c.execute("CREATE TABLE PrefixLevel (prefix TEXT PRIMARY KEY, level INTEGER, count INTEGER)")
+        c.executemany("INSERT INTO PrefixLevel VALUES (?, ?, ?)", [
+            (prefix, node.start_level, node.count_at_start)
             for prefix, node in alphabet_grammar.grammar.items()
         ])
 
         # 2. 접미사
         c.execute("DROP TABLE IF EXISTS SuffixLevel")
-        c.execute("CREATE TABLE SuffixLevel (prefix TEXT PRIMARY KEY, level INTEGER)")
-        c.executemany("INSERT INTO SuffixLevel VALUES (?, ?)", [
-            (prefix, node.end_level)
+        c.execute("CREATE TABLE SuffixLevel (prefix TEXT PRIMARY KEY, level INTEGER, count INTEGER)")
+        c.executemany("INSERT INTO SuffixLevel VALUES (?, ?, ?)", [
+            (prefix, node.end_level, node.count_at_end)
             for prefix, node in alphabet_grammar.grammar.items()
         ])
 
         # 3. 조건부 확률
         c.execute("DROP TABLE IF EXISTS ConditionalProb")
-        c.execute("CREATE TABLE ConditionalProb (token TEXT PRIMARY KEY, level INTEGER)")
+        c.execute("CREATE TABLE ConditionalProb (token TEXT PRIMARY KEY, level INTEGER, count INTEGER)")
         data = []
         for prefix, node in alphabet_grammar.grammar.items():
             for next_char, level_info in node.next_letter_candidates.items():
-                level = level_info[0] if isinstance(level_info, (list, tuple)) else level_info
-                data.append((prefix + next_char, level))
-        c.executemany("INSERT INTO ConditionalProb VALUES (?, ?)", data)
+                data.append((prefix + next_char, *_level_count(level_info)))
+        c.executemany("INSERT INTO ConditionalProb VALUES (?, ?, ?)", data)
 
         # 4. 길이 기반 레벨
         c.execute("DROP TABLE IF EXISTS LengthLevel")
-        c.execute("CREATE TABLE LengthLevel (level INTEGER)")
-        c.executemany("INSERT INTO LengthLevel VALUES (?)", [
-            (entry[0] if isinstance(entry, (list, tuple)) else entry,)
-            for entry in alphabet_grammar.ln_lookup
+        c.execute("CREATE TABLE LengthLevel (level INTEGER, count INTEGER)")
+        c.executemany("INSERT INTO LengthLevel VALUES (?, ?)", [
+            _level_count(entry) for entry in alphabet_grammar.ln_lookup
         ])
 
-        # 5. 설정 정보 (ngram, encoding)
+        # 5. 설정 정보 (ngram, encoding, 학습한 비밀번호 수)
         c.execute("DROP TABLE IF EXISTS Config")
         c.execute("CREATE TABLE Config (key TEXT PRIMARY KEY, value TEXT)")
         c.executemany("INSERT INTO Config VALUES (?, ?)", [
             ("ngram", str(program_info["ngram"])),
             ("encoding", program_info["encoding"]),
+            ("num_valid_passwords", str(num_valid_passwords)),
         ])
 
         # 6. 알파벳
@@ -89,3 +98,50 @@ def save_omen_to_sqlite(
     except Exception as e:
         print(f"[에러] OMEN 데이터 SQLite 저장 실패 → {e}")
         return False
+
+
+def load_omen_counts(db_path, program_info):
+    """
+    save_omen_to_sqlite 로 저장한 OMEN 모델의 원본 횟수를 읽어 스무딩 전 상태로 되돌립니다.
+    반환: (횟수만 채운 AlphabetGrammar, 레벨별 비밀번호 수 Counter, 학습한 비밀번호 수)
+    레벨별 비밀번호 수는 저장 당시 레벨 기준이므로, 합산 후에는 새 데이터만 새 레벨로 다시 센 근사값이 됩니다.
+    count 열이 없는 이전 형식이거나 ngram / 최대 길이가 현재 설정과 다르면 ValueError.
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        c = conn.cursor()
+        config = dict(c.execute("SELECT key, value FROM Config"))
+        if "num_valid_passwords" not in config:
+            raise ValueError("OMEN tables have no stored counts; retrain without --update first")
+        if int(config["ngram"]) != program_info["ngram"]:
+            raise ValueError(f"stored ngram {config['ngram']} does not match config.ini ngram {program_info['ngram']}")
+        lengths = [count for (count,) in c.execute("SELECT count FROM LengthLevel ORDER BY rowid")]
+        if len(lengths) != program_info["max_length"]:
+            raise ValueError(
+                f"stored max_length {len(lengths)} does not match config.ini max_length {program_info['max_length']}"
+            )
+
+        omen = AlphabetGrammar(
+            ngram=program_info["ngram"],
+            min_length=program_info["min_length"],
+            max_length=program_info["max_length"]
+        )
+        omen.ln_lookup = lengths
+        omen.ln_counter = sum(lengths)
+        for prefix, count in c.execute("SELECT prefix, count FROM PrefixLevel ORDER BY rowid"):
+            node = omen.grammar[prefix] = AlphabetGrammerNode()
+            node.count_at_start = count
+            omen.count_at_start += count
+        for prefix, count in c.execute("SELECT prefix, count FROM SuffixLevel ORDER BY rowid"):
+            omen.grammar[prefix].count_at_end = count
+            omen.count_at_end += count
+        # 중간 등장 횟수는 다음 문자 후보 횟수의 합
+        for token, count in c.execute("SELECT token, count FROM ConditionalProb ORDER BY rowid"):
+            node = omen.grammar[token[:-1]]
+            node.next_letter_candidates[token[-1]] = count
+            node.count_in_middle += count
+
+        levels = Counter(dict(c.execute("SELECT level, count FROM PasswordsPerLevel")))
+        return omen, levels, int(config["num_valid_passwords"])
+    finally:
+        conn.close()
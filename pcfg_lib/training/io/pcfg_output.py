@@ -1,23 +1,37 @@
 import sqlite3
-from collections import Counter
+from collections import Counter, defaultdict
+
+# (테이블, 트레이너 카운터 키, 단일 키로 감싸 저장하는 경우 그 키). 나머지는 길이별 카운터
+PCFG_TABLES = [
+    ("Keyboard",       "keyboard",        None),
+    ("Years",          "years",           "1"),
+    ("Alpha",          "alpha",           None),
+    ("Capitalization", "alpha_masks",     None),
+    ("Digits",         "digits",          None),
+    ("Special",        "special",         None),
+    ("Korean",         "korean",          None),
+    ("Grammar",        "base_structures", "grammar"),
+    ("Prince",         "prince",          "grammar"),
+]
 
 def _calculate_probabilities(counter: Counter) -> list[tuple]:
     total = sum(counter.values())
     if total == 0:
         return []
-    return [(item, count / total) for item, count in counter.items()]
+    return [(item, count / total, count) for item, count in counter.items()]
 
 def save_counter_to_db(conn, table_name: str, counter_map: dict):
     try:
         c = conn.cursor()
         c.execute(f"DROP TABLE IF EXISTS {table_name}")
-        c.execute(f"CREATE TABLE {table_name} (length TEXT, item TEXT, probability REAL)")
+        # count: 원본 등장 횟수 (--update 학습이 새 데이터와 합산한 뒤 확률을 다시 계산)
+        c.execute(f"CREATE TABLE {table_name} (length TEXT, item TEXT, probability REAL, count INTEGER)")
 
         for idx, counter in counter_map.items():
             prob_list = _calculate_probabilities(counter)
             c.executemany(
-                f"INSERT INTO {table_name} (length, item, probability) VALUES (?, ?, ?)",
-                [(str(idx), item, prob) for item, prob in prob_list]
+                f"INSERT INTO {table_name} (length, item, probability, count) VALUES (?, ?, ?, ?)",
+                [(str(idx), item, prob, count) for item, prob, count in prob_list]
             )
 
         conn.commit()
@@ -26,23 +40,28 @@ def save_counter_to_db(conn, table_name: str, counter_map: dict):
         print(f"[에러] 테이블 저장 실패: {table_name} → {e}")
         return False
 
+def load_counter_from_db(conn, table_name: str) -> dict:
+    """
+    save_counter_to_db 로 저장한 테이블의 원본 횟수를 {length: Counter} 로 읽습니다 (저장 순서 유지).
+    count 열이 없는 이전 형식의 DB 이면 ValueError.
+    """
+    counter_map = {}
+    try:
+        rows = conn.execute(f"SELECT length, item, count FROM {table_name} ORDER BY rowid")
+        for length, item, count in rows:
+            counter_map.setdefault(length, Counter())[item] = count
+    except sqlite3.OperationalError as e:
+        raise ValueError(f"'{table_name}' has no stored counts ({e}); retrain without --update first")
+    return counter_map
+
 def save_pcfg_to_sqlite(db_path, pcfg_parser):
     try:
         conn = sqlite3.connect(db_path)
 
-        mappings = [
-            ("Keyboard",       pcfg_parser.count_keyboard),
-            ("Years",          {'1': pcfg_parser.count_years}),
-            ("Alpha",          pcfg_parser.count_alpha),
-            ("Capitalization", pcfg_parser.count_alpha_masks),
-            ("Digits",         pcfg_parser.count_digits),
-            ("Special",        pcfg_parser.count_special),
-            ("Korean",         pcfg_parser.count_korean),
-            ("Grammar",        {'grammar': pcfg_parser.count_base_structures}),
-            ("Prince",         {'grammar': pcfg_parser.count_prince}),
-        ]
-
-        for table_name, counter_map in mappings:
+        for table_name, attr, wrap in PCFG_TABLES:
+            counter_map = getattr(pcfg_parser, f"count_{attr}")
+            if wrap is not None:
+                counter_map = {wrap: counter_map}
             if not save_counter_to_db(conn, table_name, counter_map):
                 print(f"[에러] '{table_name}' 테이블 저장 실패")
                 return False
@@ -52,3 +71,22 @@ def save_pcfg_to_sqlite(db_path, pcfg_parser):
     except Exception as e:
         print(f"[에러] 데이터베이스 저장 실패 → {e}")
         return False
+
+def load_pcfg_counts(db_path) -> dict:
+    """
+    저장된 PCFG 문법의 원본 횟수를 트레이너 워커 결과와 같은 형태
+    ({'keyboard': {길이: Counter}, 'years': Counter, ...}) 로 읽어 새 데이터 결과와 병합할 수 있게 합니다.
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        counts = {}
+        for table_name, attr, wrap in PCFG_TABLES:
+            counter_map = load_counter_from_db(conn, table_name)
+            if wrap is not None:
+                counts[attr] = counter_map.get(wrap, Counter())
+            else:
+                # 길이 인덱스는 학습 시와 같은 int 키로 복원 (새 구간 결과와 같은 키에 합산되도록)
+                counts[attr] = defaultdict(Counter, {int(k): v for k, v in counter_map.items()})
+        return counts
+    finally:
+        conn.close()
@@ -1,7 +1,11 @@
 # File: pcfg_lib/training/io/train_data_parser.py
+import os
 import sqlite3
 from typing import Iterator
 
+# 텍스트 파일 범위 분할 시 평균 줄 길이 추정에 쓰는 앞부분 크기
+SAMPLE_BYTES = 1 << 20
+
 class TrainingDataParser:
     def __init__(self, min_length: int, max_length: int, filedir: str, encoding: str = "utf-8"):
         self.min_length = min_length
@@ -30,26 +34,21 @@ class TrainingDataParser:
             return False
         return True
 
-    def count_passwords(self) -> int:
-        if self._mode == 'db':
-            self._cur.execute(f'SELECT COUNT(*) FROM {self.table_name}')
-            return self._cur.fetchone()[0]
-        count = 0
-        with open(self._file_path, 'r', encoding=self.encoding) as f:
-            for line in f:
-                pwd = line.rstrip('\r\n')
-                if pwd.startswith('$HEX[') and pwd.endswith(']'):
-                    try:
-                        pwd = bytes.fromhex(pwd[5:-1]).decode(self.encoding)
-                    except:
-                        continue
-                try:
-                    pwd.encode(self.encoding)
-                except UnicodeEncodeError:
-                    continue
-                if self.check_valid(pwd):
-                    count += 1
-        return count
+    def _normalize(self, line: str) -> str | None:
+        # 텍스트 한 줄 → 학습할 비밀번호 ($HEX[...] 디코딩, 인코딩/길이/문자 검사 실패 시 None)
+        pwd = line.rstrip('\r\n')
+        if pwd.startswith('$HEX[') and pwd.endswith(']'):
+            try:
+                pwd = bytes.fromhex(pwd[5:-1]).decode(self.encoding)
+            except:
+                return None
+        try:
+            pwd.encode(self.encoding)
+        except UnicodeEncodeError:
+            return None
+        if self.check_valid(pwd):
+            return pwd
+        return None
 
     def read_password(self) -> Iterator[str]:
         if self._mode == 'db':
@@ -62,18 +61,78 @@ class TrainingDataParser:
             with open(self._file_path, 'r', encoding=self.encoding) as f:
                 for line in f:
                     self.num_passwords += 1
-                    pwd = line.rstrip('\r\n')
-                    if pwd.startswith('$HEX[') and pwd.endswith(']'):
-                        try:
-                            pwd = bytes.fromhex(pwd[5:-1]).decode(self.encoding)
-                        except:
-                            continue
-                    try:
-                        pwd.encode(self.encoding)
-                    except UnicodeEncodeError:
-                        continue
-                    if self.check_valid(pwd):
+                    pwd = self._normalize(line)
+                    if pwd is not None:
                         yield pwd
+
+    #=======================================================================================================
+    #                              범위 분할 읽기 (워커가 각자 읽는 구간)
+    #=======================================================================================================
+    def input_size(self) -> int:
+        """split_ranges 구간 길이의 총합 (텍스트: 파일 바이트 수, DB: rowid 범위) — 진행률 분모"""
+        if self._mode == 'db':
+            self._cur.execute(f'SELECT MIN(rowid), MAX(rowid) FROM {self.table_name}')
+            lo, hi = self._cur.fetchone()
+            return 0 if lo is None else hi - lo + 1
+        return os.path.getsize(self._file_path)
+
+    def split_ranges(self, chunk_size: int) -> Iterator[tuple[int, int]]:
+        """
+        입력을 약 chunk_size 개 비밀번호 단위의 (start, end) 구간으로 나눕니다.
+        텍스트: 바이트 오프셋 (앞부분으로 추정한 평균 줄 길이 × chunk_size),
+        DB: rowid 구간. 구간 목록은 지연 생성되어 입력 크기와 무관하게 메모리를 쓰지 않습니다.
+        """
+        if self._mode == 'db':
+            self._cur.execute(f'SELECT MIN(rowid), MAX(rowid) FROM {self.table_name}')
+            lo, hi = self._cur.fetchone()
+            if lo is None:
+                return
+            for start in range(lo - 1, hi, chunk_size):
+                yield start, min(start + chunk_size, hi)
+            return
+        size = os.path.getsize(self._file_path)
+        with open(self._file_path, 'rb') as f:
+            sample = f.read(SAMPLE_BYTES)
+        avg_line = len(sample) / max(sample.count(b'\n'), 1)
+        step = max(int(avg_line * chunk_size), 1)
+        for start in range(0, size, step):
+            yield start, min(start + step, size)
+
+    def read_range(self, start: int, end: int) -> Iterator[str]:
+        """
+        split_ranges 구간 하나의 유효 비밀번호를 읽습니다 (num_passwords 는 읽은 줄 수).
+        텍스트 구간은 start 이상 end 미만에서 시작하는 줄을 맡으므로
+        인접 구간이 줄을 나눠 갖거나 겹쳐 읽지 않습니다.
+        """
+        if self._mode == 'db':
+            self._cur.execute(
+                f'SELECT password FROM {self.table_name} WHERE rowid > ? AND rowid <= ?', (start, end)
+            )
+            for (pwd,) in self._cur:
+                self.num_passwords += 1
+                if self.check_valid(pwd):
+                    yield pwd
+            return
+        with open(self._file_path, 'rb') as f:
+            pos = start
+            if start > 0:
+                # 직전 바이트부터 읽어 start 에 걸친 줄(앞 구간 소속)을 건너뜀
+                f.seek(start - 1)
+                pos = start - 1 + len(f.readline())
+            while pos < end:
+                raw = f.readline()
+                if not raw:
+                    break
+                pos += len(raw)
+                self.num_passwords += 1
+                try:
+                    line = raw.decode(self.encoding)
+                except UnicodeDecodeError:
+                    continue
+                pwd = self._normalize(line)
+                if pwd is not None:
+                    yield pwd
+
     def close(self):
         if self._mode == 'db':
-            self._conn.close()
\ No newline at end of file
+            self._conn.close()
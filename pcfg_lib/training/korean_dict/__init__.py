@@ -1,6 +1,60 @@
 # Auto-generated __init__.py
+# Submodules are imported lazily on first attribute access.
 
-from .data_parser import *
-from .io import *
-from .training_by_dataset import *
-from .util import *
+import importlib
+
+_SUBMODULES = ['data_parser', 'io', 'training_by_dataset', 'util']
+
+_LAZY_ATTRS = {
+    'BASE_URL': 'io',
+    'BATCH_SIZE': 'io',
+    'CUSTOM_DICT': 'util',
+    'DB_PATH': 'util',
+    'DDL': 'io',
+    'KoreanCopusParser': 'data_parser',
+    'MEANINGFUL_SINGLE_CHAR': 'util',
+    'NameListParser': 'data_parser',
+    'NewWordParser': 'data_parser',
+    'NewWordParser2': 'data_parser',
+    'NewWordParser3': 'data_parser',
+    'PARAMS': 'io',
+    'RE_HANGUL_SEQ': 'training_by_dataset',
+    'RE_ONLY_HANGUL': 'util',
+    'SERVICE_KEY': 'io',
+    'TabularNounParser': 'data_parser',
+    'VALID_WORDS': 'io',
+    'YoutubeCommentParser': 'data_parser',
+    'assign_parsers': 'training_by_dataset',
+    'caculate_prob_and_save_to_db': 'io',
+    'clean_and_save_to_sqlite': 'util',
+    'fetch_items': 'io',
+    'load_checkpoint_counts': 'io',
+    'load_checkpoint_done': 'io',
+    'load_loan_word': 'io',
+    'load_raw_korean_dict_from_db': 'util',
+    'main': 'training_by_dataset',
+    'parallel_process_resume': 'training_by_dataset',
+    'print_progress': 'training_by_dataset',
+    'process_with': 'training_by_dataset',
+    'save_checkpoint_counts': 'io',
+    'save_checkpoint_done': 'io',
+    'save_counter_to_sqlite': 'training_by_dataset',
+    'save_word_probs_to_sqlite': 'io',
+    'to_tuple': 'io',
+}
+
+__all__ = sorted(set(_SUBMODULES) | set(_LAZY_ATTRS))
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return __all__
@@ -1,7 +1,32 @@
 # Auto-generated __init__.py
+# Submodules are imported lazily on first attribute access.
 
-from .BaseParser import *
-from .korean_copus_parser import *
-from .name_parser import *
-from .new_word_parser import *
-from .word_parser import *
+import importlib
+
+_SUBMODULES = ['BaseParser', 'korean_copus_parser', 'name_parser', 'new_word_parser', 'word_parser']
+
+_LAZY_ATTRS = {
+    'KoreanCopusParser': 'korean_copus_parser',
+    'NameListParser': 'name_parser',
+    'NewWordParser': 'new_word_parser',
+    'NewWordParser2': 'new_word_parser',
+    'NewWordParser3': 'new_word_parser',
+    'TabularNounParser': 'word_parser',
+    'YoutubeCommentParser': 'korean_copus_parser',
+}
+
+__all__ = sorted(set(_SUBMODULES) | set(_LAZY_ATTRS))
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return __all__
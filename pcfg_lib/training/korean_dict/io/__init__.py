@@ -1,4 +1,42 @@
 # Auto-generated __init__.py
+# Submodules are imported lazily on first attribute access.
 
-from .parse_loanword import *
-from .save_load import *
+import importlib
+
+_SUBMODULES = ['parse_loanword', 'save_load']
+
+_LAZY_ATTRS = {
+    'BASE_URL': 'parse_loanword',
+    'BATCH_SIZE': 'parse_loanword',
+    'DB_PATH': 'save_load',
+    'DDL': 'parse_loanword',
+    'PARAMS': 'parse_loanword',
+    'SERVICE_KEY': 'parse_loanword',
+    'VALID_WORDS': 'save_load',
+    'caculate_prob_and_save_to_db': 'save_load',
+    'fetch_items': 'parse_loanword',
+    'load_checkpoint_counts': 'save_load',
+    'load_checkpoint_done': 'save_load',
+    'load_loan_word': 'save_load',
+    'main': 'parse_loanword',
+    'save_checkpoint_counts': 'save_load',
+    'save_checkpoint_done': 'save_load',
+    'save_word_probs_to_sqlite': 'save_load',
+    'to_tuple': 'parse_loanword',
+}
+
+__all__ = sorted(set(_SUBMODULES) | set(_LAZY_ATTRS))
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return __all__
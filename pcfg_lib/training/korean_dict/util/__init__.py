@@ -1,3 +1,31 @@
 # Auto-generated __init__.py
+# Submodules are imported lazily on first attribute access.
 
-from .post_clean_data import *
+import importlib
+
+_SUBMODULES = ['post_clean_data']
+
+_LAZY_ATTRS = {
+    'CUSTOM_DICT': 'post_clean_data',
+    'DB_PATH': 'post_clean_data',
+    'MEANINGFUL_SINGLE_CHAR': 'post_clean_data',
+    'RE_ONLY_HANGUL': 'post_clean_data',
+    'clean_and_save_to_sqlite': 'post_clean_data',
+    'load_raw_korean_dict_from_db': 'post_clean_data',
+}
+
+__all__ = sorted(set(_SUBMODULES) | set(_LAZY_ATTRS))
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return __all__
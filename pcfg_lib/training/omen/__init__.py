@@ -1,5 +1,33 @@
 # Auto-generated __init__.py
+# Submodules are imported lazily on first attribute access.
 
-from .evaluate_password import *
-from .omen_parser import *
-from .smoothing import *
+import importlib
+
+_SUBMODULES = ['evaluate_password', 'omen_parser', 'smoothing']
+
+_LAZY_ATTRS = {
+    'AlphabetGrammar': 'omen_parser',
+    'AlphabetGrammerNode': 'omen_parser',
+    'calc_omen_keyspace': 'evaluate_password',
+    'compile_level_table': 'evaluate_password',
+    'find_level': 'evaluate_password',
+    'find_omen_level': 'evaluate_password',
+    'smooth_grammar': 'smoothing',
+    'smooth_length': 'smoothing',
+}
+
+__all__ = sorted(set(_SUBMODULES) | set(_LAZY_ATTRS))
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return __all__
@@ -31,6 +31,41 @@ def find_omen_level(omen_trainer, password):
         return -1
 
 
+def compile_level_table(omen_trainer):
+    # find_level 용 읽기 전용 평탄화 테이블 (노드 객체 없이 dict / list 만 → 워커에 한 번만 전달)
+    # transitions 키는 IP + 다음 글자(= n-gram) 하나로, 위치마다 사전 조회 두 번을 한 번으로 줄임
+    return {
+        "ngram": omen_trainer.ngram,
+        "min_length": omen_trainer.min_length,
+        "max_length": omen_trainer.max_length,
+        "length_levels": [entry[0] for entry in omen_trainer.ln_lookup],
+        "starts": {ip: node.start_level for ip, node in omen_trainer.grammar.items()},
+        "transitions": {
+            ip + letter: level[0]
+            for ip, node in omen_trainer.grammar.items()
+            for letter, level in node.next_letter_candidates.items()
+        },
+    }
+
+
+def find_level(table, password):
+    # compile_level_table 결과로 find_omen_level 과 같은 레벨 계산 (없는 n-gram 이면 -1)
+    pw_len = len(password)
+    if pw_len < table["min_length"] or pw_len > table["max_length"]:
+        return -1
+    ngram = table["ngram"]
+    chain_level = table["starts"].get(password[0:ngram - 1])
+    if chain_level is None:
+        return -1
+    transitions = table["transitions"]
+    for end_pos in range(ngram, pw_len + 1):
+        level = transitions.get(password[end_pos - ngram:end_pos])
+        if level is None:
+            return -1
+        chain_level += level
+    return table["length_levels"][pw_len - 1] + chain_level
+
+
 def _rec_calc_keyspace(omen_trainer, level, length, ip):
     # 캐시 초기화: length, ip 조합이 없으면 새로 생성
     if length not in omen_trainer.grammar[ip].keyspace_cache:
@@ -65,7 +100,8 @@ def _rec_calc_keyspace(omen_trainer, level, length, ip):
     return omen_trainer.grammar[ip].keyspace_cache[length][level]
 
 
-def calc_omen_keyspace(omen_trainer, max_level=20, max_keyspace=10_000_000_000):
+def _calc_omen_keyspace_recursive(omen_trainer, max_level=20, max_keyspace=10_000_000_000):
+    # NumPy 가 없을 때 쓰는 재귀 + 노드별 캐시 구현
     # 레벨별 전체 키스페이스를 저장하는 Counter
     keyspace = Counter()
 
@@ -99,3 +135,120 @@ def calc_omen_keyspace(omen_trainer, max_level=20, max_keyspace=10_000_000_000):
         print(f"OMEN Keyspace for Level {level}: {keyspace[level]}")
 
     return keyspace
+
+
+# int64 누적이 넘칠 수 있으면 파이썬 정수(object) 배열로 전환하는 기준
+_INT64_MAX = 2 ** 63 - 1
+
+
+def _exact(array, factor):
+    # array 원소를 factor 개까지 더해도 int64 범위면 그대로, 아니면 정확한 파이썬 정수 배열로
+    if array.dtype == object or not array.size:
+        return array
+    if int(array.max()) > _INT64_MAX // max(factor, 1):
+        return array.astype(object)
+    return array
+
+
+def _keyspace_tables(omen_trainer, max_level):
+    """
+    남은 길이 L 별 (IP id, 남은 레벨) 키스페이스 표 tables[L] 을 동적 계획법으로 계산합니다.
+    tables[1][ip, lev] = 레벨이 정확히 lev 인 다음 글자 수
+    tables[L][ip, lev] = Σ_{글자 c: v = level(ip, c) ≤ lev} tables[L-1][ip[1:] + c, lev - v]
+    전이를 (출발 IP, 도착 IP, 레벨) 배열로 두고, 레벨 v 별로 도착 IP 행을 모아 출발 IP 별로 합산
+    """
+    import numpy as np
+
+    grammar = omen_trainer.grammar
+    index = {ip: i for i, ip in enumerate(grammar)}
+    width = max_level + 1
+    base = np.zeros((len(index), width), dtype=np.int64)
+    edges = {}                                      # 레벨 v → ([출발 id], [도착 id])
+    degree = np.zeros(len(index), dtype=np.int64)
+    for ip, node in grammar.items():
+        i = index[ip]
+        for letter, level in node.next_letter_candidates.items():
+            v = level[0]
+            if v <= max_level:
+                base[i, v] += 1
+            j = index.get(ip[1:] + letter)
+            if j is not None and v <= max_level:
+                src, dst = edges.setdefault(v, ([], []))
+                src.append(i)
+                dst.append(j)
+                degree[i] += 1
+
+    # 레벨별 전이를 출발 id 순으로 정렬해 두고 reduceat 구간 시작점 계산
+    grouped = []
+    for v, (src, dst) in sorted(edges.items()):
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        order = np.argsort(src, kind="stable")
+        src, dst = src[order], dst[order]
+        starts = np.flatnonzero(np.r_[True, src[1:] != src[:-1]])
+        grouped.append((v, src[starts], dst, starts))
+
+    max_degree = int(degree.max()) if len(degree) else 0
+    max_remaining = omen_trainer.max_length - omen_trainer.ngram + 1
+    tables = {1: base}
+    for length in range(2, max_remaining + 1):
+        prev = _exact(tables[length - 1], max_degree)
+        cur = np.zeros_like(prev)
+        for v, rows, dst, starts in grouped:
+            cur[rows, v:] += np.add.reduceat(prev[dst, :width - v], starts, axis=0)
+        tables[length] = cur
+    return index, tables
+
+
+def calc_omen_keyspace(omen_trainer, max_level=20, max_keyspace=10_000_000_000):
+    """
+    레벨별 OMEN 키스페이스 (재귀 구현과 같은 값, 같은 조기 종료 지점).
+    IP × 길이 조합의 기여분을 레벨마다 배열로 만들어 원래 순회 순서(IP 순, 길이 오름차순)의
+    누적합으로 max_keyspace 초과 지점을 찾습니다. NumPy 가 없으면 재귀 구현 사용.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return _calc_omen_keyspace_recursive(omen_trainer, max_level, max_keyspace)
+
+    keyspace = Counter()
+    index, tables = _keyspace_tables(omen_trainer, max_level)
+    if not index:
+        for level in range(1, max_level + 1):
+            print(f"OMEN Keyspace for Level {level}: {keyspace[level]}")
+        return keyspace
+
+    start_levels = np.array([node.start_level for node in omen_trainer.grammar.values()], dtype=np.int64)
+    lengths = [
+        (idx + 1, length_info[0])
+        for idx, length_info in enumerate(omen_trainer.ln_lookup)
+        if idx + 1 > omen_trainer.ngram
+    ]
+    for level in range(1, max_level + 1):
+        level_minus_ip = level - start_levels
+        active = level_minus_ip > 0
+        columns = []
+        counted = False                             # 이 레벨에서 더해진 (IP, 길이) 조합이 있는지
+        for length, ln_level in lengths:
+            remaining = level_minus_ip - ln_level
+            valid = active & (remaining >= 0)
+            counted = counted or bool(valid.any())
+            table = tables[length - omen_trainer.ngram + 1]
+            column = np.zeros(len(index), dtype=table.dtype)
+            column[valid] = table[np.flatnonzero(valid), remaining[valid]]
+            columns.append(column)
+        if counted:
+            # 행 = IP, 열 = 길이 → 행 우선으로 펼치면 원래 이중 루프의 덧셈 순서
+            contributions = np.stack(columns, axis=1).ravel()
+            contributions = _exact(contributions, contributions.size)
+            running = np.cumsum(contributions)
+            over = np.flatnonzero(running > max_keyspace)
+            if over.size:
+                keyspace[level] = int(running[over[0]])
+                return keyspace
+            # 재귀 구현처럼 더해진 조합이 있는 레벨만 키가 생김 (합이 0 이어도)
+            keyspace[level] = int(running[-1])
+        # 각 레벨 결과 출력 (디버그용)
+        print(f"OMEN Keyspace for Level {level}: {keyspace[level]}")
+
+    return keyspace
@@ -1,4 +1,27 @@
 # Auto-generated __init__.py
+# Submodules are imported lazily on first attribute access.
 
-from .pcfg_parser import *
-from .word_trie import *
+import importlib
+
+_SUBMODULES = ['pcfg_parser', 'word_counter']
+
+_LAZY_ATTRS = {
+    'PCFGParser': 'pcfg_parser',
+    'WordCounter': 'word_counter',
+}
+
+__all__ = sorted(set(_SUBMODULES) | set(_LAZY_ATTRS))
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return __all__
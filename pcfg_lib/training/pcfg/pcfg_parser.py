@@ -3,7 +3,7 @@ from collections import Counter
 from pcfg_lib.training.detectors.alphabet_detection import detect_alphabet
 from pcfg_lib.training.detectors.leet_detection import comb_leets_sections
 from pcfg_lib.training.detectors.word_dectection import detect_dictionary_word
-from pcfg_lib.training.pcfg.word_trie import WordTrie
+from pcfg_lib.training.pcfg.word_counter import WordCounter
 from pcfg_lib.training.detectors.digit_detection import digit_detection
 from pcfg_lib.training.detectors.keyboard_walk_detection import detect_keyboard_walk
 from pcfg_lib.training.detectors.other_detection import other_detection
@@ -16,9 +16,9 @@ class PCFGParser:
     #=======================================================================================================
     #                                        Initialization Section
     #=======================================================================================================
-    def __init__(self, word_trie: WordTrie):
-        # word_trie 기반 단어 검출기
-        self.word_detector = word_trie
+    def __init__(self, word_counter: WordCounter):
+        # 단어 등장 횟수 카운터
+        self.word_detector = word_counter
 
         # 전역 통계 저장용 카운터들
         self.count_keyboard = {}
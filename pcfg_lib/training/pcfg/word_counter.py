@@ -0,0 +1,78 @@
+from collections import Counter
+
+from pcfg_lib.training.util.english import normalize_leet
+from pcfg_lib.training.util.korean import get_original
+
+
+def _trie_order(words) -> list:
+    """
+    단어들을 같은 단어를 차례로 넣은 트라이의 전위 순회 순서로 정렬합니다.
+    각 접두사가 처음 등장한 순번의 나열을 키로 쓰면 (부모 먼저, 형제는 먼저 생긴 순)
+    노드를 만들지 않고도 기존 트라이 DFS 와 같은 출력 순서가 됩니다.
+    """
+    first_seen = {}
+    keys = {}
+    for word in words:
+        key = []
+        for end in range(1, len(word) + 1):
+            prefix = word[:end]
+            rank = first_seen.get(prefix)
+            if rank is None:
+                rank = first_seen[prefix] = len(first_seen)
+            key.append(rank)
+        keys[word] = key
+    return sorted(words, key=keys.__getitem__)
+
+
+class WordCounter:
+    #=======================================================================================================
+    #                                         Initialization Section
+    #=======================================================================================================
+    def __init__(self, needed_appear: int):
+        # 단어를 유효한 것으로 간주하기 위한 최소 등장 횟수
+        self.needed_appear = needed_appear
+        # 한글 단어 → 등장 횟수
+        self.korean_words = Counter()
+        # 알파벳 단어 → 등장 횟수
+        self.alpha_words = Counter()
+
+    #=======================================================================================================
+    #                                        Training Method
+    #========================================================================================================
+    def train_by_section(self, section_list : list):
+        # 각 섹션의 라벨에 따라 한글/영문 단어 카운트
+        for string, label in section_list:
+            if label.startswith('H'):
+                # 한글 단어 추가 (사전에 없는 H 구간은 입력 그대로, None 이 섞이면 정렬에서 실패)
+                self.korean_words[get_original(string) or string] += 1
+            elif label.startswith('A'):
+                # 알파벳 단어 추가
+                self.alpha_words[string.lower()] += 1
+                # Leet 변환 문자열도 추가 학습
+                leet_str = normalize_leet(string)
+                if leet_str != string:
+                    self.alpha_words[leet_str] += 1
+
+    def train(self, password: str, is_korean: bool, weight: int, make_to_word: bool = False):
+        # 단일 비밀번호를 한글/영문 카운터에 학습
+        words = self.korean_words if is_korean else self.alpha_words
+        offset = 0 if make_to_word else self.needed_appear
+        words[password] += 1 + offset
+
+    #=======================================================================================================
+    #                           Word Collection and Lookup Methods
+    #=======================================================================================================
+    def collect_all_words(self, words: Counter, min_count: int = None) -> list:
+        # 등장 횟수가 min_count 이상인 (단어, 횟수) 목록 (기존 트라이 순회와 같은 순서)
+        return [
+            (word, words[word]) for word in _trie_order(words)
+            if min_count is None or words[word] >= min_count
+        ]
+
+    def get_all_alpha_words(self) -> list:
+        # 필요 횟수 이상 등장한 알파벳 단어 반환
+        return self.collect_all_words(self.alpha_words, self.needed_appear)
+
+    def get_all_korean_words(self) -> list:
+        # 필요 횟수 이상 등장한 한글 단어 반환
+        return self.collect_all_words(self.korean_words, self.needed_appear)
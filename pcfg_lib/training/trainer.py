@@ -1,53 +1,67 @@
+import os
+import sqlite3
 import sys
 import traceback
 from collections import Counter, defaultdict
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from multiprocessing import cpu_count
-from itertools import islice
-from rich.progress import Progress, BarColumn, TimeElapsedColumn, TimeRemainingColumn
+from rich.progress import Progress, BarColumn, TaskProgressColumn, TimeElapsedColumn, TimeRemainingColumn
 
-from pcfg_lib import paths
+from pcfg_lib import paths, profiling
 from pcfg_lib.training.pcfg.pcfg_parser import PCFGParser
-from pcfg_lib.training.io.pcfg_output import save_pcfg_to_sqlite
-from pcfg_lib.training.pcfg.word_trie import WordTrie
+from pcfg_lib.training.io.pcfg_output import load_pcfg_counts, save_pcfg_to_sqlite
+from pcfg_lib.training.pcfg.word_counter import WordCounter
 from pcfg_lib.training.omen.omen_parser import AlphabetGrammar
-from pcfg_lib.training.omen.evaluate_password import calc_omen_keyspace, find_omen_level
-from pcfg_lib.training.io.omen_train_data_output import save_omen_to_sqlite
+from pcfg_lib.training.omen.evaluate_password import calc_omen_keyspace, compile_level_table, find_level
+from pcfg_lib.training.io.omen_train_data_output import load_omen_counts, save_omen_to_sqlite
 from pcfg_lib.training.io.train_data_parser import TrainingDataParser
+from pcfg_lib.training.detectors.word_dectection import configure_segment_cache
+from pcfg_lib.training.util.segment_cache import DEFAULT_CAPACITY, SegmentCache
 
 # =======================================================================================================
 #                                 Helper Functions Section
 # =======================================================================================================
 
-def _chunked_iterator(iterator, size):
-    """Iterator를 일정 크기(size)로 분할하여 청크 리스트를 생성합니다."""
-    it = iter(iterator)
-    while True:
-        chunk = list(islice(it, size))
-        if not chunk:
-            break
-        yield chunk
-
-
-def _worker_chunk(chunk, info):
+def _worker_chunk(bounds, info):
     """
     워커 프로세스에서 실행할 함수.
     PCFGParser와 AlphabetGrammar를 초기화하고,
-    주어진 패스워드 청크를 파싱하여 통계와 문법 객체를 반환합니다.
+    입력 파일의 bounds=(start, end) 구간을 직접 읽어 파싱한 뒤 통계와 문법 객체를 반환합니다.
+    (코디네이터가 비밀번호를 넘기지 않으므로 입력 크기와 무관하게 전달 비용이 일정)
     """
-    trie = WordTrie(needed_appear=info['needed_appear'])
-    p = PCFGParser(trie)
+    if info.get('profile_dir'):
+        profiling.enable_worker(info['profile_dir'])
+    # 분할 캐시는 프로세스당 한 번 구성되어 같은 워커가 처리하는 구간끼리 계속 재사용됨
+    cache = configure_segment_cache(info.get('segment_cache'), info.get('segment_cache_size') or DEFAULT_CAPACITY)
+    cache_before = cache.stats()
+    reader = TrainingDataParser(
+        min_length=info['min_length'],
+        max_length=info['max_length'],
+        filedir=info['data'],
+        encoding=info.get('encoding', 'utf-8')
+    )
+    words = WordCounter(needed_appear=info['needed_appear'])
+    p = PCFGParser(words)
     o = AlphabetGrammar(
         ngram=info['ngram'],
         min_length=info['min_length'],
         max_length=info['max_length']
     )
-    for pwd in chunk:
+    parsed = 0
+    for pwd in reader.read_range(*bounds):
         for section in p.parse(pwd):
             break
         o.parse(pwd)
+        parsed += 1
+    reader.close()
     p.calculate_word_tree()
+    # 다른 워커와 다음 실행이 바로 쓸 수 있도록 구간마다 디스크 캐시에 기록
+    cache.flush()
+    cache_stats = {k: v - cache_before[k] for k, v in cache.stats().items()}
+    profiling.dump_worker()
     return (
+        parsed,
+        reader.num_passwords,
         {
             'keyboard': p.count_keyboard,
             'years': p.count_years,
@@ -61,48 +75,98 @@ def _worker_chunk(chunk, info):
         },
         o.grammar,
         o.count_at_start,
-        o.count_at_end
+        o.count_at_end,
+        o.ln_lookup,
+        cache_stats
     )
 
+def _init_level_worker(table, info):
+    """레벨 카운트 워커 초기화: 평탄화된 OMEN 레벨 테이블을 프로세스당 한 번만 받아 둠"""
+    global LEVEL_TABLE
+    LEVEL_TABLE = table
+    if info.get('profile_dir'):
+        profiling.enable_worker(info['profile_dir'])
+
+
+def _level_chunk(bounds, info):
+    """
+    레벨 카운트 워커 함수: bounds 구간을 직접 읽어 비밀번호별 OMEN 레벨 개수를 반환합니다.
+    """
+    reader = TrainingDataParser(
+        min_length=info['min_length'],
+        max_length=info['max_length'],
+        filedir=info['data'],
+        encoding=info.get('encoding', 'utf-8')
+    )
+    table = LEVEL_TABLE
+    levels = Counter(find_level(table, pwd) for pwd in reader.read_range(*bounds))
+    reader.close()
+    profiling.dump_worker()
+    return levels
+
+
+def _stream_ranges(executor, ranges, fn, info, max_inflight):
+    """
+    ranges 의 구간을 fn(bounds, info) 로 제출하되 동시에 max_inflight 개까지만 유지하고,
+    끝나는 대로 (bounds, 결과) 를 yield 하며 다음 구간을 제출합니다 (backpressure).
+    """
+    inflight = {}                                   # Future → 담당 구간
+
+    def submit_next():
+        bounds = next(ranges, None)
+        if bounds is not None:
+            inflight[executor.submit(fn, bounds, info)] = bounds
+
+    for _ in range(max_inflight):
+        submit_next()
+    while inflight:
+        done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+        for f in done:
+            bounds = inflight.pop(f)
+            try:
+                result = f.result()
+            except Exception:
+                traceback.print_exc()
+                sys.exit(1)
+            yield bounds, result
+            submit_next()
+
 # =======================================================================================================
 #                                Merging Results Section
 # =======================================================================================================
 
-def _merge_counters(list_of_dicts):
+def _merge_counters(merged, d):
     """
-    Counter 및 defaultdict(Counter) 딕셔너리 목록을 병합하여 단일 딕셔너리로 반환합니다.
+    Counter 및 defaultdict(Counter) 딕셔너리 d 를 merged 에 누적합니다.
+    (워커 결과가 도착할 때마다 호출해 결과 목록을 쌓아 두지 않음)
     """
-    merged = {}
-    for d in list_of_dicts:
-        for key, counter in d.items():
-            if key not in merged:
-                if isinstance(counter, Counter):
-                    merged[key] = Counter()
-                else:
-                    merged[key] = defaultdict(Counter)
+    for key, counter in d.items():
+        if key not in merged:
             if isinstance(counter, Counter):
-                merged[key].update(counter)
+                merged[key] = Counter()
             else:
-                for inner_key, inner_counter in counter.items():
-                    merged[key][inner_key].update(inner_counter)
+                merged[key] = defaultdict(Counter)
+        if isinstance(counter, Counter):
+            merged[key].update(counter)
+        else:
+            for inner_key, inner_counter in counter.items():
+                merged[key][inner_key].update(inner_counter)
     return merged
 
 
-def _merge_grammar(dicts):
+def _merge_grammar(merged, grammar):
     """
-    AlphabetGrammar 문법 객체 목록을 병합하여 단일 문법 딕셔너리로 반환합니다.
+    AlphabetGrammar 문법 객체 grammar 를 merged 문법 딕셔너리에 누적합니다.
     """
-    merged = {}
-    for grammar in dicts:
-        for k, node in grammar.items():
-            if k not in merged:
-                merged[k] = type(node)()
-            m = merged[k]
-            m.count_at_start += node.count_at_start
-            m.count_in_middle += node.count_in_middle
-            m.count_at_end += node.count_at_end
-            for nxt, c in node.next_letter_candidates.items():
-                m.next_letter_candidates[nxt] = m.next_letter_candidates.get(nxt, 0) + c
+    for k, node in grammar.items():
+        if k not in merged:
+            merged[k] = type(node)()
+        m = merged[k]
+        m.count_at_start += node.count_at_start
+        m.count_in_middle += node.count_in_middle
+        m.count_at_end += node.count_at_end
+        for nxt, c in node.next_letter_candidates.items():
+            m.next_letter_candidates[nxt] = m.next_letter_candidates.get(nxt, 0) + c
     return merged
 
 # =======================================================================================================
@@ -112,6 +176,12 @@ def _merge_grammar(dicts):
 def start_train(program_info: dict, chunk_size: int = 10000):
     """
     PCFG 및 OMEN 병렬 트레이닝을 수행하고 결과를 SQLite에 저장합니다.
+    입력은 약 chunk_size 개 비밀번호 단위 구간으로 나뉘어 워커가 직접 읽고,
+    동시에 처리 중인 구간은 워커 수 × 2 개로 제한해 코퍼스 크기와 무관하게 메모리가 일정합니다.
+    program_info['workers'] / program_info['chunk_size'] 로 워커 수와 구간 크기 지정 가능.
+    program_info['segment_cache'] 를 주면 분할 결과를 SQLite 파일에 저장해 워커 간, 재학습 간 재사용.
+    program_info['update'] 이면 기존 DB 에 저장된 원본 횟수에 새 데이터의 횟수를 더해 확률 / 레벨을 다시 계산
+    (새 데이터만 읽음. OMEN 레벨별 비밀번호 수는 기존 값에 새 데이터의 새 레벨 기준 값을 더한 근사값).
     """
     # TrainingDataParser 초기화 및 전체 패스워드 수 확인
     parser = TrainingDataParser(
@@ -120,46 +190,68 @@ def start_train(program_info: dict, chunk_size: int = 10000):
         filedir=program_info['data'],
         encoding=program_info.get('encoding', 'utf-8')
     )
-    total = parser.count_passwords()
-    workers = min(cpu_count(), 8)
-    pcfg_results = []
-    omen_grammars = []
-    start_counts = []
-    end_counts = []
-
-    # 병렬 처리 및 진행률 표시
+    workers = program_info.get('workers') or min(cpu_count(), 8)
+    chunk_size = program_info.get('chunk_size') or chunk_size
+    max_inflight = workers * 2
+    dbfile = program_info.get('db_path') or str(paths.ROOT_PATH / 'sqlite3.db')
+    merged_pcfg = {}
+    merged_omen_grammar = {}
+    total_start = 0
+    total_end = 0
+    ln_lookup = [0] * program_info['max_length']    # 길이별 비밀번호 수
+    total = 0                                       # 유효 비밀번호 수 (본 파싱에서 함께 집계)
+    num_lines = 0                                   # 읽은 전체 줄 / 행 수
+    cache_stats = Counter()                         # 워커 분할 캐시 적중 / 실패 합계
+    levels = Counter()                              # OMEN 레벨별 비밀번호 수
+
+    if program_info.get('update'):
+        # 기존 문법의 원본 횟수를 병합 초기값으로 사용 (학습을 시작하기 전에 형식 / 설정 불일치 확인)
+        if not os.path.isfile(dbfile):
+            print(f"ERROR: cannot update {dbfile}: no such file")
+            sys.exit(1)
+        try:
+            merged_pcfg = load_pcfg_counts(dbfile)
+            old_omen, levels, num_lines = load_omen_counts(dbfile, program_info)
+        except (ValueError, sqlite3.Error) as e:
+            print(f"ERROR: cannot update {dbfile}: {e}")
+            sys.exit(1)
+        merged_omen_grammar = old_omen.grammar
+        total_start = old_omen.count_at_start
+        total_end = old_omen.count_at_end
+        ln_lookup = old_omen.ln_lookup
+        print(f"Updating {dbfile} ({num_lines:,} passwords already trained)")
+
+    # 병렬 처리 및 진행률 표시 (입력 전체를 미리 세지 않고 읽은 바이트 / 행 비율로 표시)
     with ProcessPoolExecutor(max_workers=workers) as executor, Progress(
         "[bold green]Training...[/]",
         BarColumn(),
-        "{task.completed}/{task.total}",
+        TaskProgressColumn(),
+        "{task.fields[parsed]:,} passwords",
         TimeElapsedColumn(),
         TimeRemainingColumn()
     ) as progress:
-        task = progress.add_task("Parsing", total=total)
-        futures = {}
-        for chunk in _chunked_iterator(parser.read_password(), chunk_size):
-            f = executor.submit(_worker_chunk, chunk, program_info)
-            futures[f] = len(chunk)
-        for f in as_completed(futures):
-            try:
-                pcfg_counts, omen_gram, cstart, cend = f.result()
-            except Exception:
-                traceback.print_exc()
-                sys.exit(1)
-            pcfg_results.append(pcfg_counts)
-            omen_grammars.append(omen_gram)
-            start_counts.append(cstart)
-            end_counts.append(cend)
-            progress.advance(task, futures[f])
-
-    # 결과 병합
-    merged_pcfg = _merge_counters(pcfg_results)
-    merged_omen_grammar = _merge_grammar(omen_grammars)
-    total_start = sum(start_counts)
-    total_end = sum(end_counts)
+        task = progress.add_task("Parsing", total=parser.input_size(), parsed=0)
+        # 구간 하나가 끝날 때마다 결과를 바로 병합
+        for (start, end), result in _stream_ranges(
+            executor, parser.split_ranges(chunk_size), _worker_chunk, program_info, max_inflight
+        ):
+            parsed, lines, pcfg_counts, omen_gram, cstart, cend, chunk_lengths, chunk_cache = result
+            _merge_counters(merged_pcfg, pcfg_counts)
+            _merge_grammar(merged_omen_grammar, omen_gram)
+            total_start += cstart
+            total_end += cend
+            ln_lookup = [a + b for a, b in zip(ln_lookup, chunk_lengths)]
+            total += parsed
+            num_lines += lines
+            cache_stats.update(chunk_cache)
+            progress.update(task, advance=end - start, parsed=total)
+    print(SegmentCache.format_stats(cache_stats))
+    if program_info.get('segment_cache'):
+        # 워커 연결이 남긴 WAL 을 캐시 파일에 합쳐 둠
+        SegmentCache(path=program_info['segment_cache']).close()
 
     # PCFGParser 및 OMEN 객체 초기화, 병합 결과 설정
-    pcfg = PCFGParser(WordTrie(needed_appear=program_info['needed_appear']))
+    pcfg = PCFGParser(WordCounter(needed_appear=program_info['needed_appear']))
     pcfg.count_keyboard = merged_pcfg['keyboard']
     pcfg.count_years = merged_pcfg['years']
     pcfg.count_alpha = merged_pcfg['alpha']
@@ -178,13 +270,16 @@ def start_train(program_info: dict, chunk_size: int = 10000):
     omen.grammar = merged_omen_grammar
     omen.count_at_start = total_start
     omen.count_at_end = total_end
+    omen.ln_lookup = ln_lookup
+    omen.ln_counter = sum(ln_lookup)
     omen.apply_smoothing()
     keyspace = calc_omen_keyspace(omen)
 
-    # 레벨 카운트 및 결과 저장
-    levels = Counter()
-    parser.num_passwords = 0
-    with Progress(
+    # 레벨 카운트: 스무딩된 OMEN 레벨 테이블을 워커에 한 번 전달하고 같은 구간 단위로 병렬 집계
+    table = compile_level_table(omen)
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_level_worker, initargs=(table, program_info)
+    ) as executor, Progress(
         "[bold blue]Level count...[/]",
         BarColumn(),
         "{task.completed}/{task.total}",
@@ -193,17 +288,18 @@ def start_train(program_info: dict, chunk_size: int = 10000):
         transient=True
     ) as progress2:
         task2 = progress2.add_task("Counting", total=total)
-        for pwd in parser.read_password():
-            levels[find_omen_level(omen, pwd)] += 1
-            progress2.advance(task2)
+        for _, chunk_levels in _stream_ranges(
+            executor, parser.split_ranges(chunk_size), _level_chunk, program_info, max_inflight
+        ):
+            levels.update(chunk_levels)
+            progress2.advance(task2, sum(chunk_levels.values()))
 
-    dbfile = str(paths.ROOT_PATH / 'sqlite3.db')
     save_pcfg_to_sqlite(pcfg_parser=pcfg, db_path=dbfile)
     save_omen_to_sqlite(
         alphabet_grammar=omen,
         omen_keyspace=keyspace,
         omen_levels_count=levels,
-        num_valid_passwords=parser.num_passwords,
+        num_valid_passwords=num_lines,
         db_path=dbfile,
         program_info=program_info
     )
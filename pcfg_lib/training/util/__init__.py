@@ -1,4 +1,84 @@
 # Auto-generated __init__.py
+# Submodules are imported lazily on first attribute access.
 
-from .english import *
-from .korean import *
+import importlib
+
+_SUBMODULES = ['english', 'korean', 'segment_cache']
+
+_LAZY_ATTRS = {
+    'CHARSET': 'korean',
+    'CHAR_INDICES': 'korean',
+    'CHAR_LISTS': 'korean',
+    'CHAR_SETS': 'korean',
+    'DEFAULT_CAPACITY': 'segment_cache',
+    'DUBEOL_FINAL': 'korean',
+    'DUBEOL_INITIAL': 'korean',
+    'DUBEOL_MEDIAL': 'korean',
+    'FINAL': 'korean',
+    'FLUSH_EVERY': 'segment_cache',
+    'INITIAL': 'korean',
+    'LEET_MAP': 'english',
+    'LeetMatcher': 'english',
+    'MEDIAL': 'korean',
+    'MIN_LEN': 'english',
+    'MIN_ZIPF': 'english',
+    'PHONETIC_SPELLING_MAP': 'korean',
+    'PROBS': 'korean',
+    'REV_FINAL': 'korean',
+    'REV_INITIAL': 'korean',
+    'REV_MEDIAL': 'korean',
+    'RE_HANGUL_TOKEN': 'korean',
+    'ROMAN_KEYS': 'korean',
+    'SEGMENTER_VERSION': 'segment_cache',
+    'STOPWORDS': 'korean',
+    'Seg': 'segment_cache',
+    'SegmentCache': 'segment_cache',
+    'VALID_WORDS': 'english',
+    'check_hangul': 'korean',
+    'english_lexicon': 'english',
+    'extract_clean_hangul': 'korean',
+    'find_leet_words': 'english',
+    'get_Htoken_prob': 'korean',
+    'get_alphabet_mask': 'english',
+    'get_english_prob': 'english',
+    'get_jamo_type': 'korean',
+    'get_korean_caps_mask': 'korean',
+    'get_original': 'korean',
+    'hangul2dubeol': 'korean',
+    'hangul2roman': 'korean',
+    'is_contains_single_jamo': 'korean',
+    'is_english': 'english',
+    'is_hangul_compat_jamo': 'korean',
+    'is_hangul_jamo': 'korean',
+    'is_hangul_jamo_exta': 'korean',
+    'is_hangul_jamo_extb': 'korean',
+    'is_hangul_syllable': 'korean',
+    'is_korean': 'korean',
+    'is_pure_korean': 'korean',
+    'is_supported_hangul': 'korean',
+    'is_valid_alpha_token': 'english',
+    'join_jamos': 'korean',
+    'join_jamos_char': 'korean',
+    'korean_lexicon': 'korean',
+    'lexicon_version': 'segment_cache',
+    'load_stopwords': 'korean',
+    'normalize_leet': 'english',
+    'normalize_phonetic_spelling': 'korean',
+    'roman2jamo': 'korean',
+}
+
+__all__ = sorted(set(_SUBMODULES) | set(_LAZY_ATTRS))
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return __all__
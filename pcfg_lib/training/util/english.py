@@ -1,5 +1,6 @@
+import unicodedata
 from typing import List, Tuple, Optional
-from wordfreq import top_n_list, zipf_frequency
+from wordfreq import iter_wordlist, top_n_list, zipf_frequency
 
 #=======================================================================================================
 # Constants Section
@@ -91,6 +92,17 @@ def get_english_prob(seg: str) -> float:
     # 단어의 Zipf 빈도에 문자수 기반 가중치 추가
     return zipf_frequency(seg.lower(), "en") + len(seg) * 0.1
 
+
+_ENGLISH_LEXICON: Optional[dict] = None
+
+
+def english_lexicon() -> dict:
+    # is_english 를 만족하는 소문자 단어 → get_english_prob (첫 호출 때 한 번 계산)
+    global _ENGLISH_LEXICON
+    if _ENGLISH_LEXICON is None:
+        _ENGLISH_LEXICON = {word: get_english_prob(word) for word in _EN_TOP if is_english(word)}
+    return _ENGLISH_LEXICON
+
 #=======================================================================================================
 # Leet Mapping Section
 #=======================================================================================================
@@ -109,17 +121,103 @@ def _has_leet(raw: str) -> bool:
     return any(c.lower() in LEET_MAP and LEET_MAP[c.lower()] != c.lower() for c in raw)
 
 
+def _leet_dictionary() -> List[str]:
+    # _good 를 만족하는 모든 단어 (빈도순 목록이므로 Zipf 가 MIN_ZIPF 아래로 내려가면 중단)
+    words = []
+    for word in iter_wordlist("en"):
+        if zipf_frequency(word, "en") < MIN_ZIPF:
+            break
+        if word.isalpha() and len(word) >= MIN_LEN:
+            words.append(word)
+    return words
+
+
+class LeetMatcher:
+    """
+    유효 단어 사전의 Aho-Corasick 오토마톤.
+    normalize_leet 은 문자 하나씩 디코딩하므로, 원문을 문자별로 디코딩한 흐름을 한 번 훑으면
+    디코딩 결과가 사전 단어가 되는 모든 부분 문자열을 찾을 수 있습니다.
+    """
+
+    def __init__(self, words: List[str]):
+        self.goto = [{}]                            # 상태 → {문자: 다음 상태}
+        self.output = [[]]                          # 상태 → 이 상태에서 끝나는 단어들
+        for word in words:
+            state = 0
+            for ch in word:
+                nxt = self.goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[state][ch] = nxt
+                    self.goto.append({})
+                    self.output.append([])
+                state = nxt
+            self.output[state].append(word)
+
+        # BFS 로 실패 링크를 만들고, 실패 링크 쪽 출력을 합쳐 둠
+        self.fail = [0] * len(self.goto)
+        frontier = list(self.goto[0].values())
+        while frontier:
+            nxt_frontier = []
+            for state in frontier:
+                for ch, child in self.goto[state].items():
+                    f = self.fail[state]
+                    while f and ch not in self.goto[f]:
+                        f = self.fail[f]
+                    target = self.goto[f].get(ch, 0)
+                    self.fail[child] = target if target != child else 0
+                    self.output[child] = self.output[child] + self.output[self.fail[child]]
+                    nxt_frontier.append(child)
+            frontier = nxt_frontier
+
+    def find(self, text: str) -> List[Tuple[int, int, str, str]]:
+        # 문자별 디코딩 조각과 leet 치환 여부 누적합
+        # 오토마톤은 NFKC + casefold 한 형태로 훑어 wordfreq 정규화로 사전 단어가 되는 후보까지 찾음
+        pieces = [LEET_MAP.get(c.lower(), c.lower()) for c in text]
+        folded = [unicodedata.normalize("NFKC", piece).casefold() for piece in pieces]
+        leet_count = [0]
+        for c in text:
+            leet_count.append(leet_count[-1] + _has_leet(c))
+
+        # 조회 오프셋 → 원문 인덱스 (한 문자가 여러 글자로 바뀌면 둘이 다름)
+        boundary = {}
+        offset = 0
+        for k, piece in enumerate(folded):
+            boundary[offset] = k
+            offset += len(piece)
+
+        goto, fail, output = self.goto, self.fail, self.output
+        hits: List[Tuple[int, int, str, str]] = []
+        state = offset = 0
+        for k, piece in enumerate(folded):
+            for ch in piece:
+                while state and ch not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(ch, 0)
+            offset += len(piece)
+            j = k + 1
+            for word in output[state]:
+                i = boundary.get(offset - len(word))
+                # 원문 2글자 이상, leet 치환이 하나 이상 포함된 구간만
+                if i is None or j - i < 2 or leet_count[j] == leet_count[i]:
+                    continue
+                decoded = ''.join(pieces[i:j])
+                # ASCII 가 아닌 후보는 정규화 결과가 사전 단어라도 점수가 다를 수 있어 직접 확인
+                if decoded.isalpha() and (decoded.isascii() or _good(decoded)):
+                    hits.append((i, j, text[i:j], decoded))
+        hits.sort(key=lambda hit: (hit[0], hit[1]))
+        return hits
+
+
+_LEET_MATCHER: Optional[LeetMatcher] = None
+
+
 def find_leet_words(text: str) -> List[Tuple[int,int,str,str]]:
-    # 모든 부분 문자열에 대해 leet 디코딩 후 유효 단어 조건 검사
-    n = len(text)
-    hits: List[Tuple[int,int,str,str]] = []
-    for i in range(n):
-        for j in range(i + 2, n + 1):
-            raw = text[i:j]
-            decoded = normalize_leet(raw)
-            if decoded.isalpha() and _good(decoded) and _has_leet(raw):
-                hits.append((i, j, raw, decoded))
-    return hits
+    # 디코딩 결과가 유효 단어인 leet 부분 문자열 (사전 오토마톤으로 한 번에 탐색, 첫 호출 때 생성)
+    global _LEET_MATCHER
+    if _LEET_MATCHER is None:
+        _LEET_MATCHER = LeetMatcher(_leet_dictionary())
+    return _LEET_MATCHER.find(text)
 
 #=======================================================================================================
 # Mask Utilities Section
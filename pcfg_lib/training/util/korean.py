@@ -6,7 +6,6 @@ from pathlib import Path
 
 from jamo import h2j, j2hcj
 from korean_romanizer import Romanizer
-from eunjeon import Mecab
 import YaleKorean
 
 from pcfg_lib import paths
@@ -37,6 +36,11 @@ DUBEOL_FINAL = {
 REV_INITIAL = {v: k for k, v in DUBEOL_INITIAL.items()}
 REV_MEDIAL  = {v: k for k, v in DUBEOL_MEDIAL.items()}
 REV_FINAL   = {v: k for k, v in DUBEOL_FINAL.items()}
+# roman2jamo 가 앞에서부터 탐욕적으로 맞춰 볼 키 시퀀스 (길이 내림차순)
+ROMAN_KEYS = sorted(
+    list(REV_INITIAL) + list(REV_MEDIAL) + list(REV_FINAL),
+    key=len, reverse=True
+)
 
 # 자모 유니코드 블록 및 인덱스
 INITIAL = 0x001
@@ -146,14 +150,9 @@ def hangul2roman(text: str) -> set:
 def roman2jamo(seq: str) -> list[str] | None:
     # 로마자 시퀀스를 두벌식 자모 리스트로 변환
     i = 0; jamos = []
-    # 키 시퀀스 길이 내림차순 정렬
-    all_keys = sorted(
-        list(REV_INITIAL) + list(REV_MEDIAL) + list(REV_FINAL),
-        key=len, reverse=True
-    )
     while i < len(seq):
         flag = False
-        for k in all_keys:
+        for k in ROMAN_KEYS:
             if seq.startswith(k, i):
                 # 역매핑 후 자모 추가
                 jamos.append(REV_INITIAL.get(k) or REV_MEDIAL.get(k) or REV_FINAL.get(k))
@@ -188,9 +187,17 @@ def load_stopwords(path: str) -> set[str]:
 
 # 불용어셋 초기화
 STOPWORDS = load_stopwords(os.path.join(paths.DATA_PATH, "STOPWORD.txt"))
-# 한글 토큰 정규식 및 형태소 분석기
+# 한글 토큰 정규식 및 형태소 분석기 (형태소 분석기는 처음 사용할 때 생성)
 RE_HANGUL_TOKEN = re.compile(r"[가-힣]+")
-mecab = Mecab()
+_mecab = None
+
+
+def _get_mecab():
+    global _mecab
+    if _mecab is None:
+        from eunjeon import Mecab
+        _mecab = Mecab()
+    return _mecab
 
 #=======================================================================================================
 # Noun Extraction Section
@@ -198,7 +205,7 @@ mecab = Mecab()
 
 def extract_clean_hangul(text: str) -> tuple[list[str], list[str]]:
     # NN... tags 이용해 일반 명사(NNG)와 고유 명사(NNP) 추출
-    tokens = mecab.pos(text)
+    tokens = _get_mecab().pos(text)
     NNG, NNP = [], []
     for word, tag in tokens:
         if tag == "NNG": NNG.append(word)
@@ -239,6 +246,11 @@ def get_original(roman: str) -> str | None:
     return None
 
 
+def korean_lexicon() -> dict[str, list[str]]:
+    # casefold 한 로마자 → 사전 토큰 목록 (get_original 을 부르기 전 빠른 존재 확인용)
+    return _BUCKET
+
+
 def get_Htoken_prob(token: str) -> float:
     # 토큰의 unigram 확률 반환
     orig = get_original(token)
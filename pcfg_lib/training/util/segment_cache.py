@@ -0,0 +1,144 @@
+import json
+import os
+import sqlite3
+from collections import OrderedDict
+from hashlib import blake2b
+from importlib.metadata import PackageNotFoundError, version as package_version
+from typing import List, Optional, Tuple
+
+from pcfg_lib import paths
+
+#=======================================================================================================
+# Constants Section
+#=======================================================================================================
+Seg = Tuple[str, Optional[str]]  # 세그먼트 타입: (텍스트, 레이블)
+
+# 프로세스 내 LRU 크기 (기존 lru_cache 는 10,000)
+DEFAULT_CAPACITY = 200_000
+# 디스크에 모아서 쓰는 새 항목 수
+FLUSH_EVERY = 5_000
+# 분할 규칙이 바뀌면 올려서 이전 디스크 캐시를 무효화
+SEGMENTER_VERSION = 1
+
+
+def lexicon_version() -> str:
+    """
+    분할 결과를 좌우하는 사전 구성의 버전 문자열.
+    wordfreq 버전, 한글 확률 사전 DB 의 크기 / 수정 시각, SEGMENTER_VERSION 이 같을 때만 캐시를 재사용합니다.
+    """
+    try:
+        wordfreq = package_version("wordfreq")
+    except PackageNotFoundError:
+        wordfreq = "unknown"
+    try:
+        st = os.stat(paths.KOREAN_DICT_DB_PATH)
+        korean = f"{st.st_size}:{st.st_mtime_ns}"
+    except OSError:
+        korean = "missing"
+    raw = f"{SEGMENTER_VERSION}|{wordfreq}|{korean}"
+    return blake2b(raw.encode(), digest_size=8).hexdigest()
+
+#=======================================================================================================
+#                  분할 결과 캐시: 프로세스 내 LRU + (선택) 워커와 실행 간 공유되는 SQLite 저장소
+#=======================================================================================================
+class SegmentCache:
+    #----------------------------------------------------------------------------------
+    # 초기화
+    # capacity: 프로세스 내 LRU 항목 수
+    # path: SQLite 캐시 파일 (None 이면 메모리만 사용). WAL 모드라 여러 워커가 동시에 읽고 씀
+    # version: 사전 버전 (None 이면 lexicon_version()), 다른 버전의 디스크 항목은 조회되지 않음
+    #----------------------------------------------------------------------------------
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, path: Optional[str] = None, version: Optional[str] = None):
+        self.capacity = capacity
+        self.path = path
+        self.version = version or (lexicon_version() if path else "")
+        self._lru: "OrderedDict[Tuple[str, int], List[Seg]]" = OrderedDict()
+        self._pending: List[tuple] = []             # 디스크에 아직 쓰지 않은 새 항목
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._conn = None
+        if path:
+            self._conn = sqlite3.connect(path, timeout=60)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS segments ("
+                "version TEXT, max_len INTEGER, text TEXT, result TEXT, "
+                "PRIMARY KEY (version, max_len, text)) WITHOUT ROWID"
+            )
+            self._conn.commit()
+
+    #----------------------------------------------------------------------------------
+    # 조회: LRU → 디스크 순, 없으면 None
+    #----------------------------------------------------------------------------------
+    def get(self, text: str, max_len: int) -> Optional[List[Seg]]:
+        key = (text, max_len)
+        result = self._lru.get(key)
+        if result is not None:
+            self._lru.move_to_end(key)
+            self.memory_hits += 1
+            return result
+        if self._conn is not None:
+            row = self._conn.execute(
+                "SELECT result FROM segments WHERE version = ? AND max_len = ? AND text = ?",
+                (self.version, max_len, text)
+            ).fetchone()
+            if row is not None:
+                result = [tuple(seg) for seg in json.loads(row[0])]
+                self._remember(key, result)
+                self.disk_hits += 1
+                return result
+        self.misses += 1
+        return None
+
+    #----------------------------------------------------------------------------------
+    # 저장: LRU 에 넣고, 디스크 저장소가 있으면 FLUSH_EVERY 개씩 모아서 기록
+    #----------------------------------------------------------------------------------
+    def put(self, text: str, max_len: int, result: List[Seg]):
+        self._remember((text, max_len), result)
+        if self._conn is not None:
+            self._pending.append((self.version, max_len, text, json.dumps(result, ensure_ascii=False)))
+            if len(self._pending) >= FLUSH_EVERY:
+                self.flush()
+
+    def _remember(self, key: Tuple[str, int], result: List[Seg]):
+        self._lru[key] = result
+        if len(self._lru) > self.capacity:
+            self._lru.popitem(last=False)
+
+    def flush(self):
+        """모아 둔 새 항목을 디스크에 기록 (다른 워커가 먼저 쓴 항목은 무시)"""
+        if self._conn is None or not self._pending:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO segments (version, max_len, text, result) VALUES (?, ?, ?, ?)",
+                self._pending
+            )
+        self._pending.clear()
+
+    def close(self):
+        """남은 항목을 기록하고 WAL 을 본 파일에 합친 뒤 연결 종료"""
+        self.flush()
+        if self._conn is not None:
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._conn.close()
+            self._conn = None
+
+    #----------------------------------------------------------------------------------
+    # 통계: 누적 적중 / 실패 수
+    #----------------------------------------------------------------------------------
+    def stats(self) -> dict:
+        return {"memory_hits": self.memory_hits, "disk_hits": self.disk_hits, "misses": self.misses}
+
+    @staticmethod
+    def format_stats(stats: dict) -> str:
+        hits = stats["memory_hits"] + stats["disk_hits"]
+        lookups = hits + stats["misses"]
+        rate = hits / lookups * 100 if lookups else 0.0
+        return (
+            f"Segment cache: {hits:,}/{lookups:,} hits ({rate:.1f}%; "
+            f"memory {stats['memory_hits']:,}, disk {stats['disk_hits']:,})"
+        )
@@ -0,0 +1,79 @@
+import math
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from pcfg_lib.guess.crack import PCFGSession
+
+
+def _session(**overrides):
+    """__init__ 의 Manager / 워커 풀 없이 종료 조건 검사에 필요한 상태만 채운 세션"""
+    session = PCFGSession.__new__(PCFGSession)
+    session.hashes = {"h1", "h2"}
+    session.found = {}
+    session.generated = 0
+    session.duplicates = 0
+    session.dispatched = 0
+    session.max_guesses = None
+    session.time_budget = None
+    session.min_log_prob = None
+    session.current_prob = -math.inf
+    session.start_ts = time.time()
+    session.queue = ["pending node"]
+    session.worker = SimpleNamespace(inflight={})
+    for key, value in overrides.items():
+        setattr(session, key, value)
+    return session
+
+
+def test_budget_stop_when_nodes_yield_fewer_guesses_than_dispatched():
+    # 중복 제거로 199,999 개만 생성됐지만 예산만큼 제출했고 처리 중인 노드가 없음
+    session = _session(max_guesses=200_000, dispatched=200_000, generated=199_999)
+    assert session._check_stop() == "guess budget reached"
+
+
+def test_no_budget_stop_while_dispatched_nodes_are_inflight():
+    session = _session(
+        max_guesses=200_000, dispatched=200_000, generated=150_000,
+        worker=SimpleNamespace(inflight={"future": "node"}),
+    )
+    assert session._check_stop() is None
+
+
+def test_no_budget_stop_before_budget_is_dispatched():
+    session = _session(max_guesses=200_000, dispatched=100_000, generated=100_000)
+    assert session._check_stop() is None
+
+
+def test_budget_stop_on_generated_guesses():
+    session = _session(
+        max_guesses=10, dispatched=10, generated=10,
+        worker=SimpleNamespace(inflight={"future": "node"}),
+    )
+    assert session._check_stop() == "guess budget reached"
+
+
+def test_budget_counts_guesses_skipped_by_dedup():
+    # 중복으로 건너뛴 추측은 큐로 오지 않으므로 워커 통계의 중복 수까지 더해 예산과 비교
+    session = _session(
+        max_guesses=200_000, dispatched=200_000, generated=199_994, duplicates=6,
+        worker=SimpleNamespace(inflight={"future": "node"}),
+    )
+    assert session._check_stop() == "guess budget reached"
+
+
+def test_dedup_filter_closed_when_run_fails():
+    closed = []
+
+    def fail():
+        raise RuntimeError("worker pool failed to start")
+
+    session = _session(
+        ui=SimpleNamespace(console=None),
+        worker=SimpleNamespace(inflight={}, start=fail),
+        dedup=SimpleNamespace(close=lambda: closed.append(True)),
+    )
+    with pytest.raises(RuntimeError):
+        session.run()
+    assert closed == [True]
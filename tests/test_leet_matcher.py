@@ -0,0 +1,41 @@
+from pathlib import Path
+
+from pcfg_lib.training.util.english import _good, _has_leet, find_leet_words, normalize_leet
+
+CORPUS = Path(__file__).resolve().parent.parent / "Resource" / "TrainingData" / "korean_password_candidates.txt"
+
+# 자주 쓰이는 leet 표기, 비 ASCII 대소문자 변환 ('ſ', 'İ', 'K'), 한글 구간
+EXTRA = [
+    "p@$$w0rd", "h3ll0w0rld", "L0V3", "m0nk3y", "dr@g0n", "5unsh1ne", "1ov3you",
+    "ph0t0gr@ph", "ſuper1ove", "İ1ove", "Kn1ght", "사랑l0ve", "", "a", "@",
+]
+
+
+def _reference_find_leet_words(text):
+    # 기존 O(n²) 구현: 모든 부분 문자열을 leet 디코딩해 유효 단어 조건 검사
+    n = len(text)
+    hits = []
+    for i in range(n):
+        for j in range(i + 2, n + 1):
+            raw = text[i:j]
+            decoded = normalize_leet(raw)
+            if decoded.isalpha() and _good(decoded) and _has_leet(raw):
+                hits.append((i, j, raw, decoded))
+    return hits
+
+
+def _sample():
+    with open(CORPUS, encoding="utf-8") as f:
+        lines = [line.rstrip("\n") for line in f]
+    return lines[::10] + EXTRA
+
+
+def test_matcher_finds_identical_hits_on_corpus_sample():
+    found = 0
+    for text in _sample():
+        expected = _reference_find_leet_words(text)
+        assert find_leet_words(text) == expected, text
+        found += len(expected)
+    # 표본이 실제로 leet 단어를 포함하는지 확인 (빈 결과끼리만 비교하지 않도록)
+    assert found > 0
+
@@ -0,0 +1,77 @@
+import contextlib
+import io
+
+import pytest
+
+from benchmarks.synthetic import make_grammar_db
+from pcfg_lib.guess.omen.memorizer import Memorizer
+from pcfg_lib.guess.omen.omen_io import load_omen_rules, restrict_omen_lengths
+from pcfg_lib.guess.pcfg.pcfg_guesser import PCFGGuesser
+
+
+@pytest.fixture(scope="module")
+def grammar_db(tmp_path_factory):
+    return str(make_grammar_db(tmp_path_factory.mktemp("length") / "grammar.db", size=2000, ngram=2))
+
+
+def _guesser(pw_min=None, pw_max=None):
+    """문법 로딩 없이 길이 정책 검사에 필요한 상태만 채운 생성기"""
+    guesser = PCFGGuesser.__new__(PCFGGuesser)
+    guesser.pw_min = pw_min
+    guesser.pw_max = pw_max
+    return guesser
+
+
+@pytest.mark.parametrize("sym, length", [
+    ("A5", 5), ("D12", 12), ("K4", 4), ("Y1", 4), ("C5", 0), ("M", None),
+])
+def test_symbol_length(sym, length):
+    assert PCFGGuesser.symbol_length(sym) == length
+
+
+@pytest.mark.parametrize("replacements, allowed", [
+    (["A5", "C5", "D3"], True),         # 8: C 는 길이에 더하지 않음
+    (["A4", "C4", "D3"], False),        # 7 < 8
+    (["K4", "Y1"], True),               # 8: Y 는 4 글자
+    (["Y1", "D2"], False),              # 6 < 8
+    (["A6", "C6", "D4", "K3"], False),  # 13 > 12
+    (["D12"], True),                    # 12
+    (["M"], True),                      # 가변 길이는 OMEN 길이 레벨에서 제한
+])
+def test_is_length_allowed(replacements, allowed):
+    assert _guesser(8, 12)._is_length_allowed(replacements) is allowed
+
+
+def test_no_limits_allow_everything():
+    assert _guesser()._is_length_allowed(["A1"])
+    assert _guesser()._is_length_allowed(["A40", "D40"])
+
+
+def test_base_structures_pruned_by_length(grammar_db):
+    with contextlib.redirect_stdout(io.StringIO()):
+        unrestricted = PCFGGuesser({"grammar_db": grammar_db}).initialize_base_structures()
+        restricted = PCFGGuesser({"grammar_db": grammar_db, "pw_min": 6, "pw_max": 8})
+    nodes = restricted.initialize_base_structures()
+    assert 0 < len(nodes) < len(unrestricted)
+    for node in nodes:
+        length = sum(PCFGGuesser.symbol_length(st.symbol) for st in node.structures)
+        assert 6 <= length <= 8
+        assert all(6 <= len(pw) <= 8 for pw in restricted.guess(node.structures))
+
+
+def test_restrict_omen_lengths_filters_loaded_grammar(grammar_db):
+    with contextlib.redirect_stdout(io.StringIO()):
+        grammar = load_omen_rules(grammar_db)
+    ip_length = grammar["ngram"] - 1
+    before = {ip_length + n for lengths in grammar["ln"].values() for n in lengths}
+    assert restrict_omen_lengths(grammar, Memorizer(), 6, 8)
+    after = {ip_length + n for lengths in grammar["ln"].values() for n in lengths}
+    assert after == {n for n in before if 6 <= n <= 8}
+
+
+def test_restrict_omen_lengths_reports_empty_range(grammar_db):
+    with contextlib.redirect_stdout(io.StringIO()):
+        grammar = load_omen_rules(grammar_db)
+    assert not restrict_omen_lengths(grammar, Memorizer(), 100, 120)
+    assert not any(grammar["ln"].values())
+    assert not any(grammar["omen_keyspace"].values())
@@ -0,0 +1,6 @@
+from pcfg_lib.guess.util.metrics import _escape_label
+
+
+def test_prometheus_label_values_are_escaped():
+    assert _escape_label('C:\\data\\"a".db\nx') == 'C:\\\\data\\\\\\"a\\".db\\nx'
+    assert _escape_label("sqlite3.db") == "sqlite3.db"
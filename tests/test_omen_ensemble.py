@@ -0,0 +1,40 @@
+import pytest
+
+from benchmarks.synthetic import make_grammar_db
+from pcfg_lib.guess.pcfg.ensemble import EnsembleGuesser
+from pcfg_lib.guess.pcfg.pcfg_guesser import Type
+from pcfg_lib.guess.util.priority_queue import PcfgQueue
+
+
+@pytest.fixture(scope="module")
+def grammar_db(tmp_path_factory):
+    return str(make_grammar_db(tmp_path_factory.mktemp("omen") / "grammar.db", size=2000, ngram=2))
+
+
+def _ensemble(db, **config):
+    return EnsembleGuesser(dict(config, grammar_db=db, grammars=[(db, 0.8), ("omen:" + db, 0.2)]))
+
+
+def test_ensemble_with_omen_member_generates_total_candidate_per_node(grammar_db):
+    ensemble = _ensemble(grammar_db, pw_min=4, pw_max=8)
+    queue = PcfgQueue(ensemble)
+    markov_nodes = 0
+    while markov_nodes < 3:
+        node = queue.pop()
+        assert node is not None
+        guesses = list(ensemble.guess(node.structures, node.model))
+        # 생성 예산 / 내보내기 묶음은 total_candidate 를 실제 생성 수로 보고 계산
+        assert len(guesses) == node.total_candidate
+        if node.model == 1:
+            markov_nodes += 1
+            assert all(4 <= len(pw) <= 8 for pw in guesses)
+        for child in ensemble.find_children(node):
+            queue.push(child)
+
+
+def test_omen_member_levels_are_dense_and_probability_ordered(grammar_db):
+    omen = _ensemble(grammar_db).models[1]
+    levels = omen.grammar["M"]
+    probs = [entry[Type.PROB] for entry in levels]
+    assert levels and probs == sorted(probs, reverse=True)
+    assert all(entry[Type.LENGTHS] > 0 for entry in levels)
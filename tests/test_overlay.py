@@ -0,0 +1,25 @@
+import pytest
+
+from pcfg_lib.guess.pcfg.overlay import apply_overlay
+from pcfg_lib.guess.pcfg.pcfg_guesser import Type
+
+
+def _total(groups):
+    return sum(g[Type.PROB] * len(g[Type.TERMINALS]) for g in groups)
+
+
+def test_new_symbol_probabilities_sum_to_one():
+    grammar = {}
+    apply_overlay(grammar, [("A7", "minsuuu", 1.0), ("A7", "jiwoooo", 1.0)])
+    assert grammar["A7"][0][Type.PROB] == pytest.approx(0.5)
+    assert _total(grammar["A7"]) == pytest.approx(1.0)
+
+
+def test_existing_symbol_is_renormalised():
+    grammar = {"A5": [
+        {Type.TERMINALS: ["hello", "world"], Type.PROB: 0.4, Type.LENGTHS: 2},
+        {Type.TERMINALS: ["abcde"], Type.PROB: 0.2, Type.LENGTHS: 1},
+    ]}
+    apply_overlay(grammar, [("A5", "minsu", 1.0)])
+    assert _total(grammar["A5"]) == pytest.approx(1.0)
+    assert "minsu" in grammar["A5"][0][Type.TERMINALS]